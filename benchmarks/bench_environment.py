@@ -0,0 +1,70 @@
+"""Measure Environment tick time against the number of moving agents.
+
+Each tick moves every agent a small random step with update_positions,
+then runs radius and nearest neighbours queries. The tick time grows
+linearly with the number of agents, the query times stay nearly flat.
+
+Run from the repository root with ``python -m benchmarks.bench_environment``.
+"""
+
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from pysma_tool.environment import Environment, Position
+
+
+def bench_ticks(
+    agents: int, ticks: int = 3, queries: int = 1000
+) -> Tuple[float, float, float]:
+    """Get the mean move time per tick in seconds, and the mean radius and
+    nearest query times in microseconds."""
+    random: Random = Random(42)
+    side: float = agents**0.5
+    environment: Environment = Environment(cell_size=2.0)
+    positions: Dict[str, Position] = {
+        str(index): (random.uniform(0, side), random.uniform(0, side))
+        for index in range(agents)
+    }
+    environment.update_positions(positions)
+    agent_ids: List[str] = list(positions)
+    move_time: float = 0.0
+    radius_time: float = 0.0
+    nearest_time: float = 0.0
+    for _ in range(ticks):
+        for agent_id in agent_ids:
+            x, y = positions[agent_id]
+            positions[agent_id] = (
+                x + random.uniform(-0.5, 0.5),
+                y + random.uniform(-0.5, 0.5),
+            )
+        start: float = perf_counter()
+        environment.update_positions(positions)
+        move_time += perf_counter() - start
+        points: List[Position] = [
+            (random.uniform(0, side), random.uniform(0, side))
+            for _ in range(queries)
+        ]
+        start = perf_counter()
+        for x, y in points:
+            environment.get_neighbours(x, y, 2.0)
+        radius_time += perf_counter() - start
+        start = perf_counter()
+        for x, y in points:
+            environment.get_nearest(x, y, 5)
+        nearest_time += perf_counter() - start
+    return (
+        move_time / ticks,
+        radius_time / (ticks * queries) * 1e6,
+        nearest_time / (ticks * queries) * 1e6,
+    )
+
+
+if __name__ == "__main__":
+    print(
+        f"{'agents':>9} {'tick (s)':>9} {'radius (us)':>12} "
+        f"{'nearest (us)':>13}"
+    )
+    for count in (10000, 100000, 1000000):
+        tick, radius, nearest = bench_ticks(count)
+        print(f"{count:>9} {tick:>9.2f} {radius:>12.1f} {nearest:>13.1f}")
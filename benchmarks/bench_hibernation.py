@@ -0,0 +1,63 @@
+"""Measure the memory of blocked agents with and without hibernation.
+
+Run from the repository root with ``python -m benchmarks.bench_hibernation``.
+"""
+
+import tracemalloc
+from tempfile import TemporaryDirectory
+from time import sleep
+from typing import Optional
+
+from pysma_tool.agent import Agent
+from pysma_tool.agent_storage import AgentStorage
+from pysma_tool.behaviours.waker_behaviour import WakerBehaviour
+from pysma_tool.platform import Platform
+
+
+class BenchAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class BenchBehaviour(WakerBehaviour):
+    def __init__(self) -> None:
+        super().__init__(timeout=3600000)
+        self.data_store["history"] = [float(index) for index in range(200)]
+
+    def on_wake(self) -> None:
+        pass
+
+
+def bench_memory(
+    agents: int, hibernate_after: int, directory: Optional[str] = None
+) -> float:
+    """Get the traced memory per blocked agent in bytes."""
+    tracemalloc.start()
+    platform: Platform = Platform(
+        hibernate_after=hibernate_after,
+        storage=AgentStorage(directory, is_compressed=True),
+    )
+    platform.start()
+    for index in range(agents):
+        agent: BenchAgent = BenchAgent(f"agent{index}")
+        agent.add_behaviour(BenchBehaviour())
+        platform.add_agent(agent)
+    while len(platform.storage) < agents and hibernate_after:
+        sleep(0.01)
+    sleep(0.1)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    platform.stop()
+    return size / agents
+
+
+if __name__ == "__main__":
+    count: int = 2000
+    print(f"{'mode':>22} {'bytes/agent':>12}")
+    print(f"{'no hibernation':>22} {bench_memory(count, 0):>12.0f}")
+    print(f"{'in memory storage':>22} {bench_memory(count, 10):>12.0f}")
+    with TemporaryDirectory() as directory:
+        print(
+            f"{'directory storage':>22} "
+            f"{bench_memory(count, 10, directory):>12.0f}"
+        )
@@ -0,0 +1,155 @@
+"""Stress a slow consumer agent with each mailbox overflow policy.
+
+A producer sends messages faster than the consumer handles them. The peak
+traced memory grows with the number of messages when the mailbox is
+unbounded, and stays flat with a capacity.
+
+The last scenario sends from a behaviour of a producer agent looping on
+send: with the BLOCK policy the behaviour is parked as soon as the mailbox
+is full, so the largest mailbox size stays at capacity plus one.
+
+Run from the repository root with ``python -m benchmarks.bench_mailbox``.
+"""
+
+import tracemalloc
+from time import perf_counter, sleep
+from typing import Optional, Tuple
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.exceptions.exceptions import MessageException
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.overflow_policy import OverflowPolicy
+from pysma_tool.platform import Platform
+
+
+class BenchAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class ConsumerBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        message: Optional[Message] = self.receive()
+        while message is not None:
+            sleep(0.0001)
+            if message.is_control:
+                self.agent.do_delete()
+                return
+            message = self.receive()
+        self.wait_message()
+
+
+class ProducerBehaviour(CyclicBehaviour):
+    def __init__(self, count: int) -> None:
+        super().__init__()
+        self._count: int = count
+        self._sent: int = 0
+
+    def action(self) -> None:
+        while self._sent < self._count:
+            try:
+                self.agent.send(
+                    Message("load", bytes(1024), receivers=["consumer"])
+                )
+            except MessageException:
+                return
+            self._sent += 1
+        self.agent.send(
+            Message("stop", receivers=["consumer"], is_control=True)
+        )
+        self.agent.do_delete()
+
+
+def bench_policy(
+    messages: int, capacity: int, policy: OverflowPolicy
+) -> Tuple[float, float, int, int]:
+    """Get the duration in seconds, the peak memory in MB, the largest
+    mailbox size and the number of lost messages."""
+    tracemalloc.start()
+    platform: Platform = Platform(workers=1)
+    consumer: BenchAgent = BenchAgent("consumer", capacity, policy)
+    consumer.add_behaviour(ConsumerBehaviour())
+    platform.add_agent(consumer)
+    platform.start()
+    start: float = perf_counter()
+    for index in range(messages):
+        try:
+            platform.message_bus.send(
+                Message("load", bytes(1024), receivers=["consumer"])
+            )
+        except MessageException:
+            pass
+        if index == 0:
+            tracemalloc.reset_peak()
+    platform.message_bus.send(
+        Message("stop", receivers=["consumer"], is_control=True)
+    )
+    platform.wait()
+    elapsed: float = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    platform.stop()
+    return (
+        elapsed,
+        peak / 1e6,
+        consumer.max_mailbox_size,
+        consumer.dropped_count + consumer.rejected_count,
+    )
+
+
+def bench_behaviour_producer(
+    messages: int, capacity: int
+) -> Tuple[float, int, int]:
+    """Get the duration in seconds, the largest mailbox size and the
+    number of rejected sends of a behaviour producing into a BLOCK
+    mailbox."""
+    platform: Platform = Platform(workers=2)
+    consumer: BenchAgent = BenchAgent(
+        "consumer", capacity, OverflowPolicy.BLOCK
+    )
+    consumer.add_behaviour(ConsumerBehaviour())
+    producer: BenchAgent = BenchAgent("producer")
+    producer.add_behaviour(ProducerBehaviour(messages))
+    platform.add_agent(consumer)
+    platform.add_agent(producer)
+    start: float = perf_counter()
+    platform.start()
+    platform.wait()
+    elapsed: float = perf_counter() - start
+    platform.stop()
+    return elapsed, consumer.max_mailbox_size, consumer.rejected_count
+
+
+if __name__ == "__main__":
+    print(
+        f"{'policy':>12} {'messages':>9} {'time (s)':>9} {'peak (MB)':>10} "
+        f"{'max size':>9} {'lost':>7}"
+    )
+    for count in (5000, 20000):
+        for capacity, policy in (
+            (0, OverflowPolicy.BLOCK),
+            (1000, OverflowPolicy.BLOCK),
+            (1000, OverflowPolicy.DROP_OLDEST),
+            (1000, OverflowPolicy.DROP_NEWEST),
+            (1000, OverflowPolicy.REJECT),
+        ):
+            duration, memory, size, lost = bench_policy(
+                count, capacity, policy
+            )
+            name: str = policy.name if capacity else "UNBOUNDED"
+            print(
+                f"{name:>12} {count:>9} {duration:>9.2f} {memory:>10.1f} "
+                f"{size:>9} {lost:>7}"
+            )
+    print()
+    print(
+        f"{'producer':>12} {'messages':>9} {'time (s)':>9} {'max size':>9} "
+        f"{'rejected':>9}"
+    )
+    for count in (5000, 20000):
+        duration, size, rejected = bench_behaviour_producer(count, 1000)
+        print(
+            f"{'BEHAVIOUR':>12} {count:>9} {duration:>9.2f} {size:>9} "
+            f"{rejected:>9}"
+        )
@@ -0,0 +1,49 @@
+"""Measure MessageBus publish latency against the number of subscribers.
+
+Run from the repository root with
+``python -m benchmarks.bench_message_bus``.
+"""
+
+from time import perf_counter
+from typing import List
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.messages.message_bus import MessageBus
+
+
+class BenchAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class BenchBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        self.block()
+
+
+def bench_publish(subscribers: int, messages: int = 100) -> float:
+    """Get the mean publish latency in microseconds."""
+    message_bus: MessageBus = MessageBus()
+    agents: List[BenchAgent] = []
+    for index in range(subscribers):
+        agent: BenchAgent = BenchAgent(f"agent{index}")
+        behaviour: BenchBehaviour = BenchBehaviour()
+        agent.add_behaviour(behaviour)
+        message_bus.subscribe(
+            behaviour, "bench.news" if index % 2 else "bench.*"
+        )
+        agents.append(agent)
+    payload: bytes = bytes(1024)
+    start: float = perf_counter()
+    for _ in range(messages):
+        message_bus.publish("bench.news", payload)
+    elapsed: float = perf_counter() - start
+    return elapsed / messages * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{'subscribers':>12} {'publish (us)':>14} {'per sub (us)':>14}")
+    for count in (1, 10, 100, 1000, 10000):
+        latency: float = bench_publish(count)
+        print(f"{count:>12} {latency:>14.1f} {latency / count:>14.3f}")
@@ -0,0 +1,69 @@
+"""Compare SequentialBehaviour with CompositeBehaviour for short sequences.
+
+Run from the repository root with
+``python -m benchmarks.bench_sequential_behaviour``.
+"""
+
+import tracemalloc
+from time import perf_counter
+from typing import List, Type
+
+from pysma_tool.behaviours.composite_behaviour import CompositeBehaviour
+from pysma_tool.behaviours.one_shot_behaviour import OneShotBehaviour
+from pysma_tool.behaviours.sequential_behaviour import SequentialBehaviour
+
+
+class BenchBehaviour(OneShotBehaviour):
+    def action(self) -> None:
+        pass
+
+
+def create_sequences(
+    composite_class: Type[CompositeBehaviour], count: int, length: int
+) -> List[CompositeBehaviour]:
+    """Create sequences of one shot behaviours."""
+    sequences: List[CompositeBehaviour] = []
+    for _ in range(count):
+        sequence: CompositeBehaviour = composite_class()
+        for index in range(length):
+            sequence.add_sub_behaviour(BenchBehaviour(), f"step{index}")
+        sequences.append(sequence)
+    return sequences
+
+
+def bench_memory(
+    composite_class: Type[CompositeBehaviour], count: int, length: int
+) -> float:
+    """Get the memory of one sequence in bytes."""
+    tracemalloc.start()
+    sequences = create_sequences(composite_class, count, length)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sequences
+    return size / count
+
+
+def bench_steps(
+    composite_class: Type[CompositeBehaviour], count: int, length: int
+) -> float:
+    """Get the number of sub behaviour steps per second."""
+    sequences = create_sequences(composite_class, count, length)
+    start: float = perf_counter()
+    for sequence in sequences:
+        while sequence.run() is None:
+            pass
+    elapsed: float = perf_counter() - start
+    return count * length / elapsed
+
+
+if __name__ == "__main__":
+    count: int = 10000
+    print(f"{'class':>20} {'length':>7} {'bytes/seq':>10} {'steps/s':>12}")
+    for length in (2, 5, 20):
+        for composite_class in (CompositeBehaviour, SequentialBehaviour):
+            memory: float = bench_memory(composite_class, count, length)
+            steps: float = bench_steps(composite_class, count, length)
+            print(
+                f"{composite_class.__name__:>20} {length:>7} {memory:>10.0f} "
+                f"{steps:>12.0f}"
+            )
@@ -0,0 +1,66 @@
+"""Measure SocketTransport throughput and latency over loopback.
+
+Run from the repository root with
+``python -m benchmarks.bench_transport``.
+"""
+
+from time import perf_counter, sleep
+from typing import List
+
+from pysma_tool.agent import Agent
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.message_bus import MessageBus
+from pysma_tool.transport import SocketTransport
+
+
+class SinkAgent(Agent):
+    """Agent recording the latency of each message, never run."""
+
+    def __init__(self, agent_id: str) -> None:
+        super().__init__(agent_id)
+        self.latencies: List[float] = []
+
+    def setup(self) -> None:
+        pass
+
+    def post_message(self, message: Message) -> bool:
+        self.latencies.append(perf_counter() - message.content)
+        return True
+
+
+def bench_transport(messages: int, flush_interval: float) -> None:
+    """Print throughput and latency percentiles of one run."""
+    sender_bus: MessageBus = MessageBus()
+    receiver_bus: MessageBus = MessageBus()
+    sink: SinkAgent = SinkAgent("sink")
+    sink.message_bus = receiver_bus
+    receiver: SocketTransport = SocketTransport(receiver_bus)
+    receiver.start()
+    sender: SocketTransport = SocketTransport(
+        sender_bus, flush_interval=flush_interval
+    )
+    sender.add_route("sink", receiver.address)
+    start: float = perf_counter()
+    for _ in range(messages):
+        sender_bus.send(Message("bench", perf_counter(), receivers=["sink"]))
+    while len(sink.latencies) < messages:
+        sleep(0.0001)
+    elapsed: float = perf_counter() - start
+    sender.stop()
+    receiver.stop()
+    latencies: List[float] = sorted(sink.latencies)
+    p50: float = latencies[len(latencies) // 2] * 1000
+    p99: float = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"{flush_interval:>10.1f} {messages / elapsed:>14.0f} "
+        f"{p50:>10.3f} {p99:>10.3f}"
+    )
+
+
+if __name__ == "__main__":
+    print(
+        f"{'flush (ms)':>10} {'messages/s':>14} {'p50 (ms)':>10} "
+        f"{'p99 (ms)':>10}"
+    )
+    for interval in (0.1, 1.0, 5.0):
+        bench_transport(100000, interval)
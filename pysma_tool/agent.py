@@ -1,20 +1,347 @@
 """Agent module"""
 
-from typing import List
-from threading import Thread
+from collections import deque
+from datetime import datetime
+from io import BytesIO
+from pickle import HIGHEST_PROTOCOL, Pickler, Unpickler
+from typing import Any, Deque, Dict, List, Optional, TYPE_CHECKING
+from threading import Condition, Event, Lock, Thread, local
 from abc import ABC, abstractmethod
 
 from .behaviours.behaviour import Behaviour
+from .behaviours.behaviour_event import BehaviourEvent
+from .behaviours.behaviour_status import BehaviourStatus
+from .behaviours.data_store import DataStore
+from .environment import Environment
+from .exceptions.exceptions import BehaviourException, MessageException
+from .messages.message import Message
+from .messages.overflow_policy import OverflowPolicy
+from .messages.performative import Performative
 
+if TYPE_CHECKING:
+    from .agent_storage import AgentStorage
+    from .messages.message_bus import MessageBus
+    from .platform import Platform
 
-class Agent(ABC, Thread):
-    def __init__(self, agent_id: str) -> None:
+_THREAD_ATTRIBUTES = frozenset(vars(Thread(target=None)))
+_LOCAL_ATTRIBUTES = frozenset(
+    (
+        "_mailbox_lock",
+        "_mailbox_not_full",
+        "_not_full_event",
+        "_mailbox_closed",
+        "_wake_event",
+        "_message_bus",
+        "_platform",
+        "_environment",
+        "_storage",
+    )
+)
+_SHELL_ATTRIBUTES = frozenset(
+    (
+        "_agent_id",
+        "_agent_delete",
+        "_mailbox",
+        "_control_mailbox",
+        "_mailbox_capacity",
+        "_overflow_policy",
+        "_message_count",
+        "_dropped_count",
+        "_rejected_count",
+        "_max_mailbox_size",
+        "_hibernation_mark",
+        "_discarded_conversations",
+    )
+)
+MAX_DISCARDED_CONVERSATIONS: int = 64
+
+_NO_MESSAGES: Deque[Message] = deque()
+_NOT_STARTED: Event = Event()
+_RUNNING: local = local()
+
+
+class _RoomEvent(BehaviourEvent):
+    """Event notified when a full mailbox has room.
+
+    The behaviours blocked on it belong to other agents, so the senders
+    can't be serialized until they are restarted.
+    """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        raise MessageException(
+            "An agent waiting for room in a mailbox can't be serialized."
+        )
+
+
+class _StatePickler(Pickler):
+    """Pickler of the state of a hibernating agent, keeping the references
+    to the agent itself instead of copying it.
+
+    Events are only copied with the data store owning them. Other events
+    are fired by code outside the agent, which would never reach the copy:
+    an agent referencing them can't hibernate.
+    """
+
+    def __init__(self, file: BytesIO, agent: "Agent") -> None:
+        super().__init__(file, HIGHEST_PROTOCOL)
+        self._agent: "Agent" = agent
+        self._events: List[BehaviourEvent] = []
+        self._data_stores: List[DataStore] = []
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is self._agent:
+            return "agent"
+        if isinstance(obj, BehaviourEvent):
+            self._events.append(obj)
+        elif isinstance(obj, DataStore):
+            self._data_stores.append(obj)
+        return None
+
+    def dump(self, obj: Any) -> None:
+        """Pickle the state of the agent.
+
+        Args:
+            obj (Any): The state.
+
+        Raises:
+            BehaviourException: If the state references an event which is
+                not owned by one of its data stores.
+        """
+        super().dump(obj)
+        for event in self._events:
+            if not any(
+                data_store.has_event(event) for data_store in self._data_stores
+            ):
+                raise BehaviourException(
+                    "An agent waiting for an event it doesn't own can't "
+                    "hibernate."
+                )
+
+
+class _StateUnpickler(Unpickler):
+    """Unpickler of the state of a hibernated agent."""
+
+    def __init__(self, file: BytesIO, agent: "Agent") -> None:
+        super().__init__(file)
+        self._agent: "Agent" = agent
+
+    def persistent_load(self, pid: Any) -> "Agent":
+        return self._agent
+
+
+class Agent(ABC, Thread):  # pylint: disable=too-many-public-methods
+    def __init__(
+        self,
+        agent_id: str,
+        mailbox_capacity: int = 0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
         super().__init__()
         self._behaviours: List[Behaviour] = []
         self._agent_id: str = agent_id
         self._agent_delete: bool = False
+        self._environment: Optional[Environment] = None
+        self._mailbox: Deque[Message] = deque()
+        self._control_mailbox: Optional[Deque[Message]] = None
+        self._mailbox_capacity: int = mailbox_capacity
+        self._overflow_policy: OverflowPolicy = overflow_policy
+        self._mailbox_lock: Lock = Lock()
+        self._mailbox_not_full: Optional[Condition] = None
+        self._not_full_event: Optional[_RoomEvent] = None
+        self._mailbox_closed: bool = False
+        self._message_count: int = 0
+        self._dropped_count: int = 0
+        self._rejected_count: int = 0
+        self._max_mailbox_size: int = 0
+        self._message_waiters: List[Behaviour] = []
+        self._message_bus: Optional["MessageBus"] = None
+        self._wake_event: Optional[Event] = None
+        self._platform: Optional["Platform"] = None
+        self._storage: Optional["AgentStorage"] = None
+        self._hibernation_mark: Optional[int] = None
+        self._discarded_conversations: Optional[Dict[str, None]] = None
         # self._data_store: Dict[str, Any] = {}
 
+    @property
+    def agent_id(self) -> str:
+        """The identifier of the agent."""
+        return self._agent_id
+
+    @property
+    def environment(self) -> Optional[Environment]:
+        """Environment where the agent is situated."""
+        return self._environment
+
+    @environment.setter
+    def environment(self, environment: Optional[Environment]) -> None:
+        self._environment = environment
+
+    @property
+    def message_bus(self) -> Optional["MessageBus"]:
+        """Message bus used to send messages, the agent is registered in."""
+        return self._message_bus
+
+    @message_bus.setter
+    def message_bus(self, message_bus: Optional["MessageBus"]) -> None:
+        if self._message_bus is not None:
+            self._message_bus.deregister(self._agent_id)
+        self._message_bus = message_bus
+        if message_bus is not None:
+            message_bus.register(self)
+
+    @property
+    def platform(self) -> Optional["Platform"]:
+        """Platform running the agent, None if it runs in its own thread."""
+        return self._platform
+
+    @platform.setter
+    def platform(self, platform: Optional["Platform"]) -> None:
+        self._platform = platform
+
+    @property
+    def is_deleted(self) -> bool:
+        """True if the agent has been deleted."""
+        return self._agent_delete
+
+    @property
+    def message_count(self) -> int:
+        """Number of messages received since the agent creation."""
+        return self._message_count
+
+    @property
+    def mailbox_capacity(self) -> int:
+        """Maximum number of messages in the mailbox, without the control
+        messages. 0 for no limit."""
+        return self._mailbox_capacity
+
+    @mailbox_capacity.setter
+    def mailbox_capacity(self, mailbox_capacity: int) -> None:
+        with self._mailbox_lock:
+            self._mailbox_capacity = mailbox_capacity
+            self._notify_not_full(True)
+        self._restart_senders()
+
+    @property
+    def overflow_policy(self) -> OverflowPolicy:
+        """What the full mailbox does with a new message."""
+        return self._overflow_policy
+
+    @overflow_policy.setter
+    def overflow_policy(self, overflow_policy: OverflowPolicy) -> None:
+        with self._mailbox_lock:
+            self._overflow_policy = overflow_policy
+            self._notify_not_full(True)
+        self._restart_senders()
+
+    @property
+    def mailbox_size(self) -> int:
+        """Number of messages in the mailbox."""
+        return len(self._mailbox) + len(self._control_mailbox or ())
+
+    @property
+    def max_mailbox_size(self) -> int:
+        """Largest number of messages the mailbox has held."""
+        return self._max_mailbox_size
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of messages dropped by the full mailbox."""
+        return self._dropped_count
+
+    @property
+    def rejected_count(self) -> int:
+        """Number of messages rejected by the full mailbox."""
+        return self._rejected_count
+
+    @property
+    def is_hibernated(self) -> bool:
+        """True if the state of the agent is in a storage."""
+        return self._hibernation_mark is not None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state to serialize: behaviours, mailbox and attributes of
+        subclasses, without the thread and the local resources (message bus,
+        platform, environment).
+
+        Returns:
+            Dict[str, Any]: The state of the agent.
+        """
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _THREAD_ATTRIBUTES and name not in _LOCAL_ATTRIBUTES
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a serialized agent, with new local resources.
+
+        Args:
+            state (Dict[str, Any]): The state of the agent.
+        """
+        Agent.__init__(self, state["_agent_id"])
+        self.__dict__.update(state)
+
+    def hibernate(self, storage: "AgentStorage") -> None:
+        """Move the behaviours and the attributes of subclasses to a storage.
+
+        Only the identifier and the mailbox stay in memory, so the agent
+        still receives messages. The agent must be rehydrated before it
+        runs again (see rehydrate method).
+
+        If the state can't be serialized or saved, e.g. because a
+        behaviour references an event which is not owned by a data store of
+        the agent, the agent is left unchanged.
+
+        Args:
+            storage (AgentStorage): The storage of the state.
+        """
+        with self._mailbox_lock:
+            state: Dict[str, Any] = {
+                name: value
+                for name, value in self.__getstate__().items()
+                if name not in _SHELL_ATTRIBUTES
+            }
+            message_count: int = self._message_count
+        file: BytesIO = BytesIO()
+        _StatePickler(file, self).dump(state)
+        storage.save(self._agent_id, file.getvalue())
+        with self._mailbox_lock:
+            self._message_waiters = []
+            self._hibernation_mark = message_count
+            shell: Dict[str, Any] = {
+                name: value
+                for name, value in vars(self).items()
+                if name not in state or name == "_message_waiters"
+            }
+            if not self._started.is_set():
+                shell["_started"] = _NOT_STARTED
+            self.__dict__ = shell
+        self._storage = storage
+
+    def rehydrate(self) -> None:
+        """Restore the state of a hibernated agent from its storage.
+
+        The behaviours waiting for a message are restarted if messages
+        arrived during hibernation.
+        """
+        if self._storage is None or self._hibernation_mark is None:
+            return
+        state: Dict[str, Any] = _StateUnpickler(
+            BytesIO(self._storage.load(self._agent_id)), self
+        ).load()
+        self._storage = None
+        waiters: List[Behaviour] = []
+        with self._mailbox_lock:
+            self.__dict__.update(state)
+            if self._started is _NOT_STARTED:
+                self._started = Event()
+            if self._hibernation_mark != self._message_count:
+                waiters = self._message_waiters
+                self._message_waiters = []
+            self._hibernation_mark = None
+        for behaviour in waiters:
+            behaviour.restart()
+
     @abstractmethod
     def setup(self) -> None:
         raise NotImplementedError
@@ -22,24 +349,359 @@ class Agent(ABC, Thread):
     def add_behaviour(self, behaviour: Behaviour) -> None:
         behaviour.agent = self
         self._behaviours.append(behaviour)
+        self.wake()
+
+    def send(self, message: Message) -> int:
+        """Send a direct message through the message bus.
+
+        Args:
+            message (Message): The message to send.
+
+        Raises:
+            MessageException: If the agent has no message bus.
+
+        Returns:
+            int: The number of agents which received the message.
+        """
+        if self._message_bus is None:
+            raise MessageException(
+                f"Agent {self._agent_id} has no message bus."
+            )
+        return self._message_bus.send(message)
+
+    def post_message(self, message: Message, is_forced: bool = False) -> bool:
+        """Put a message in the mailbox and restart the waiting behaviours.
+
+        When the mailbox holds mailbox_capacity messages, the overflow policy
+        blocks the sender until a message is received, drops the oldest or
+        the new message, or rejects the new message. Control messages skip
+        the queue and are never dropped.
+
+        A sender running a behaviour, e.g. on a platform worker, is not
+        blocked: the message is accepted and the behaviour is blocked until
+        the mailbox has room, so the thread goes on running other agents.
+        Until then, the further messages of the behaviour to a full mailbox
+        are rejected, so it should stop sending and resume once restarted.
+
+        Args:
+            message (Message): The received message.
+            is_forced (bool, optional): True to ignore the capacity, for
+                messages already accepted (e.g. held during a migration).
+                Defaults to False.
+
+        Raises:
+            MessageException: If the mailbox is full and the policy is
+                REJECT, or if the policy is BLOCK and the sending behaviour
+                already waits for room.
+
+        Returns:
+            bool: False if the mailbox is closed because the agent migrates.
+        """
+        with self._mailbox_lock:
+            if self._mailbox_closed:
+                return False
+            if (
+                self._discarded_conversations is not None
+                and message.conversation_id in self._discarded_conversations
+            ):
+                return True
+            if message.is_control:
+                if self._control_mailbox is None:
+                    self._control_mailbox = deque()
+                self._control_mailbox.append(message)
+            elif is_forced or not self._is_mailbox_full():
+                self._mailbox.append(message)
+            elif self._overflow_policy == OverflowPolicy.BLOCK:
+                if not self._wait_for_room():
+                    return False
+                self._mailbox.append(message)
+            elif self._overflow_policy == OverflowPolicy.DROP_OLDEST:
+                self._mailbox.popleft()
+                self._mailbox.append(message)
+                self._dropped_count += 1
+            elif self._overflow_policy == OverflowPolicy.DROP_NEWEST:
+                self._dropped_count += 1
+                return True
+            else:
+                self._rejected_count += 1
+                raise MessageException(
+                    f"The mailbox of agent {self._agent_id} is full."
+                )
+            self._max_mailbox_size = max(
+                self._max_mailbox_size, self.mailbox_size
+            )
+            self._message_count += 1
+            waiters: List[Behaviour] = self._message_waiters
+            self._message_waiters = []
+        for behaviour in waiters:
+            behaviour.restart()
+        self.wake()
+        return True
+
+    def _wait_for_room(self) -> bool:
+        """Block the sender until the mailbox has room. Lock must be held.
+
+        A sender running a behaviour doesn't wait: its behaviour is blocked
+        until the mailbox has room instead of its thread.
+
+        Raises:
+            MessageException: If the sending behaviour already waits for
+                room in a mailbox.
+
+        Returns:
+            bool: False if the mailbox was closed meanwhile.
+        """
+        sender: Optional[Behaviour] = getattr(_RUNNING, "behaviour", None)
+        if sender is not None:
+            if sender.status == BehaviourStatus.BLOCKED and isinstance(
+                sender.blocking_event, _RoomEvent
+            ):
+                self._rejected_count += 1
+                raise MessageException(
+                    f"The mailbox of agent {self._agent_id} is full and the "
+                    "sender already waits for room."
+                )
+            if self._not_full_event is None:
+                self._not_full_event = _RoomEvent()
+            sender.block_until(self._not_full_event)
+            return True
+        if self._mailbox_not_full is None:
+            self._mailbox_not_full = Condition(self._mailbox_lock)
+        self._mailbox_not_full.wait_for(
+            lambda: self._mailbox_closed
+            or not self._is_mailbox_full()
+            or self._overflow_policy != OverflowPolicy.BLOCK
+        )
+        return not self._mailbox_closed
+
+    def close_mailbox(self) -> None:
+        """Refuse new messages, before the agent is serialized to migrate."""
+        with self._mailbox_lock:
+            self._mailbox_closed = True
+            self._notify_not_full(True)
+        self._restart_senders()
+
+    def open_mailbox(self) -> None:
+        """Accept messages again, after a failed migration."""
+        with self._mailbox_lock:
+            self._mailbox_closed = False
+
+    def _notify_not_full(self, is_all: bool = False) -> None:
+        """Wake up the senders blocked by the full mailbox, if any. Lock must
+        be held.
+
+        Args:
+            is_all (bool, optional): True to wake up every sender, else only
+                one. Defaults to False.
+        """
+        if self._mailbox_not_full is None:
+            return
+        if is_all:
+            self._mailbox_not_full.notify_all()
+        else:
+            self._mailbox_not_full.notify()
+
+    def _restart_senders(self) -> None:
+        """Restart the behaviours blocked until the mailbox has room."""
+        not_full_event: Optional[_RoomEvent] = self._not_full_event
+        if not_full_event is not None:
+            not_full_event.notify()
+
+    def _is_mailbox_full(self) -> bool:
+        """Check if the mailbox reached its capacity. Lock must be held.
+
+        Returns:
+            bool: True if a new message overflows the mailbox.
+        """
+        return 0 < self._mailbox_capacity <= len(self._mailbox)
+
+    def add_message_waiter(
+        self, behaviour: Behaviour, message_mark: Optional[int] = None
+    ) -> None:
+        """Restart a behaviour on the next message arrival.
+
+        Args:
+            behaviour (Behaviour): The blocked behaviour.
+            message_mark (Optional[int], optional): The message count seen by
+                the behaviour when it last checked the mailbox. If messages
+                arrived since, the behaviour is restarted at once. Defaults
+                to None.
+        """
+        with self._mailbox_lock:
+            if message_mark is None or message_mark == self._message_count:
+                self._message_waiters.append(behaviour)
+                return
+        behaviour.restart()
+
+    def receive(
+        self,
+        topic: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        performative: Optional[Performative] = None,
+    ) -> Optional[Message]:
+        """Get the first matching message of the mailbox, control messages
+        first.
+
+        Args:
+            topic (Optional[str], optional): Only get a message of this
+                topic. Defaults to None.
+            conversation_id (Optional[str], optional): Only get a message of
+                this conversation. Defaults to None.
+            performative (Optional[Performative], optional): Only get a
+                message with this performative. Defaults to None.
+
+        Returns:
+            Optional[Message]: The message or None if mailbox has no
+                matching message.
+        """
+        message: Optional[Message] = None
+        has_room: bool = False
+        with self._mailbox_lock:
+            for mailbox in (
+                self._control_mailbox or _NO_MESSAGES,
+                self._mailbox,
+            ):
+                if (
+                    topic is None
+                    and conversation_id is None
+                    and performative is None
+                ):
+                    message = mailbox.popleft() if mailbox else None
+                else:
+                    for index, candidate in enumerate(mailbox):
+                        if candidate.match(
+                            topic, conversation_id, performative
+                        ):
+                            message = candidate
+                            del mailbox[index]
+                            break
+                if message is not None:
+                    if mailbox is self._mailbox and self._mailbox_capacity:
+                        self._notify_not_full()
+                        has_room = len(self._mailbox) < self._mailbox_capacity
+                    break
+        if has_room:
+            self._restart_senders()
+        return message
+
+    def discard_conversation(self, conversation_id: str) -> None:
+        """Drop the messages of a finished conversation, those in the mailbox
+        and those arriving later, e.g. late replies to a call for proposals.
+
+        Only the MAX_DISCARDED_CONVERSATIONS latest conversations are
+        filtered.
+
+        Args:
+            conversation_id (str): The identifier of the conversation.
+        """
+        with self._mailbox_lock:
+            if self._discarded_conversations is None:
+                self._discarded_conversations = {}
+            self._discarded_conversations[conversation_id] = None
+            if (
+                len(self._discarded_conversations)
+                > MAX_DISCARDED_CONVERSATIONS
+            ):
+                del self._discarded_conversations[
+                    next(iter(self._discarded_conversations))
+                ]
+            size: int = len(self._mailbox)
+            self._mailbox = deque(
+                message
+                for message in self._mailbox
+                if message.conversation_id != conversation_id
+            )
+            has_room: bool = (
+                bool(self._mailbox_capacity) and len(self._mailbox) < size
+            )
+            if has_room:
+                self._notify_not_full(True)
+        if has_room:
+            self._restart_senders()
+
+    def wake(self) -> None:
+        """Wake the agent up if it is waiting for its blocked behaviours."""
+        wake_event: Optional[Event] = self._wake_event
+        if wake_event is not None:
+            wake_event.set()
+        if self._platform is not None:
+            self._platform.schedule(self)
 
     def do_delete(self) -> None:
-        self._agent_delete = True
+        with self._mailbox_lock:
+            self._agent_delete = True
+        self.wake()
 
     def take_down(self) -> None:
         pass
 
+    def get_wake_up_date(self) -> Optional[datetime]:
+        """Get the date the agent must run again if all behaviours are blocked.
+
+        Returns:
+            Optional[datetime]: The earliest restart date of the blocked
+                behaviours, None if they only wait for an event.
+        """
+        dates: List[datetime] = [
+            behaviour.date_to_restart
+            for behaviour in self._behaviours
+            if behaviour.date_to_restart is not None
+        ]
+        return min(dates) if dates else None
+
+    def is_idle(self) -> bool:
+        """Check if all the behaviours of the agent are blocked.
+
+        Returns:
+            bool: True if no behaviour is runnable.
+        """
+        return all(
+            behaviour.status == BehaviourStatus.BLOCKED
+            for behaviour in self._behaviours
+        )
+
+    def step(self) -> None:
+        """Run each behaviour once and remove the finished ones."""
+        # on_end_result: Optional[int] = behaviour.run()
+        running: Optional[Behaviour] = getattr(_RUNNING, "behaviour", None)
+        behaviours_to_remove: List[Behaviour] = []
+        try:
+            for behaviour in self._behaviours:
+                _RUNNING.behaviour = behaviour
+                if behaviour.run() is not None:
+                    behaviours_to_remove.append(behaviour)
+        finally:
+            _RUNNING.behaviour = running
+        for behaviour in behaviours_to_remove:
+            self._behaviours.remove(behaviour)
+            if self._message_bus is not None:
+                self._message_bus.unsubscribe_all(behaviour)
+        if not self._behaviours:
+            self.do_delete()
+
+    def _wait(self) -> None:
+        """Sleep while all behaviours are blocked.
+
+        The agent sleeps until the earliest restart date, or until a
+        behaviour is restarted (e.g. by a message arrival).
+        """
+        if not self.is_idle():
+            return
+        wake_up_date: Optional[datetime] = self.get_wake_up_date()
+        timeout: Optional[float] = None
+        if wake_up_date is not None:
+            timeout = max(0.0, (wake_up_date - datetime.now()).total_seconds())
+        if self._wake_event is not None:
+            self._wake_event.wait(timeout)
+
     def run(self) -> None:
+        self._wake_event = Event()
         self.setup()
         while not self._agent_delete:
-            # on_end_result: Optional[int] = behaviour.run()
-            behaviours_to_remove: List[Behaviour] = [
-                behaviour
-                for behaviour in self._behaviours
-                if behaviour.run() is not None
-            ]
-            for behaviour in behaviours_to_remove:
-                self._behaviours.remove(behaviour)
-            if not self._behaviours:
-                self.do_delete()
+            self._wake_event.clear()
+            self.step()
+            if not self._agent_delete:
+                self._wait()
         self.take_down()
+        if self._message_bus is not None:
+            self._message_bus.unsubscribe_agent(self)
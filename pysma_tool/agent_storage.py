@@ -0,0 +1,125 @@
+"""Agent storage module"""
+
+from os import makedirs, path, remove
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import quote
+from zlib import compress, decompress
+
+from .exceptions.exceptions import PlatformException
+
+
+class AgentStorage:
+    """Define AgentStorage class, keeping the state of hibernated agents.
+
+    States are kept in memory as bytes, optionally compressed, or written
+    to files in a local directory so that they leave the process memory.
+
+    Attributes:
+        directory (Optional[str]): The directory of the state files. By
+            default is None, the states are kept in memory.
+        is_compressed (bool): True if the states are compressed. By default
+            is False.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, is_compressed: bool = False
+    ) -> None:
+        """Instantiate AgentStorage class.
+
+        Args:
+            directory (Optional[str], optional): The directory of the state
+                files, created if needed. Defaults to None, the states are
+                kept in memory.
+            is_compressed (bool, optional): True to compress the states.
+                Defaults to False.
+        """
+        self._directory: Optional[str] = directory
+        self._is_compressed: bool = is_compressed
+        self._states: Dict[str, bytes] = {}
+        self._lock: Lock = Lock()
+        self._count: int = 0
+        if directory is not None:
+            makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> Optional[str]:
+        """The directory of the state files."""
+        return self._directory
+
+    @property
+    def is_compressed(self) -> bool:
+        """True if the states are compressed."""
+        return self._is_compressed
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, agent_id: object) -> bool:
+        if self._directory is None:
+            return agent_id in self._states
+        return isinstance(agent_id, str) and path.exists(
+            self._get_path(agent_id)
+        )
+
+    def _get_path(self, agent_id: str) -> str:
+        """Get the state file of an agent.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+
+        Returns:
+            str: The path of the file.
+        """
+        return path.join(
+            self._directory or "", f"{quote(agent_id, safe='')}.pickle"
+        )
+
+    def save(self, agent_id: str, state: bytes) -> None:
+        """Store the state of an agent.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            state (bytes): The serialized state.
+        """
+        if self._is_compressed:
+            state = compress(state, 1)
+        if self._directory is not None:
+            with open(self._get_path(agent_id), "wb") as file:
+                file.write(state)
+        else:
+            with self._lock:
+                self._states[agent_id] = state
+        with self._lock:
+            self._count += 1
+
+    def load(self, agent_id: str) -> bytes:
+        """Take the state of an agent out of the storage.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+
+        Raises:
+            PlatformException: If the storage has no state for the agent.
+
+        Returns:
+            bytes: The serialized state.
+        """
+        state: Optional[bytes]
+        if self._directory is not None:
+            file_path: str = self._get_path(agent_id)
+            try:
+                with open(file_path, "rb") as file:
+                    state = file.read()
+            except FileNotFoundError:
+                state = None
+            else:
+                remove(file_path)
+        else:
+            with self._lock:
+                state = self._states.pop(agent_id, None)
+        if state is None:
+            raise PlatformException(f"Agent {agent_id} is not in the storage.")
+        with self._lock:
+            self._count -= 1
+        return decompress(state) if self._is_compressed else state
@@ -4,10 +4,15 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, Optional, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
+from .behaviour_event import BehaviourEvent
 from .behaviour_status import BehaviourStatus
+from .data_store import DataStore
+from ..exceptions.exceptions import BehaviourException
 
 if TYPE_CHECKING:
     from ..agent import Agent
+    from ..messages.message import Message
+    from ..messages.performative import Performative
     from .composite_behaviour import CompositeBehaviour
 
 
@@ -16,8 +21,10 @@ class Behaviour(ABC):
 
     Attributes:
         agent (Optional[Agent]): Owner of the behaviour. By default is None.
+        blocking_event (Optional[BehaviourEvent]): The event the behaviour
+            is blocked on. By default is None.
         data_store (Dict[str, Any]): Data store of the behaviour. By default
-            is empty.
+            is an empty DataStore.
         date_to_restart (Optional[datetime]): Date to restart a blocked
             behaviour. By default is None.
         init_state (Dict[str, Any]): Backup of initial state of the behaviour.
@@ -32,12 +39,14 @@ class Behaviour(ABC):
     def __init__(self) -> None:
         """Instantiate Behaviour class."""
         self._agent: Optional["Agent"] = None
-        self._data_store: Dict[str, Any] = {}
+        self._data_store: Dict[str, Any] = DataStore()
+        self._blocking_event: Optional[BehaviourEvent] = None
         self._date_to_restart: Optional[datetime] = None
         self._init_state: Dict[str, Any] = {}
         self._name: str = ""
         self._status: BehaviourStatus = BehaviourStatus.NOT_STARTED
         self._parent: Optional["CompositeBehaviour"] = None
+        self._message_mark: Optional[int] = None
 
     @property
     def agent(self) -> Optional["Agent"]:
@@ -75,6 +84,20 @@ class Behaviour(ABC):
     def name(self, name: str) -> None:
         self._name = name
 
+    @property
+    def date_to_restart(self) -> Optional[datetime]:
+        """Date to restart a blocked behaviour."""
+        return self._date_to_restart
+
+    @date_to_restart.setter
+    def date_to_restart(self, date_to_restart: Optional[datetime]) -> None:
+        self._date_to_restart = date_to_restart
+
+    @property
+    def blocking_event(self) -> Optional[BehaviourEvent]:
+        """The event the behaviour is blocked on."""
+        return self._blocking_event
+
     @property
     def data_store(self) -> Dict[str, Any]:
         """Data store of the behaviour."""
@@ -100,6 +123,7 @@ class Behaviour(ABC):
                 Defaults to 0.
         """
         self._status = BehaviourStatus.BLOCKED
+        self._blocking_event = None
         if millisecond:
             self._date_to_restart = datetime.now() + timedelta(
                 milliseconds=millisecond
@@ -107,6 +131,52 @@ class Behaviour(ABC):
         else:
             self._date_to_restart = None
 
+    def wait_message(self, millisecond: int = 0) -> None:
+        """Blocks this behaviour until a message arrives in the agent mailbox.
+
+        If a message arrived since the first call to receive method in the
+        current action, the behaviour is not blocked so that message is not
+        missed.
+
+        Args:
+            millisecond (int, optional): Maximum time before the behaviour
+                restarts without message. Defaults to 0 (no limit).
+        """
+        self.block(millisecond)
+        if self._agent is not None:
+            self._agent.add_message_waiter(self, self._message_mark)
+
+    def block_until(self, event: BehaviourEvent, millisecond: int = 0) -> None:
+        """Blocks this behaviour until an event is set or notified.
+
+        If the event is already set, the behaviour is not blocked.
+
+        Args:
+            event (BehaviourEvent): The event to wait for.
+            millisecond (int, optional): Maximum time before the behaviour
+                restarts without event. Defaults to 0 (no limit).
+        """
+        self.block(millisecond)
+        self._blocking_event = event
+        event.add_waiter(self)
+
+    def block_on(self, key: str, millisecond: int = 0) -> None:
+        """Blocks this behaviour until a key of its data store changes.
+
+        Args:
+            key (str): The key of the data store to watch.
+            millisecond (int, optional): Maximum time before the behaviour
+                restarts without change. Defaults to 0 (no limit).
+
+        Raises:
+            BehaviourException: If the data store is not a DataStore.
+        """
+        if not isinstance(self._data_store, DataStore):
+            raise BehaviourException(
+                "Only the changes of a DataStore can be waited for."
+            )
+        self.block_until(self._data_store.get_event(key), millisecond)
+
     @abstractmethod
     def done(self) -> bool:
         """Get the behaviour has completed its execution.
@@ -150,6 +220,32 @@ class Behaviour(ABC):
         """
         return 0
 
+    def receive(
+        self,
+        topic: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        performative: Optional["Performative"] = None,
+    ) -> Optional["Message"]:
+        """Get the first matching message of the agent mailbox.
+
+        Args:
+            topic (Optional[str], optional): Only get a message of this
+                topic. Defaults to None.
+            conversation_id (Optional[str], optional): Only get a message of
+                this conversation. Defaults to None.
+            performative (Optional[Performative], optional): Only get a
+                message with this performative. Defaults to None.
+
+        Returns:
+            Optional[Message]: The message or None if there is no matching
+                message or no agent.
+        """
+        if self._agent is None:
+            return None
+        if self._message_mark is None:
+            self._message_mark = self._agent.message_count
+        return self._agent.receive(topic, conversation_id, performative)
+
     def reset(self) -> None:
         """Restores behaviour initial state."""
         if self._init_state:
@@ -157,9 +253,17 @@ class Behaviour(ABC):
         self._save_init_state()
 
     def restart(self) -> None:
-        """Restarts a blocked behaviour."""
+        """Restarts a blocked behaviour, its blocked parents and its agent."""
         self._status = BehaviourStatus.STARTED
         self._date_to_restart = None
+        self._blocking_event = None
+        if (
+            self._parent is not None
+            and self._parent.status == BehaviourStatus.BLOCKED
+        ):
+            self._parent.restart()
+        elif self._agent is not None:
+            self._agent.wake()
 
     def run(self) -> Optional[int]:
         """Run the behaviour.
@@ -172,11 +276,16 @@ class Behaviour(ABC):
         if self._status == BehaviourStatus.STOPPED:
             return self.on_end()
         if self.is_runnable():
-            self.action()
+            self._message_mark = None
+            self._perform_action()
             if self.done():
                 return self.on_end()
         return None
 
+    def _perform_action(self) -> None:
+        """Call action method, overridden by behaviours wrapping it."""
+        self.action()
+
     def _save_init_state(self) -> None:
         """Save the behaviour initial state."""
         self._init_state = self.__dict__.copy()
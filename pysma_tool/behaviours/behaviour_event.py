@@ -0,0 +1,82 @@
+"""Behaviour event module"""
+
+from threading import Lock
+from typing import Any, Dict, List, TYPE_CHECKING
+
+from .behaviour_status import BehaviourStatus
+
+if TYPE_CHECKING:
+    from .behaviour import Behaviour
+
+
+class BehaviourEvent:
+    """Define BehaviourEvent class, restarting the behaviours blocked on it.
+
+    Behaviours block on an event with Behaviour.block_until method. Setting
+    the event restarts them and keeps it set, so the behaviours blocking on
+    it later are not blocked, until the event is cleared. Notifying the
+    event only restarts the behaviours blocked on it at that time.
+
+    Attributes:
+        is_set (bool): True if the event is set. By default is False.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate BehaviourEvent class."""
+        self._lock: Lock = Lock()
+        self._is_set: bool = False
+        self._waiters: Dict[int, "Behaviour"] = {}
+
+    @property
+    def is_set(self) -> bool:
+        """True if the event is set."""
+        return self._is_set
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name != "_lock"
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def add_waiter(self, behaviour: "Behaviour") -> None:
+        """Restart a blocked behaviour when the event fires, or at once if
+        the event is set.
+
+        Args:
+            behaviour (Behaviour): The behaviour blocked on the event.
+        """
+        with self._lock:
+            if not self._is_set:
+                self._waiters[id(behaviour)] = behaviour
+                return
+        behaviour.restart()
+
+    def set(self) -> None:
+        """Set the event and restart the behaviours blocked on it."""
+        with self._lock:
+            self._is_set = True
+        self.notify()
+
+    def clear(self) -> None:
+        """Clear the event, behaviours block on it again."""
+        with self._lock:
+            self._is_set = False
+
+    def notify(self) -> None:
+        """Restart the behaviours blocked on the event."""
+        with self._lock:
+            if not self._waiters:
+                return
+            waiters: List["Behaviour"] = list(self._waiters.values())
+            self._waiters = {}
+        for behaviour in waiters:
+            if (
+                behaviour.blocking_event is self
+                and behaviour.status == BehaviourStatus.BLOCKED
+            ):
+                behaviour.restart()
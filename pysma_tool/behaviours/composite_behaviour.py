@@ -1,15 +1,19 @@
 """Composite behaviour module"""
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from .behaviour import Behaviour
-from ..exceptions.exceptions import BehaviourException 
+from .behaviour_status import BehaviourStatus
+from ..exceptions.exceptions import BehaviourException
 from pygraph_tool import Graph, NodeException, GraphException, Node
 
+if TYPE_CHECKING:
+    from ..agent import Agent
+
 
 class CompositeBehaviour(Behaviour):
     """Define CompositeBehaviour class inherits to Behaviour.
-    
+
     Attributes:
         id_first_state (Optional[str]): The identifier of first behaviour. By
             default is None.
@@ -32,11 +36,17 @@ class CompositeBehaviour(Behaviour):
         self._children_graph: Graph = Graph()
         self._is_termination: bool = False
 
+    @Behaviour.agent.setter
+    def agent(self, agent: Optional["Agent"]) -> None:
+        self._agent = agent
+        for node in self._children_graph.nodes:
+            node.node_content.agent = agent
+
     @property
     def id_first_state(self) -> Optional[str]:
         """The identifier of first behaviour."""
         return self._id_first_state
-    
+
     @id_first_state.setter
     def id_first_state(self, id_first_state: Optional[str]) -> None:
         self._id_first_state = id_first_state
@@ -45,7 +55,7 @@ class CompositeBehaviour(Behaviour):
     def id_last_state(self) -> Optional[str]:
         """The identifier of last behaviour."""
         return self._id_last_state
-    
+
     @id_last_state.setter
     def id_last_state(self, id_last_state: Optional[str]) -> None:
         self._id_last_state = id_last_state
@@ -54,16 +64,16 @@ class CompositeBehaviour(Behaviour):
     def id_current_state(self) -> Optional[str]:
         """The identifier of current behaviour."""
         return self._id_current_state
-    
+
     @id_current_state.setter
     def id_current_state(self, id_current_state: Optional[str]) -> None:
         self._id_current_state = id_current_state
-        
+
     @property
     def children_graph(self) -> Graph:
         """The graph of sub behaviours."""
         return self._children_graph
-    
+
     @children_graph.setter
     def children_graph(self, children_graph: Graph) -> None:
         self._children_graph = children_graph
@@ -72,25 +82,30 @@ class CompositeBehaviour(Behaviour):
     def is_termination(self) -> bool:
         """True if CompositeBehaviour is terminated."""
         return self._is_termination
-    
+
     @is_termination.setter
     def is_termination(self, is_termination: bool) -> None:
         self._is_termination = is_termination
 
     def action(self) -> None:
-        """CompositeBehaviour execution process."""
+        """CompositeBehaviour execution process.
+
+        Runs the current sub behaviour once. While it is blocked, the
+        CompositeBehaviour is blocked too, until the same restart date.
+        """
         current_node: Node = self._children_graph.get_node(
             self._id_current_state
         )
+        current_behaviour: Behaviour = current_node.node_content
 
-        if current_node.node_content.run() is None:
-            return self.action()
-        
-        self.schedule_next()
-        if self._is_termination:
+        if current_behaviour.run() is None:
+            if current_behaviour.status == BehaviourStatus.BLOCKED:
+                self.block()
+                self._date_to_restart = current_behaviour.date_to_restart
             return
-        return self.action()
-    
+
+        self.schedule_next()
+
     def schedule_first(self) -> None:
         """Determines the values of first, last and current states."""
         if len(self._children_graph.nodes) >= 1:
@@ -99,7 +114,7 @@ class CompositeBehaviour(Behaviour):
 
         if not self._id_current_state:
             self._id_current_state = self._id_first_state
-    
+
     def schedule_next(self) -> None:
         """Determines the value of next state."""
         current_node: Node = self._children_graph.get_node(
@@ -149,12 +164,13 @@ class CompositeBehaviour(Behaviour):
             )
         try:
             behaviour.parent = self
+            behaviour.agent = self._agent
             self._children_graph.add_node(behaviour, behaviour_id)
         except (NodeException, GraphException) as error:
             raise BehaviourException(
                 f"Behaviour {behaviour_id} is impossible to add: {error}"
             ) from error
-    
+
     def remove_sub_behaviour(self, behaviour_id: str) -> None:
         """Remove one sub behaviour.
 
@@ -0,0 +1,257 @@
+"""Contract net initiator behaviour module"""
+
+from abc import abstractmethod
+from datetime import datetime, timedelta
+from math import ceil
+from typing import Any, Iterable, List, Optional, Set
+from uuid import uuid4
+
+from .behaviour import Behaviour
+from .composite_behaviour import CompositeBehaviour
+from .one_shot_behaviour import OneShotBehaviour
+from ..exceptions.exceptions import BehaviourException
+from ..messages.message import Message
+from ..messages.performative import Performative
+
+CONTRACT_NET_TOPIC: str = "contract-net"
+
+
+class ContractNetInitiatorBehaviour(CompositeBehaviour):
+    """Define ContractNetInitiatorBehaviour class inherits to
+    CompositeBehaviour.
+
+    Sends a call for proposals to the participants, collects their
+    proposals until the deadline or until every participant replied, then
+    accepts the proposals chosen by select_proposals method and rejects the
+    others. Replies are collected without polling: the collecting step waits
+    for messages and is restarted by their arrival or by the deadline. Once
+    contracts are awarded the conversation is over: the agent discards its
+    replies still in the mailbox and those arriving later (see
+    Agent.discard_conversation).
+
+    Attributes:
+        participants (List[str]): Identifiers of the participant agents.
+        conversation_id (str): Identifier of the current conversation. By
+            default is empty.
+        proposals (List[Message]): The proposals received. By default is
+            empty.
+        refusals (List[Message]): The refusals received. By default is
+            empty.
+        failures (List[Message]): The failures received. By default is
+            empty.
+        accepted (List[Message]): The accepted proposals. By default is
+            empty.
+    """
+
+    def __init__(
+        self,
+        participants: Iterable[str],
+        content: Any = None,
+        timeout: int = 1000,
+    ) -> None:
+        """Instantiate ContractNetInitiatorBehaviour class.
+
+        Args:
+            participants (Iterable[str]): Identifiers of the participant
+                agents.
+            content (Any, optional): The content of the call for proposals.
+                Defaults to None.
+            timeout (int, optional): Number of milliseconds to wait for
+                proposals. Defaults to 1000, 0 waits for every participant.
+        """
+        super().__init__()
+        self._participants: List[str] = list(participants)
+        self._content: Any = content
+        self._timeout: int = timeout
+        self._conversation_id: str = ""
+        self._deadline: Optional[datetime] = None
+        self._pending: Set[str] = set()
+        self._proposals: List[Message] = []
+        self._refusals: List[Message] = []
+        self._failures: List[Message] = []
+        self._accepted: List[Message] = []
+        self.add_sub_behaviour(_CallForProposals(self), "call_for_proposals")
+        self.add_sub_behaviour(_CollectProposals(self), "collect_proposals")
+        self.add_sub_behaviour(_AwardContract(self), "award_contract")
+
+    @property
+    def participants(self) -> List[str]:
+        """Identifiers of the participant agents."""
+        return self._participants
+
+    @property
+    def conversation_id(self) -> str:
+        """Identifier of the current conversation."""
+        return self._conversation_id
+
+    @property
+    def proposals(self) -> List[Message]:
+        """The proposals received."""
+        return self._proposals
+
+    @property
+    def refusals(self) -> List[Message]:
+        """The refusals received."""
+        return self._refusals
+
+    @property
+    def failures(self) -> List[Message]:
+        """The failures received."""
+        return self._failures
+
+    @property
+    def accepted(self) -> List[Message]:
+        """The accepted proposals."""
+        return self._accepted
+
+    @abstractmethod
+    def select_proposals(self, proposals: List[Message]) -> List[Message]:
+        """Choose the proposals to accept.
+
+        Args:
+            proposals (List[Message]): The proposals received before the
+                deadline.
+
+        Returns:
+            List[Message]: The proposals to accept, the others are
+                rejected.
+
+        Raises:
+            TypeError: To be implemented...
+        """
+
+    def _send(self, message: Message) -> None:
+        """Send a message with the agent of the behaviour.
+
+        Args:
+            message (Message): The message to send.
+
+        Raises:
+            BehaviourException: If the behaviour has no agent.
+        """
+        if self._agent is None:
+            raise BehaviourException(
+                "ContractNetInitiatorBehaviour must be added to an agent."
+            )
+        self._agent.send(message)
+
+    def _call_for_proposals(self) -> None:
+        """Send the call for proposals and start the deadline."""
+        self._conversation_id = uuid4().hex
+        self._pending = set(self._participants)
+        if self._timeout:
+            self._deadline = datetime.now() + timedelta(
+                milliseconds=self._timeout
+            )
+        self._send(
+            Message(
+                CONTRACT_NET_TOPIC,
+                self._content,
+                self._agent.agent_id if self._agent else "",
+                self._participants,
+                Performative.CFP,
+                self._conversation_id,
+            )
+        )
+
+    def _handle_reply(self, message: Message) -> None:
+        """Record a reply of a participant.
+
+        Args:
+            message (Message): The reply.
+        """
+        if message.sender not in self._pending:
+            return
+        if message.performative == Performative.PROPOSE:
+            self._pending.discard(message.sender)
+            self._proposals.append(message)
+        elif message.performative == Performative.REFUSE:
+            self._pending.discard(message.sender)
+            self._refusals.append(message)
+        elif message.performative == Performative.FAILURE:
+            self._pending.discard(message.sender)
+            self._failures.append(message)
+
+    def _get_remaining_time(self) -> Optional[int]:
+        """Get the time left to collect replies.
+
+        Returns:
+            Optional[int]: Milliseconds before the deadline, 0 if collection
+                is over or None if there is no deadline.
+        """
+        if not self._pending:
+            return 0
+        if self._deadline is None:
+            return None
+        remaining: timedelta = self._deadline - datetime.now()
+        return max(0, ceil(remaining.total_seconds() * 1000))
+
+    def _award_contract(self) -> None:
+        """Accept the selected proposals and reject the others."""
+        if self._agent is not None:
+            self._agent.discard_conversation(self._conversation_id)
+        self._accepted = self.select_proposals(list(self._proposals))
+        accepted: Set[int] = {id(proposal) for proposal in self._accepted}
+        sender: str = self._agent.agent_id if self._agent else ""
+        for proposal in self._proposals:
+            self._send(
+                proposal.create_reply(
+                    (
+                        Performative.ACCEPT_PROPOSAL
+                        if id(proposal) in accepted
+                        else Performative.REJECT_PROPOSAL
+                    ),
+                    sender=sender,
+                )
+            )
+
+
+class _CallForProposals(OneShotBehaviour):
+    """First state of ContractNetInitiatorBehaviour."""
+
+    def __init__(self, initiator: ContractNetInitiatorBehaviour) -> None:
+        super().__init__()
+        self._initiator: ContractNetInitiatorBehaviour = initiator
+
+    def action(self) -> None:
+        # pylint: disable=protected-access
+        self._initiator._call_for_proposals()
+
+
+class _CollectProposals(Behaviour):
+    """Second state of ContractNetInitiatorBehaviour."""
+
+    def __init__(self, initiator: ContractNetInitiatorBehaviour) -> None:
+        super().__init__()
+        self._initiator: ContractNetInitiatorBehaviour = initiator
+        self._is_collected: bool = False
+
+    def action(self) -> None:
+        # pylint: disable=protected-access
+        conversation_id: str = self._initiator.conversation_id
+        message: Optional[Message] = self.receive(
+            conversation_id=conversation_id
+        )
+        while message is not None:
+            self._initiator._handle_reply(message)
+            message = self.receive(conversation_id=conversation_id)
+        remaining: Optional[int] = self._initiator._get_remaining_time()
+        if remaining == 0:
+            self._is_collected = True
+        else:
+            self.wait_message(remaining or 0)
+
+    def done(self) -> bool:
+        return self._is_collected
+
+
+class _AwardContract(OneShotBehaviour):
+    """Last state of ContractNetInitiatorBehaviour."""
+
+    def __init__(self, initiator: ContractNetInitiatorBehaviour) -> None:
+        super().__init__()
+        self._initiator: ContractNetInitiatorBehaviour = initiator
+
+    def action(self) -> None:
+        # pylint: disable=protected-access
+        self._initiator._award_contract()
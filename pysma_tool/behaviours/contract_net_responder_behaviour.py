@@ -0,0 +1,85 @@
+"""Contract net responder behaviour module"""
+
+from abc import abstractmethod
+from typing import Any, Optional
+
+from .contract_net_initiator_behaviour import CONTRACT_NET_TOPIC
+from .cyclic_behaviour import CyclicBehaviour
+from ..messages.message import Message
+from ..messages.performative import Performative
+
+
+class ContractNetResponderBehaviour(CyclicBehaviour):
+    """Define ContractNetResponderBehaviour class inherits to
+    CyclicBehaviour.
+
+    Answers each call for proposals with a proposal or a refusal, then
+    handles the acceptance or the rejection of its proposals. The behaviour
+    waits for messages between two conversations instead of polling.
+    """
+
+    def action(self) -> None:
+        """Handle every contract net message of the agent mailbox."""
+        for performative, handler in (
+            (Performative.CFP, self._reply_to_cfp),
+            (Performative.ACCEPT_PROPOSAL, self.handle_accept_proposal),
+            (Performative.REJECT_PROPOSAL, self.handle_reject_proposal),
+        ):
+            message: Optional[Message] = self.receive(
+                CONTRACT_NET_TOPIC, performative=performative
+            )
+            while message is not None:
+                handler(message)
+                message = self.receive(
+                    CONTRACT_NET_TOPIC, performative=performative
+                )
+        self.wait_message()
+
+    def _reply_to_cfp(self, cfp: Message) -> None:
+        """Send a proposal or a refusal to a call for proposals.
+
+        Args:
+            cfp (Message): The call for proposals.
+        """
+        if self._agent is None:
+            return
+        proposal: Optional[Any] = self.handle_cfp(cfp)
+        self._agent.send(
+            cfp.create_reply(
+                (
+                    Performative.REFUSE
+                    if proposal is None
+                    else Performative.PROPOSE
+                ),
+                proposal,
+                self._agent.agent_id,
+            )
+        )
+
+    @abstractmethod
+    def handle_cfp(self, cfp: Message) -> Optional[Any]:
+        """Build the proposal answering a call for proposals.
+
+        Args:
+            cfp (Message): The call for proposals.
+
+        Returns:
+            Optional[Any]: The content of the proposal or None to refuse.
+
+        Raises:
+            TypeError: To be implemented...
+        """
+
+    def handle_accept_proposal(self, accept: Message) -> None:
+        """Call when a proposal is accepted.
+
+        Args:
+            accept (Message): The acceptance message.
+        """
+
+    def handle_reject_proposal(self, reject: Message) -> None:
+        """Call when a proposal is rejected.
+
+        Args:
+            reject (Message): The rejection message.
+        """
@@ -0,0 +1,99 @@
+"""Data store module"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .behaviour_event import BehaviourEvent
+
+
+class DataStore(Dict[str, Any]):
+    """Define DataStore class, a dictionary whose writes can be observed.
+
+    Each key has an event notified when the key is set, updated or
+    removed, on which behaviours block with Behaviour.block_on method.
+    Changes inside a value (e.g. appending to a list) are not seen: call
+    notify method after them.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Instantiate DataStore class, with the arguments of dict."""
+        super().__init__(*args, **kwargs)
+        self._events: Dict[str, BehaviourEvent] = {}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (DataStore, (), self.__dict__, None, iter(self.items()))
+
+    def get_event(self, key: str) -> BehaviourEvent:
+        """Get the event notified when a key changes.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            BehaviourEvent: The event, created on first use.
+        """
+        event: Optional[BehaviourEvent] = self._events.get(key)
+        if event is None:
+            event = self._events[key] = BehaviourEvent()
+        return event
+
+    def has_event(self, event: BehaviourEvent) -> bool:
+        """Check if an event is notified by the changes of a key.
+
+        Args:
+            event (BehaviourEvent): The event.
+
+        Returns:
+            bool: True if the event is the event of one of the keys.
+        """
+        return any(own_event is event for own_event in self._events.values())
+
+    def notify(self, key: str) -> None:
+        """Restart the behaviours blocked on a key.
+
+        Args:
+            key (str): The changed key.
+        """
+        event: Optional[BehaviourEvent] = self._events.get(key)
+        if event is not None:
+            event.notify()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.notify(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.notify(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        value: Any = super().pop(key, *default)
+        self.notify(key)
+        return value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        super().__setitem__(key, default)
+        self.notify(key)
+        return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        changes: Dict[str, Any] = dict(*args, **kwargs)
+        super().update(changes)
+        for key in changes:
+            self.notify(key)
+
+    def __ior__(self, other: Any) -> "DataStore":
+        self.update(other)
+        return self
+
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        self.notify(key)
+        return key, value
+
+    def clear(self) -> None:
+        keys: List[str] = list(self)
+        super().clear()
+        for key in keys:
+            self.notify(key)
@@ -0,0 +1,151 @@
+"""Generator behaviour module"""
+
+from abc import abstractmethod
+from math import ceil
+from time import perf_counter
+from typing import Any, Dict, Generator, NamedTuple, Optional
+
+from .behaviour import Behaviour
+from .behaviour_event import BehaviourEvent
+from .behaviour_status import BehaviourStatus
+from ..exceptions.exceptions import BehaviourException
+
+
+class WaitMessage(NamedTuple):
+    """Value yielded by a GeneratorBehaviour to wait for a message.
+
+    Attributes:
+        millisecond (int): Maximum time to wait. Defaults to 0 (no limit).
+    """
+
+    millisecond: int = 0
+
+
+class WaitEvent(NamedTuple):
+    """Value yielded by a GeneratorBehaviour to wait for an event with a
+    time limit.
+
+    Attributes:
+        event (BehaviourEvent): The event to wait for.
+        millisecond (int): Maximum time to wait. Defaults to 0 (no limit).
+    """
+
+    event: BehaviourEvent
+    millisecond: int = 0
+
+
+class GeneratorBehaviour(Behaviour):
+    """Define GeneratorBehaviour class inherits to Behaviour.
+
+    The action method is a generator which yields at safe points. Each
+    time the agent runs the behaviour, the generator is resumed until it
+    yields after the time budget is used up, then the agent moves on to its
+    other behaviours. The behaviour is done when the generator returns.
+
+    The generator may yield:
+        - None: a safe point, the generator goes on if time is left.
+        - A number of milliseconds: the behaviour is blocked that long,
+          rounded up to the next millisecond. 0 or less is a safe point.
+        - WaitMessage: the behaviour waits for a message, as with
+          wait_message method.
+        - A BehaviourEvent or WaitEvent: the behaviour waits for the event,
+          as with block_until method.
+
+    A suspended generator can't be serialized: until the generator
+    returns, the agent can't hibernate or migrate and stays on its
+    platform.
+
+    Attributes:
+        time_budget (float): Number of milliseconds the generator may run
+            in one step of the agent. By default is 5.0.
+    """
+
+    def __init__(self, time_budget: float = 5.0) -> None:
+        """Instantiate GeneratorBehaviour class.
+
+        Args:
+            time_budget (float, optional): Number of milliseconds the
+                generator may run in one step of the agent. Defaults to 5.0,
+                0 resumes it once per step.
+        """
+        super().__init__()
+        self._time_budget: float = time_budget
+        self._generator: Optional[Generator[Any, None, None]] = None
+        self._is_finished: bool = False
+
+    @property
+    def time_budget(self) -> float:
+        """Number of milliseconds the generator may run in one step."""
+        return self._time_budget
+
+    @time_budget.setter
+    def time_budget(self, time_budget: float) -> None:
+        self._time_budget = time_budget
+
+    @abstractmethod
+    def action(self) -> Generator[Any, None, None]:  # type: ignore
+        """Set operations to be performed by the behavior, yielding at safe
+        points.
+
+        Raises:
+            TypeError: To be implemented...
+        """
+
+    def done(self) -> bool:
+        """Get the behaviour has completed its execution.
+
+        Returns:
+            bool: True if the generator returned.
+        """
+        return self._is_finished
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state to serialize.
+
+        Raises:
+            BehaviourException: If the generator is suspended.
+
+        Returns:
+            Dict[str, Any]: The attributes of the behaviour.
+        """
+        if self._generator is not None:
+            raise BehaviourException(
+                "GeneratorBehaviour can't be serialized while its generator "
+                "is suspended."
+            )
+        return self.__dict__.copy()
+
+    def _perform_action(self) -> None:
+        """Resume the generator until the time budget is used up.
+
+        Raises:
+            BehaviourException: If the generator yields an unknown value.
+        """
+        if self._generator is None:
+            self._generator = self.action()
+        deadline: float = perf_counter() + self._time_budget / 1000
+        while True:
+            try:
+                value: Any = next(self._generator)
+            except StopIteration:
+                self._generator = None
+                self._is_finished = True
+                return
+            if isinstance(value, WaitMessage):
+                self.wait_message(value.millisecond)
+            elif isinstance(value, BehaviourEvent):
+                self.block_until(value)
+            elif isinstance(value, WaitEvent):
+                self.block_until(value.event, value.millisecond)
+            elif isinstance(value, (int, float)):
+                if value > 0:
+                    self.block(ceil(value))
+            elif value is not None:
+                raise BehaviourException(
+                    f"GeneratorBehaviour can't yield {value!r}."
+                )
+            if (
+                self._status == BehaviourStatus.BLOCKED
+                or perf_counter() >= deadline
+            ):
+                return
@@ -0,0 +1,95 @@
+"""Memoized one shot behaviour module"""
+
+from copy import deepcopy
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from .one_shot_behaviour import OneShotBehaviour
+from .result_cache import ResultCache
+
+
+class MemoizedOneShotBehaviour(OneShotBehaviour):
+    """Define MemoizedOneShotBehaviour class inherits to OneShotBehaviour.
+
+    For behaviours whose action is a pure function of some data store
+    values. The values of output_keys computed by action method are cached
+    for the values of input_keys, and written back in data store without
+    calling action method the next time the same inputs are met, by any
+    behaviour of the same class. Inputs of different types are different
+    inputs, even if equal (e.g. 1 and True). The cache keeps copies of the
+    outputs and each hit writes new copies, so that behaviours never share
+    mutable outputs.
+
+    Attributes:
+        input_keys (Tuple[str, ...]): The data store keys read by action
+            method. By default is empty.
+        output_keys (Tuple[str, ...]): The data store keys written by action
+            method. By default is empty.
+        result_cache (ResultCache): The cache shared by the behaviours. By
+            default is shared by every MemoizedOneShotBehaviour.
+    """
+
+    input_keys: Tuple[str, ...] = ()
+    output_keys: Tuple[str, ...] = ()
+    result_cache: ResultCache = ResultCache()
+
+    def _get_cache_key(self) -> Optional[Hashable]:
+        """Get the cache key of the current inputs.
+
+        Returns:
+            Optional[Hashable]: The key, None if an input is missing or is
+                not hashable.
+        """
+        try:
+            key: Hashable = (
+                type(self).__module__,
+                type(self).__qualname__,
+                tuple(
+                    _get_typed_value(self._data_store[key])
+                    for key in self.input_keys
+                ),
+            )
+            hash(key)
+        except (KeyError, TypeError):
+            return None
+        return key
+
+    def _perform_action(self) -> None:
+        """Write the cached outputs in data store, or call action method and
+        cache its outputs."""
+        key: Optional[Hashable] = self._get_cache_key()
+        if key is None:
+            self.action()
+            return
+        outputs: Optional[Dict[str, Any]] = self.result_cache.get(key)
+        if outputs is not None:
+            self._data_store.update(deepcopy(outputs))
+            return
+        self.action()
+        try:
+            outputs = deepcopy(
+                {
+                    output_key: self._data_store[output_key]
+                    for output_key in self.output_keys
+                    if output_key in self._data_store
+                }
+            )
+        except TypeError:
+            return
+        self.result_cache.set(key, outputs)
+
+
+def _get_typed_value(value: Any) -> Any:
+    """Tag a value with its type, and the items of tuples and frozensets
+    with theirs, so that equal values of different types differ.
+
+    Args:
+        value (Any): An input value.
+
+    Returns:
+        Any: The value and its type.
+    """
+    if isinstance(value, tuple):
+        return type(value), tuple(_get_typed_value(item) for item in value)
+    if isinstance(value, frozenset):
+        return type(value), frozenset(_get_typed_value(item) for item in value)
+    return type(value), value
@@ -0,0 +1,113 @@
+"""Result cache module"""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+Entry = Tuple[float, Dict[str, Any]]
+
+
+class ResultCache:
+    """Define ResultCache class, a thread safe LRU cache of results.
+
+    Attributes:
+        max_size (int): Maximum number of results, the least recently used
+            is evicted beyond. By default is 1024.
+        ttl (int): Number of milliseconds a result stays valid, 0 for no
+            limit. By default is 0.
+        hits (int): Number of lookups which found a valid result.
+        misses (int): Number of lookups which found no valid result.
+        evictions (int): Number of results evicted or expired.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: int = 0) -> None:
+        """Instantiate ResultCache class.
+
+        Args:
+            max_size (int, optional): Maximum number of results. Defaults to
+                1024.
+            ttl (int, optional): Number of milliseconds a result stays
+                valid, 0 for no limit. Defaults to 0.
+        """
+        self._max_size: int = max_size
+        self._ttl: int = ttl
+        self._results: "OrderedDict[Hashable, Entry]" = OrderedDict()
+        self._lock: Lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of results."""
+        return self._max_size
+
+    @property
+    def ttl(self) -> int:
+        """Number of milliseconds a result stays valid."""
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups which found a valid result."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups which found no valid result."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of results evicted or expired."""
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Get a result and mark it as recently used.
+
+        Args:
+            key (Hashable): The key of the result.
+
+        Returns:
+            Optional[Dict[str, Any]]: The result or None if there is no
+                valid result.
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and self._ttl and entry[0] <= monotonic():
+                del self._results[key]
+                self._evictions += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._results.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, result: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used if full.
+
+        Args:
+            key (Hashable): The key of the result.
+            result (Dict[str, Any]): The result.
+        """
+        expiration: float = monotonic() + self._ttl / 1000
+        with self._lock:
+            self._results[key] = (expiration, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every result and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -0,0 +1,194 @@
+"""Sequential behaviour module"""
+
+from typing import List, Optional, TYPE_CHECKING
+
+from pygraph_tool import Graph
+
+from .behaviour import Behaviour
+from .behaviour_status import BehaviourStatus
+from .composite_behaviour import CompositeBehaviour
+from ..exceptions.exceptions import BehaviourException
+
+if TYPE_CHECKING:
+    from ..agent import Agent
+
+
+class SequentialBehaviour(CompositeBehaviour):
+    """Define SequentialBehaviour class inherits to CompositeBehaviour.
+
+    Runs its sub behaviours one after the other, like CompositeBehaviour,
+    but keeps them in a list walked with an integer cursor. The graph of
+    sub behaviours is only built the first time children_graph is used,
+    for instance to add transitions; from then on the behaviour works as a
+    CompositeBehaviour.
+
+    Attributes:
+        sub_behaviours (List[Behaviour]): The sub behaviours in running
+            order. By default is empty.
+        current_index (int): The position of current behaviour. By default
+            is 0.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate SequentialBehaviour class."""
+        # pylint: disable=super-init-not-called,non-parent-init-called
+        Behaviour.__init__(self)
+        self._id_first_state: Optional[str] = None
+        self._id_last_state: Optional[str] = None
+        self._id_current_state: Optional[str] = None
+        self._children_graph: Optional[Graph] = None  # type: ignore
+        self._is_termination: bool = False
+        self._sub_behaviours: List[Behaviour] = []
+        self._sub_behaviour_ids: List[str] = []
+        self._current_index: int = 0
+
+    @Behaviour.agent.setter
+    def agent(self, agent: Optional["Agent"]) -> None:
+        self._agent = agent
+        for behaviour in self.sub_behaviours:
+            behaviour.agent = agent
+
+    @property
+    def sub_behaviours(self) -> List[Behaviour]:
+        """The sub behaviours in running order."""
+        if self._children_graph is not None:
+            return [node.node_content for node in self._children_graph.nodes]
+        return self._sub_behaviours
+
+    @property
+    def current_index(self) -> int:
+        """The position of current behaviour."""
+        return self._current_index
+
+    @property  # type: ignore
+    def children_graph(self) -> Graph:
+        """The graph of sub behaviours, built on first use."""
+        if self._children_graph is None:
+            children_graph: Graph = Graph()
+            for behaviour, behaviour_id in zip(
+                self._sub_behaviours, self._sub_behaviour_ids
+            ):
+                children_graph.add_node(behaviour, behaviour_id)
+            self._children_graph = children_graph
+            self._sub_behaviours = []
+            self._sub_behaviour_ids = []
+        return self._children_graph
+
+    @children_graph.setter
+    def children_graph(self, children_graph: Graph) -> None:
+        self._children_graph = children_graph
+        self._sub_behaviours = []
+        self._sub_behaviour_ids = []
+
+    def action(self) -> None:
+        """SequentialBehaviour execution process.
+
+        Runs the current sub behaviour once. While it is blocked, the
+        SequentialBehaviour is blocked too, until the same restart date.
+        """
+        if self._children_graph is not None:
+            super().action()
+            return
+        current_behaviour: Behaviour = self._sub_behaviours[
+            self._current_index
+        ]
+
+        if current_behaviour.run() is None:
+            if current_behaviour.status == BehaviourStatus.BLOCKED:
+                self.block()
+                self._date_to_restart = current_behaviour.date_to_restart
+            return
+
+        self.schedule_next()
+
+    def schedule_first(self) -> None:
+        """Determines the values of first, last and current states."""
+        if self._children_graph is not None:
+            super().schedule_first()
+            return
+        if self._sub_behaviour_ids:
+            self._id_first_state = self._sub_behaviour_ids[0]
+            self._id_last_state = self._sub_behaviour_ids[-1]
+
+        if not self._id_current_state:
+            self._current_index = 0
+            self._id_current_state = self._id_first_state
+
+    def schedule_next(self) -> None:
+        """Determines the value of next state."""
+        if self._children_graph is not None:
+            super().schedule_next()
+            return
+        if self._current_index + 1 < len(self._sub_behaviours):
+            self._current_index += 1
+            self._id_current_state = self._sub_behaviour_ids[
+                self._current_index
+            ]
+        else:
+            self._is_termination = True
+
+    def reset_children(self) -> None:
+        """Restores all sub behaviours to their initial state."""
+        for behaviour in self.sub_behaviours:
+            behaviour.reset()
+
+    def add_sub_behaviour(
+        self, behaviour: Behaviour, behaviour_id: str
+    ) -> None:
+        """Add a sub behaviour at the end of the sequence.
+
+        Args:
+            behaviour (Behaviour): Behaviour to add.
+            behaviour_id (str): Behaviour identifier.
+
+        Raises:
+            BehaviourException: If behaviour not inherits to Behaviour or
+                if behaviour is impossible to add.
+        """
+        if self._children_graph is not None:
+            super().add_sub_behaviour(behaviour, behaviour_id)
+            return
+        if not isinstance(behaviour, Behaviour):
+            raise BehaviourException(
+                "Parameter 'behaviour' must be Behaviour instance."
+                f"Behaviour {behaviour_id} is impossible to add."
+            )
+        if not behaviour_id or behaviour_id in self._sub_behaviour_ids:
+            raise BehaviourException(
+                f"Behaviour {behaviour_id} is impossible to add: the "
+                "identifier must be filled in and unique."
+            )
+        behaviour.parent = self
+        behaviour.agent = self._agent
+        self._sub_behaviours.append(behaviour)
+        self._sub_behaviour_ids.append(behaviour_id)
+
+    def remove_sub_behaviour(self, behaviour_id: str) -> None:
+        """Remove one sub behaviour.
+
+        Args:
+            behaviour_id (str): The identifier of the behaviour to remove.
+
+        Raises:
+            BehaviourException: If the behaviour doesn't exist.
+        """
+        if self._children_graph is not None:
+            super().remove_sub_behaviour(behaviour_id)
+            return
+        if behaviour_id not in self._sub_behaviour_ids:
+            raise BehaviourException(
+                f"Behaviour {behaviour_id} doesn't exist."
+            )
+        index: int = self._sub_behaviour_ids.index(behaviour_id)
+        del self._sub_behaviours[index]
+        del self._sub_behaviour_ids[index]
+        if self._id_current_state is None:
+            return
+        if index < self._current_index:
+            self._current_index -= 1
+        if self._current_index < len(self._sub_behaviour_ids):
+            self._id_current_state = self._sub_behaviour_ids[
+                self._current_index
+            ]
+        else:
+            self._is_termination = True
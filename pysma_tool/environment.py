@@ -0,0 +1,376 @@
+"""Environment module"""
+
+from heapq import nsmallest
+from math import floor
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .exceptions.exceptions import EnvironmentException
+
+Position = Tuple[float, float]
+Cell = Tuple[int, int]
+
+
+class Environment:
+    """Define a 2D Environment indexed by a uniform grid.
+
+    Every agent is stored in the cell containing its position, so radius
+    and nearest neighbours queries only visit the cells around the query
+    point instead of scanning every agent.
+
+    The environment is shared by agents running on several threads: moves
+    and queries are serialized by a lock. Moving many agents at once with
+    update_positions takes the lock only once.
+
+    Attributes:
+        cell_size (float): Side length of a grid cell. Should be close to
+            the usual query radius. By default is 1.0.
+        positions (Dict[str, Position]): Position of each agent, indexed by
+            agent identifier, as a copy. By default is empty.
+    """
+
+    def __init__(self, cell_size: float = 1.0) -> None:
+        """Instantiate Environment class.
+
+        Args:
+            cell_size (float, optional): Side length of a grid cell.
+                Defaults to 1.0.
+
+        Raises:
+            EnvironmentException: If cell size is not strictly positive.
+        """
+        if cell_size <= 0:
+            raise EnvironmentException(
+                "Parameter 'cell_size' must be strictly positive."
+            )
+        self._cell_size: float = cell_size
+        self._positions: Dict[str, Position] = {}
+        self._agent_cells: Dict[str, Cell] = {}
+        self._cells: Dict[Cell, Set[str]] = {}
+        self._lock: Lock = Lock()
+
+    @property
+    def cell_size(self) -> float:
+        """Side length of a grid cell."""
+        return self._cell_size
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Position of each agent, indexed by agent identifier."""
+        with self._lock:
+            return dict(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._positions
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name != "_lock"
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _get_cell(self, x: float, y: float) -> Cell:
+        """Get the cell containing a position.
+
+        Args:
+            x (float): Abscissa of the position.
+            y (float): Ordinate of the position.
+
+        Returns:
+            Cell: The coordinates of the cell.
+        """
+        return (floor(x / self._cell_size), floor(y / self._cell_size))
+
+    def add_agent(self, agent_id: str, x: float, y: float) -> None:
+        """Place a new agent in the environment.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            x (float): Abscissa of the agent.
+            y (float): Ordinate of the agent.
+
+        Raises:
+            EnvironmentException: If agent is already in the environment.
+        """
+        with self._lock:
+            self._add_agent(agent_id, x, y)
+
+    def _add_agent(self, agent_id: str, x: float, y: float) -> None:
+        """Place a new agent in the environment. Lock must be held.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            x (float): Abscissa of the agent.
+            y (float): Ordinate of the agent.
+
+        Raises:
+            EnvironmentException: If agent is already in the environment.
+        """
+        if agent_id in self._positions:
+            raise EnvironmentException(
+                f"Agent {agent_id} is already in the environment."
+            )
+        cell: Cell = self._get_cell(x, y)
+        self._positions[agent_id] = (x, y)
+        self._agent_cells[agent_id] = cell
+        self._cells.setdefault(cell, set()).add(agent_id)
+
+    def remove_agent(self, agent_id: str) -> None:
+        """Remove an agent from the environment.
+
+        Args:
+            agent_id (str): The identifier of the agent to remove.
+
+        Raises:
+            EnvironmentException: If agent is not in the environment.
+        """
+        with self._lock:
+            if agent_id not in self._positions:
+                raise EnvironmentException(
+                    f"Agent {agent_id} is not in the environment."
+                )
+            del self._positions[agent_id]
+            cell: Cell = self._agent_cells.pop(agent_id)
+            agents: Set[str] = self._cells[cell]
+            agents.discard(agent_id)
+            if not agents:
+                del self._cells[cell]
+
+    def get_position(self, agent_id: str) -> Position:
+        """Get the position of an agent.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+
+        Raises:
+            EnvironmentException: If agent is not in the environment.
+
+        Returns:
+            Position: The position of the agent.
+        """
+        try:
+            return self._positions[agent_id]
+        except KeyError as error:
+            raise EnvironmentException(
+                f"Agent {agent_id} is not in the environment."
+            ) from error
+
+    def move_agent(self, agent_id: str, x: float, y: float) -> None:
+        """Move an agent already placed in the environment.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            x (float): New abscissa of the agent.
+            y (float): New ordinate of the agent.
+
+        Raises:
+            EnvironmentException: If agent is not in the environment.
+        """
+        with self._lock:
+            self._move_agent(agent_id, x, y)
+
+    def _move_agent(self, agent_id: str, x: float, y: float) -> None:
+        """Move an agent already placed in the environment. Lock must be
+        held.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            x (float): New abscissa of the agent.
+            y (float): New ordinate of the agent.
+
+        Raises:
+            EnvironmentException: If agent is not in the environment.
+        """
+        if agent_id not in self._positions:
+            raise EnvironmentException(
+                f"Agent {agent_id} is not in the environment."
+            )
+        self._positions[agent_id] = (x, y)
+        cell: Cell = self._get_cell(x, y)
+        old_cell: Cell = self._agent_cells[agent_id]
+        if cell == old_cell:
+            return
+        agents: Set[str] = self._cells[old_cell]
+        agents.discard(agent_id)
+        if not agents:
+            del self._cells[old_cell]
+        self._agent_cells[agent_id] = cell
+        self._cells.setdefault(cell, set()).add(agent_id)
+
+    def update_positions(self, positions: Mapping[str, Position]) -> None:
+        """Move several agents at once, typically once per tick.
+
+        Agents which are not in the environment yet are added. The lock is
+        taken once for all the agents.
+
+        Args:
+            positions (Mapping[str, Position]): New positions indexed by
+                agent identifier.
+        """
+        with self._lock:
+            for agent_id, (x, y) in positions.items():
+                if agent_id in self._positions:
+                    self._move_agent(agent_id, x, y)
+                else:
+                    self._add_agent(agent_id, x, y)
+
+    def _get_cells_around(self, cell: Cell, distance: int) -> Iterable[Cell]:
+        """Get the occupied cells at a given Chebyshev distance of a cell.
+
+        Args:
+            cell (Cell): The central cell.
+            distance (int): The distance in number of cells.
+
+        Returns:
+            Iterable[Cell]: The occupied cells of the ring.
+        """
+        cell_x, cell_y = cell
+        if not distance:
+            return [cell] if cell in self._cells else []
+        ring: List[Cell] = []
+        for offset in range(-distance, distance + 1):
+            ring.append((cell_x + offset, cell_y - distance))
+            ring.append((cell_x + offset, cell_y + distance))
+        for offset in range(-distance + 1, distance):
+            ring.append((cell_x - distance, cell_y + offset))
+            ring.append((cell_x + distance, cell_y + offset))
+        return [ring_cell for ring_cell in ring if ring_cell in self._cells]
+
+    def _get_cells_between(self, min_cell: Cell, max_cell: Cell) -> List[Cell]:
+        """Get the occupied cells of a rectangle of cells.
+
+        Args:
+            min_cell (Cell): The bottom left cell of the rectangle.
+            max_cell (Cell): The top right cell of the rectangle.
+
+        Returns:
+            List[Cell]: The occupied cells of the rectangle.
+        """
+        min_x, min_y = min_cell
+        max_x, max_y = max_cell
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._cells):
+            return [
+                cell
+                for cell in self._cells
+                if min_x <= cell[0] <= max_x and min_y <= cell[1] <= max_y
+            ]
+        return [
+            (cell_x, cell_y)
+            for cell_x in range(min_x, max_x + 1)
+            for cell_y in range(min_y, max_y + 1)
+            if (cell_x, cell_y) in self._cells
+        ]
+
+    def get_neighbours(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        exclude: Optional[str] = None,
+    ) -> List[str]:
+        """Get the agents within a radius of a position.
+
+        Args:
+            x (float): Abscissa of the position.
+            y (float): Ordinate of the position.
+            radius (float): The radius of the query.
+            exclude (Optional[str], optional): Identifier of an agent to
+                ignore, usually the one performing the query. Defaults to
+                None.
+
+        Returns:
+            List[str]: The identifiers of the agents found.
+        """
+        square_radius: float = radius * radius
+        neighbours: List[str] = []
+        with self._lock:
+            for cell in self._get_cells_between(
+                self._get_cell(x - radius, y - radius),
+                self._get_cell(x + radius, y + radius),
+            ):
+                for agent_id in self._cells[cell]:
+                    agent_x, agent_y = self._positions[agent_id]
+                    if (
+                        agent_id != exclude
+                        and (agent_x - x) ** 2 + (agent_y - y) ** 2
+                        <= square_radius
+                    ):
+                        neighbours.append(agent_id)
+        return neighbours
+
+    def get_nearest(
+        self, x: float, y: float, k: int = 1, exclude: Optional[str] = None
+    ) -> List[str]:
+        """Get the k nearest agents of a position, nearest first.
+
+        Args:
+            x (float): Abscissa of the position.
+            y (float): Ordinate of the position.
+            k (int, optional): Number of agents to get. Defaults to 1.
+            exclude (Optional[str], optional): Identifier of an agent to
+                ignore, usually the one performing the query. Defaults to
+                None.
+
+        Returns:
+            List[str]: The identifiers of the agents found.
+        """
+        with self._lock:
+            return self._get_nearest(x, y, k, exclude)
+
+    def _get_nearest(
+        self, x: float, y: float, k: int, exclude: Optional[str]
+    ) -> List[str]:
+        """Get the k nearest agents of a position. Lock must be held.
+
+        Args:
+            x (float): Abscissa of the position.
+            y (float): Ordinate of the position.
+            k (int): Number of agents to get.
+            exclude (Optional[str]): Identifier of an agent to ignore.
+
+        Returns:
+            List[str]: The identifiers of the agents found, nearest first.
+        """
+        total: int = len(self._positions) - (exclude in self._positions)
+        k = min(k, total)
+        if k <= 0:
+            return []
+        cell: Cell = self._get_cell(x, y)
+        candidates: List[Tuple[float, str]] = []
+        visited: int = 0
+        distance: int = 0
+        while True:
+            if (2 * distance + 1) ** 2 > len(self._cells):
+                # The rings visited more cells than the grid holds: scan it.
+                candidates = [
+                    ((agent_x - x) ** 2 + (agent_y - y) ** 2, agent_id)
+                    for agent_id, (agent_x, agent_y) in self._positions.items()
+                    if agent_id != exclude
+                ]
+                break
+            for ring_cell in self._get_cells_around(cell, distance):
+                for agent_id in self._cells[ring_cell]:
+                    if agent_id == exclude:
+                        continue
+                    agent_x, agent_y = self._positions[agent_id]
+                    candidates.append(
+                        ((agent_x - x) ** 2 + (agent_y - y) ** 2, agent_id)
+                    )
+                    visited += 1
+            if visited == total:
+                break
+            if len(candidates) >= k:
+                # Every position closer than ``distance`` cells is covered.
+                covered: float = distance * self._cell_size
+                if nsmallest(k, candidates)[-1][0] <= covered * covered:
+                    break
+            distance += 1
+        return [agent_id for _, agent_id in nsmallest(k, candidates)]
@@ -1,2 +1,18 @@
 class BehaviourException(Exception):
     pass
+
+
+class EnvironmentException(Exception):
+    pass
+
+
+class MessageException(Exception):
+    pass
+
+
+class PlatformException(Exception):
+    pass
+
+
+class TransportException(Exception):
+    pass
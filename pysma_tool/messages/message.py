@@ -0,0 +1,172 @@
+"""Message module"""
+
+from typing import Any, Iterable, Optional, Tuple
+
+from .performative import Performative
+
+
+class Message:
+    """Define Message class, an immutable envelope shared by receivers.
+
+    A published message is never copied: every receiver gets a reference to
+    the same instance, so the content must not be mutated by receivers.
+
+    Attributes:
+        topic (str): The topic of the message.
+        content (Any): The payload of the message. By default is None.
+        sender (str): The identifier of the sender agent. By default is
+            empty.
+        receivers (Tuple[str, ...]): The identifiers of the receiver agents
+            of a direct message. By default is empty.
+        performative (Optional[Performative]): The communicative act of the
+            message. By default is None.
+        conversation_id (Optional[str]): The identifier of the conversation
+            the message belongs to. By default is None.
+        is_control (bool): True for a control message, received before the
+            other messages and never dropped by a full mailbox. By default
+            is False.
+    """
+
+    __slots__ = (
+        "_topic",
+        "_content",
+        "_sender",
+        "_receivers",
+        "_performative",
+        "_conversation_id",
+        "_is_control",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        topic: str,
+        content: Any = None,
+        sender: str = "",
+        receivers: Iterable[str] = (),
+        performative: Optional[Performative] = None,
+        conversation_id: Optional[str] = None,
+        is_control: bool = False,
+    ) -> None:
+        """Instantiate Message class.
+
+        Args:
+            topic (str): The topic of the message.
+            content (Any, optional): The payload of the message. Defaults to
+                None.
+            sender (str, optional): The identifier of the sender agent.
+                Defaults to "".
+            receivers (Iterable[str], optional): The identifiers of the
+                receiver agents of a direct message. Defaults to ().
+            performative (Optional[Performative], optional): The
+                communicative act of the message. Defaults to None.
+            conversation_id (Optional[str], optional): The identifier of the
+                conversation the message belongs to. Defaults to None.
+            is_control (bool, optional): True for a control message.
+                Defaults to False.
+        """
+        self._topic: str = topic
+        self._content: Any = content
+        self._sender: str = sender
+        self._receivers: Tuple[str, ...] = tuple(receivers)
+        self._performative: Optional[Performative] = performative
+        self._conversation_id: Optional[str] = conversation_id
+        self._is_control: bool = is_control
+
+    @property
+    def topic(self) -> str:
+        """The topic of the message."""
+        return self._topic
+
+    @property
+    def content(self) -> Any:
+        """The payload of the message."""
+        return self._content
+
+    @property
+    def sender(self) -> str:
+        """The identifier of the sender agent."""
+        return self._sender
+
+    @property
+    def receivers(self) -> Tuple[str, ...]:
+        """The identifiers of the receiver agents of a direct message."""
+        return self._receivers
+
+    @property
+    def performative(self) -> Optional[Performative]:
+        """The communicative act of the message."""
+        return self._performative
+
+    @property
+    def conversation_id(self) -> Optional[str]:
+        """The identifier of the conversation the message belongs to."""
+        return self._conversation_id
+
+    @property
+    def is_control(self) -> bool:
+        """True for a control message."""
+        return self._is_control
+
+    def match(
+        self,
+        topic: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        performative: Optional[Performative] = None,
+    ) -> bool:
+        """Check if the message matches a template.
+
+        Args:
+            topic (Optional[str], optional): The expected topic, None
+                matches any topic. Defaults to None.
+            conversation_id (Optional[str], optional): The expected
+                conversation, None matches any conversation. Defaults to
+                None.
+            performative (Optional[Performative], optional): The expected
+                performative, None matches any performative. Defaults to
+                None.
+
+        Returns:
+            bool: True if the message matches every given field.
+        """
+        if topic is not None and self._topic != topic:
+            return False
+        if (
+            conversation_id is not None
+            and self._conversation_id != conversation_id
+        ):
+            return False
+        return performative is None or self._performative == performative
+
+    def create_reply(
+        self, performative: Performative, content: Any = None, sender: str = ""
+    ) -> "Message":
+        """Create a reply to the sender in the same conversation, a control
+        message if this one is.
+
+        Args:
+            performative (Performative): The communicative act of the reply.
+            content (Any, optional): The payload of the reply. Defaults to
+                None.
+            sender (str, optional): The identifier of the replying agent.
+                Defaults to "".
+
+        Returns:
+            Message: The reply.
+        """
+        return Message(
+            self._topic,
+            content,
+            sender,
+            (self._sender,),
+            performative,
+            self._conversation_id,
+            self._is_control,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Message(topic={self._topic!r}, content={self._content!r}, "
+            f"sender={self._sender!r}, receivers={self._receivers!r}, "
+            f"performative={self._performative}, "
+            f"conversation_id={self._conversation_id!r})"
+        )
@@ -0,0 +1,388 @@
+"""Message bus module"""
+
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from .message import Message
+from ..exceptions.exceptions import MessageException, TransportException
+
+if TYPE_CHECKING:
+    from ..agent import Agent
+    from ..behaviours.behaviour import Behaviour
+
+WILDCARDS: str = "*?["
+RESOLVED_CACHE_SIZE: int = 1024
+
+Route = Callable[[str, Message], None]
+
+
+class MessageBus:
+    """Define MessageBus class, a topic based publish/subscribe bus.
+
+    Behaviours subscribe to an exact topic or to a wildcard pattern
+    (``fnmatch`` syntax, e.g. ``"sensor.*"``). Publishing a message puts the
+    same Message instance in the mailbox of each subscriber agent, which
+    restarts its behaviours waiting for a message (see
+    Behaviour.wait_message). The subscriptions of a behaviour are dropped
+    when it finishes and is removed from its agent, and the subscriptions of
+    an agent when it is deleted or deregistered.
+
+    The bus is also the directory of its agents, used to deliver direct
+    messages to their receivers. Messages for agents which are not local
+    are handed to a route (e.g. to another process), and messages for a
+    migrating agent are held until it is registered again or routed.
+
+    Attributes:
+        default_route (Optional[Route]): Route of the messages for unknown
+            agents. By default is None, these messages are dropped.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate MessageBus class."""
+        self._lock: Lock = Lock()
+        self._topic_subscribers: Dict[str, List["Behaviour"]] = {}
+        self._pattern_subscribers: Dict[str, List["Behaviour"]] = {}
+        self._resolved: "OrderedDict[str, Tuple[Behaviour, ...]]" = (
+            OrderedDict()
+        )
+        self._agents: Dict[str, "Agent"] = {}
+        self._routes: Dict[str, Route] = {}
+        self._held: Dict[str, List[Message]] = {}
+        self._default_route: Optional[Route] = None
+
+    @property
+    def default_route(self) -> Optional[Route]:
+        """Route of the messages for unknown agents."""
+        return self._default_route
+
+    @default_route.setter
+    def default_route(self, default_route: Optional[Route]) -> None:
+        self._default_route = default_route
+
+    def register(self, agent: "Agent") -> None:
+        """Register an agent to receive direct messages.
+
+        Args:
+            agent (Agent): The agent to register.
+
+        Raises:
+            MessageException: If another agent has the same identifier.
+        """
+        with self._lock:
+            registered = self._agents.get(agent.agent_id)
+            if registered is not None and registered is not agent:
+                raise MessageException(
+                    f"Agent {agent.agent_id} is already registered."
+                )
+            self._agents[agent.agent_id] = agent
+            self._routes.pop(agent.agent_id, None)
+            for message in self._held.pop(agent.agent_id, []):
+                agent.post_message(message, True)
+
+    def deregister(self, agent_id: str) -> None:
+        """Deregister an agent and drop the subscriptions of its behaviours.
+
+        Args:
+            agent_id (str): The identifier of the agent to deregister.
+        """
+        with self._lock:
+            agent = self._agents.pop(agent_id, None)
+            if agent is not None:
+                self._remove_subscribers(
+                    lambda behaviour: behaviour.agent is agent
+                )
+
+    def hold(self, agent_id: str) -> None:
+        """Deregister an agent and keep its messages until it is registered
+        again or routed elsewhere.
+
+        Args:
+            agent_id (str): The identifier of the migrating agent.
+        """
+        with self._lock:
+            self._agents.pop(agent_id, None)
+            self._routes.pop(agent_id, None)
+            self._held.setdefault(agent_id, [])
+
+    def set_route(self, agent_id: str, route: Route) -> None:
+        """Route the messages of an agent, starting with the held ones.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            route (Route): The function delivering its messages, called with
+                the agent identifier and the message.
+        """
+        with self._lock:
+            for message in self._held.pop(agent_id, []):
+                route(agent_id, message)
+            self._routes[agent_id] = route
+
+    def remove_route(self, agent_id: str) -> None:
+        """Remove the route of an agent.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+        """
+        with self._lock:
+            self._routes.pop(agent_id, None)
+
+    def get_agent(self, agent_id: str) -> Optional["Agent"]:
+        """Get a registered agent.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+
+        Returns:
+            Optional[Agent]: The agent or None if not registered.
+        """
+        return self._agents.get(agent_id)
+
+    def subscribe(self, behaviour: "Behaviour", topic: str) -> None:
+        """Subscribe a behaviour to a topic or a wildcard pattern.
+
+        Args:
+            behaviour (Behaviour): The subscriber behaviour. It must be added
+                to an agent before messages are published.
+            topic (str): The topic or the wildcard pattern.
+
+        Raises:
+            MessageException: If topic is empty.
+        """
+        if not topic:
+            raise MessageException("The topic must be filled in.")
+        subscribers: Dict[str, List["Behaviour"]] = (
+            self._pattern_subscribers
+            if any(char in topic for char in WILDCARDS)
+            else self._topic_subscribers
+        )
+        with self._lock:
+            behaviours: List["Behaviour"] = subscribers.setdefault(topic, [])
+            if behaviour not in behaviours:
+                behaviours.append(behaviour)
+            self._resolved.clear()
+
+    def unsubscribe(self, behaviour: "Behaviour", topic: str) -> None:
+        """Unsubscribe a behaviour from a topic or a wildcard pattern.
+
+        Args:
+            behaviour (Behaviour): The subscriber behaviour.
+            topic (str): The topic or the wildcard pattern.
+        """
+        with self._lock:
+            for subscribers in (
+                self._topic_subscribers,
+                self._pattern_subscribers,
+            ):
+                behaviours: List["Behaviour"] = subscribers.get(topic, [])
+                if behaviour in behaviours:
+                    behaviours.remove(behaviour)
+                if not behaviours:
+                    subscribers.pop(topic, None)
+            self._resolved.clear()
+
+    def unsubscribe_all(self, behaviour: "Behaviour") -> None:
+        """Unsubscribe a behaviour and its sub behaviours from every topic.
+
+        Args:
+            behaviour (Behaviour): The behaviour, usually a finished one.
+        """
+
+        def is_within(subscriber: Optional["Behaviour"]) -> bool:
+            while subscriber is not None:
+                if subscriber is behaviour:
+                    return True
+                subscriber = subscriber.parent
+            return False
+
+        with self._lock:
+            self._remove_subscribers(is_within)
+
+    def unsubscribe_agent(self, agent: "Agent") -> None:
+        """Unsubscribe all behaviours of an agent from every topic.
+
+        Args:
+            agent (Agent): The agent, usually a deleted one.
+        """
+        with self._lock:
+            self._remove_subscribers(
+                lambda behaviour: behaviour.agent is agent
+            )
+
+    def _remove_subscribers(
+        self, is_removed: Callable[["Behaviour"], bool]
+    ) -> None:
+        """Remove the matching subscribers of every topic. Lock must be
+        held.
+
+        Args:
+            is_removed (Callable[[Behaviour], bool]): True for the
+                subscribers to remove.
+        """
+        for subscribers in (
+            self._topic_subscribers,
+            self._pattern_subscribers,
+        ):
+            for topic, behaviours in list(subscribers.items()):
+                kept: List["Behaviour"] = [
+                    behaviour
+                    for behaviour in behaviours
+                    if not is_removed(behaviour)
+                ]
+                if len(kept) == len(behaviours):
+                    continue
+                if kept:
+                    subscribers[topic] = kept
+                else:
+                    del subscribers[topic]
+                self._resolved.clear()
+
+    def is_subscriber(self, agent: "Agent") -> bool:
+        """Check if a behaviour of an agent is subscribed to a topic.
+
+        Args:
+            agent (Agent): The agent.
+
+        Returns:
+            bool: True if one of its behaviours is a subscriber.
+        """
+        with self._lock:
+            return any(
+                behaviour.agent is agent
+                for subscribers in (
+                    self._topic_subscribers,
+                    self._pattern_subscribers,
+                )
+                for behaviours in subscribers.values()
+                for behaviour in behaviours
+            )
+
+    def get_subscribers(self, topic: str) -> Tuple["Behaviour", ...]:
+        """Get the behaviours subscribed to a topic.
+
+        When wildcard patterns are subscribed, the result is cached until
+        the next subscription change, so the patterns are matched once per
+        topic and not once per message. The cache keeps the
+        RESOLVED_CACHE_SIZE most recently published topics.
+
+        Args:
+            topic (str): The topic.
+
+        Returns:
+            Tuple[Behaviour, ...]: The subscriber behaviours.
+        """
+        with self._lock:
+            if not self._pattern_subscribers:
+                return tuple(self._topic_subscribers.get(topic, ()))
+            resolved = self._resolved.get(topic)
+            if resolved is not None:
+                self._resolved.move_to_end(topic)
+                return resolved
+            behaviours: List["Behaviour"] = list(
+                self._topic_subscribers.get(topic, [])
+            )
+            for pattern, subscribers in self._pattern_subscribers.items():
+                if fnmatchcase(topic, pattern):
+                    behaviours.extend(subscribers)
+            resolved = tuple(dict.fromkeys(behaviours))
+            self._resolved[topic] = resolved
+            if len(self._resolved) > RESOLVED_CACHE_SIZE:
+                self._resolved.popitem(last=False)
+        return resolved
+
+    def publish(
+        self, topic: str, content: Any = None, sender: str = ""
+    ) -> int:
+        """Publish a message to all subscribers of a topic.
+
+        Each subscriber agent receives the message once, even if several of
+        its behaviours are subscribed. Deleted agents and agents whose full
+        mailbox rejects the message are skipped.
+
+        Args:
+            topic (str): The topic of the message.
+            content (Any, optional): The payload of the message. Defaults to
+                None.
+            sender (str, optional): The identifier of the sender agent.
+                Defaults to "".
+
+        Returns:
+            int: The number of agents which received the message.
+        """
+        message: Message = Message(topic, content, sender)
+        delivered: Set[int] = set()
+        for behaviour in self.get_subscribers(topic):
+            agent = behaviour.agent
+            if agent is None or agent.is_deleted or id(agent) in delivered:
+                continue
+            try:
+                agent.post_message(message)
+            except MessageException:
+                continue
+            delivered.add(id(agent))
+        return len(delivered)
+
+    def send(self, message: Message) -> int:
+        """Deliver a direct message to its receivers.
+
+        Args:
+            message (Message): The message to deliver.
+
+        Returns:
+            int: The number of receivers the message was delivered or
+                routed to. Unknown receivers are ignored.
+        """
+        return sum(
+            self.deliver(receiver, message) for receiver in message.receivers
+        )
+
+    def deliver(
+        self,
+        agent_id: str,
+        message: Message,
+        use_default_route: bool = True,
+    ) -> bool:
+        """Deliver a message to one agent, local, held or routed.
+
+        Args:
+            agent_id (str): The identifier of the receiver agent.
+            message (Message): The message to deliver.
+            use_default_route (bool, optional): False to drop the message
+                instead of using the default route, e.g. for a message which
+                already comes from it. Defaults to True.
+
+        Returns:
+            bool: False if the agent is unknown and there is no default
+                route, or if its route failed (e.g. a lost connection).
+        """
+        agent = self._agents.get(agent_id)
+        if agent is not None and agent.post_message(message):
+            return True
+        with self._lock:
+            agent = self._agents.get(agent_id)
+            if agent is not None and agent.post_message(message):
+                return True
+            held: Optional[List[Message]] = self._held.get(agent_id)
+            if held is not None:
+                held.append(message)
+                return True
+            route: Optional[Route] = self._routes.get(
+                agent_id, self._default_route if use_default_route else None
+            )
+        if route is None:
+            return False
+        try:
+            route(agent_id, message)
+        except (OSError, TransportException):
+            return False
+        return True
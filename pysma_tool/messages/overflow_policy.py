@@ -0,0 +1,12 @@
+"""Overflow policy enum module"""
+
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """Define what a full Agent mailbox does with a new message."""
+
+    BLOCK = 0
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+    REJECT = 3
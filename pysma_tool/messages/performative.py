@@ -0,0 +1,16 @@
+"""Performative enum module"""
+
+from enum import Enum
+
+
+class Performative(Enum):
+    """Define communicative act of a Message."""
+
+    INFORM = 0
+    REQUEST = 1
+    CFP = 2
+    PROPOSE = 3
+    REFUSE = 4
+    ACCEPT_PROPOSAL = 5
+    REJECT_PROPOSAL = 6
+    FAILURE = 7
@@ -0,0 +1,668 @@
+"""Platform module"""
+
+from collections import deque
+from datetime import datetime, timedelta
+from heapq import heapify, heappop, heappush
+from itertools import count
+from logging import Logger, getLogger
+from pickle import dumps, loads
+from threading import Condition, Thread, current_thread
+from time import perf_counter
+from typing import (
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from .agent import Agent
+from .agent_storage import AgentStorage
+from .exceptions.exceptions import PlatformException
+from .messages.message_bus import MessageBus
+
+if TYPE_CHECKING:
+    from .worker_process import WorkerProcess
+
+IDLE: int = 0
+READY: int = 1
+RUNNING: int = 2
+MIGRATING: int = 3
+MIN_STALE_TIMERS: int = 64
+LOGGER: Logger = getLogger(__name__)
+
+
+class Worker(Thread):
+    """Define Worker class, a thread of the platform running agents.
+
+    Attributes:
+        run_queue (Deque[Agent]): The ready agents of the worker.
+        steps (int): Number of agent steps run by the worker.
+        steals (int): Number of agents stolen from other workers.
+        busy_time (float): Seconds spent running agents.
+    """
+
+    def __init__(self, platform: "Platform", index: int) -> None:
+        """Instantiate Worker class.
+
+        Args:
+            platform (Platform): The platform owning the worker.
+            index (int): The index of the worker in the platform.
+        """
+        super().__init__(name=f"pysma-worker-{index}", daemon=True)
+        self._platform: "Platform" = platform
+        self._run_queue: Deque[Agent] = deque()
+        self._steps: int = 0
+        self._steals: int = 0
+        self._busy_time: float = 0.0
+        self._start_time: float = perf_counter()
+
+    @property
+    def run_queue(self) -> Deque[Agent]:
+        """The ready agents of the worker."""
+        return self._run_queue
+
+    @property
+    def steps(self) -> int:
+        """Number of agent steps run by the worker."""
+        return self._steps
+
+    @property
+    def steals(self) -> int:
+        """Number of agents stolen from other workers."""
+        return self._steals
+
+    @property
+    def busy_time(self) -> float:
+        """Seconds spent running agents."""
+        return self._busy_time
+
+    @property
+    def utilization(self) -> float:
+        """Ratio of time spent running agents since the worker started."""
+        elapsed: float = perf_counter() - self._start_time
+        return self._busy_time / elapsed if elapsed > 0 else 0.0
+
+    def start(self) -> None:
+        self._start_time = perf_counter()
+        super().start()
+
+    def run(self) -> None:
+        """Run the agents of the queue, steal some when it is empty."""
+        while True:
+            agent_and_stolen = self._platform.get_next_agent(self)
+            if agent_and_stolen is None:
+                return
+            agent, stolen = agent_and_stolen
+            if stolen:
+                self._steals += 1
+            start: float = perf_counter()
+            self._platform.run_agent(agent)
+            self._busy_time += perf_counter() - start
+            self._steps += 1
+
+
+class Platform:
+    """Define Platform class, running agents on a pool of worker threads.
+
+    Each worker has its own queue of ready agents. An agent is put back in
+    the queue of the worker which ran it, and idle workers steal agents from
+    the busiest queue, so a few slow agents do not leave other workers idle.
+    An agent is run by one worker at a time, so its behaviours stay serial.
+    Agents whose behaviours are all blocked leave the queues until a
+    behaviour is restarted or a restart date is reached. Agents blocked
+    longer than the hibernation delay also move their state to the storage
+    until they run again.
+
+    Attributes:
+        message_bus (MessageBus): The message bus of the platform agents.
+        workers (List[Worker]): The worker threads.
+        agents (Dict[str, Agent]): The running agents indexed by identifier.
+        storage (AgentStorage): The storage of the hibernated agents.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        message_bus: Optional[MessageBus] = None,
+        hibernate_after: int = 0,
+        storage: Optional[AgentStorage] = None,
+    ) -> None:
+        """Instantiate Platform class.
+
+        Args:
+            workers (int, optional): Number of worker threads. Defaults to 4.
+            message_bus (Optional[MessageBus], optional): The message bus of
+                the platform agents. Defaults to a new message bus.
+            hibernate_after (int, optional): Number of milliseconds an agent
+                stays blocked before it hibernates. Defaults to 0, agents
+                never hibernate.
+            storage (Optional[AgentStorage], optional): The storage of the
+                hibernated agents. Defaults to an in memory storage.
+
+        Raises:
+            PlatformException: If there is no worker.
+        """
+        if workers < 1:
+            raise PlatformException("The platform needs at least one worker.")
+        self._message_bus: MessageBus = message_bus or MessageBus()
+        self._condition: Condition = Condition()
+        self._workers: List[Worker] = [
+            Worker(self, index) for index in range(workers)
+        ]
+        self._agents: Dict[str, Agent] = {}
+        self._agent_states: Dict[str, int] = {}
+        self._pending_wakes: Set[str] = set()
+        self._migrating: Set[str] = set()
+        self._setup_done: Set[str] = set()
+        self._hibernate_after: int = hibernate_after
+        self._storage: AgentStorage = (
+            storage if storage is not None else AgentStorage()
+        )
+        self._restart_timers: Dict[str, Tuple[datetime, int]] = {}
+        self._hibernation_timers: Dict[str, int] = {}
+        self._hibernating: Set[str] = set()
+        self._timers: List[Tuple[datetime, int, Agent, bool]] = []
+        self._timer_sequence: Iterator[int] = count()
+        self._next_worker: Iterator[int] = count()
+        self._is_running: bool = False
+
+    @property
+    def message_bus(self) -> MessageBus:
+        """The message bus of the platform agents."""
+        return self._message_bus
+
+    @property
+    def workers(self) -> List[Worker]:
+        """The worker threads."""
+        return self._workers
+
+    @property
+    def agents(self) -> Dict[str, Agent]:
+        """The running agents indexed by identifier."""
+        return self._agents
+
+    @property
+    def storage(self) -> AgentStorage:
+        """The storage of the hibernated agents."""
+        return self._storage
+
+    def get_utilization(self) -> List[float]:
+        """Get the utilization ratio of each worker.
+
+        Returns:
+            List[float]: Ratio of time spent running agents, per worker.
+        """
+        return [worker.utilization for worker in self._workers]
+
+    def add_agent(self, agent: Agent) -> None:
+        """Add an agent to the platform and schedule it.
+
+        Args:
+            agent (Agent): The agent to add.
+
+        Raises:
+            PlatformException: If an agent with the same identifier runs on
+                the platform.
+        """
+        self._add_agent(agent, False)
+
+    def _add_agent(self, agent: Agent, is_setup: bool) -> None:
+        """Add an agent to the platform and schedule it.
+
+        Args:
+            agent (Agent): The agent to add.
+            is_setup (bool): True if setup method of the agent has already
+                been called, on another platform.
+
+        Raises:
+            PlatformException: If an agent with the same identifier runs on
+                the platform.
+        """
+        with self._condition:
+            if agent.agent_id in self._agents:
+                raise PlatformException(
+                    f"Agent {agent.agent_id} is already on the platform."
+                )
+            self._agents[agent.agent_id] = agent
+            self._agent_states[agent.agent_id] = IDLE
+            if is_setup:
+                self._setup_done.add(agent.agent_id)
+        agent.message_bus = self._message_bus
+        agent.platform = self
+        self.schedule(agent)
+
+    def schedule(self, agent: Agent) -> None:
+        """Put an agent in a run queue, or mark it to run again.
+
+        Args:
+            agent (Agent): The agent to schedule.
+        """
+        with self._condition:
+            state: Optional[int] = self._agent_states.get(agent.agent_id)
+            if state == RUNNING:
+                self._pending_wakes.add(agent.agent_id)
+            elif state == IDLE:
+                self._enqueue(agent, self._get_current_worker())
+
+    def _get_current_worker(self) -> Worker:
+        """Get the worker of the current thread, or the next one in turn.
+
+        Returns:
+            Worker: The worker which will run the agent.
+        """
+        thread: Thread = current_thread()
+        if isinstance(thread, Worker) and thread in self._workers:
+            return thread
+        return self._workers[next(self._next_worker) % len(self._workers)]
+
+    def _enqueue(self, agent: Agent, worker: Worker) -> None:
+        """Put an agent in the run queue of a worker. Lock must be held.
+
+        Args:
+            agent (Agent): The ready agent.
+            worker (Worker): The worker.
+        """
+        self._agent_states[agent.agent_id] = READY
+        self._hibernation_timers.pop(agent.agent_id, None)
+        worker.run_queue.append(agent)
+        self._condition.notify()
+
+    def _wake_timers(self) -> Optional[float]:
+        """Schedule the agents whose restart date or hibernation date is
+        reached. Lock must be held.
+
+        Returns:
+            Optional[float]: Seconds before the next restart date, None if
+                there is none.
+        """
+        now: datetime = datetime.now()
+        while self._timers and self._timers[0][0] <= now:
+            _, sequence, agent, is_hibernation = heappop(self._timers)
+            if not self._is_timer_alive(
+                agent.agent_id, sequence, is_hibernation
+            ):
+                continue
+            if is_hibernation:
+                del self._hibernation_timers[agent.agent_id]
+            else:
+                del self._restart_timers[agent.agent_id]
+            if self._agent_states.get(agent.agent_id) != IDLE:
+                continue
+            self._enqueue(agent, self._get_current_worker())
+            if is_hibernation:
+                self._hibernating.add(agent.agent_id)
+        if not self._timers:
+            return None
+        return (self._timers[0][0] - now).total_seconds()
+
+    def _is_timer_alive(
+        self, agent_id: str, sequence: int, is_hibernation: bool
+    ) -> bool:
+        """Get a timer is the last one set for an agent. Lock must be held.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            sequence (int): The sequence number of the timer.
+            is_hibernation (bool): True for a hibernation timer.
+
+        Returns:
+            bool: False if the timer is stale.
+        """
+        if is_hibernation:
+            return self._hibernation_timers.get(agent_id) == sequence
+        restart_timer: Optional[Tuple[datetime, int]] = (
+            self._restart_timers.get(agent_id)
+        )
+        return restart_timer is not None and restart_timer[1] == sequence
+
+    def _push_timer(
+        self, date: datetime, agent: Agent, is_hibernation: bool
+    ) -> int:
+        """Add a timer to the heap, removing the stale timers once they
+        outnumber the alive ones. Lock must be held.
+
+        Args:
+            date (datetime): The date the timer fires.
+            agent (Agent): The agent to schedule.
+            is_hibernation (bool): True for a hibernation timer.
+
+        Returns:
+            int: The sequence number of the timer.
+        """
+        sequence: int = next(self._timer_sequence)
+        heappush(self._timers, (date, sequence, agent, is_hibernation))
+        alive: int = len(self._restart_timers) + len(self._hibernation_timers)
+        if len(self._timers) > 2 * alive + MIN_STALE_TIMERS:
+            self._timers = [
+                timer
+                for timer in self._timers
+                if self._is_timer_alive(timer[2].agent_id, timer[1], timer[3])
+                or timer[1] == sequence
+            ]
+            heapify(self._timers)
+        self._condition.notify()
+        return sequence
+
+    def get_next_agent(self, worker: Worker) -> Optional[Tuple[Agent, bool]]:
+        """Get the next agent to run by a worker, waiting if there is none.
+
+        The worker takes the oldest agent of its own queue, else steals the
+        newest agent of the busiest queue.
+
+        Args:
+            worker (Worker): The worker asking for an agent.
+
+        Returns:
+            Optional[Tuple[Agent, bool]]: The agent and True if it was
+                stolen, or None if the platform is stopped.
+        """
+        with self._condition:
+            while self._is_running:
+                timeout: Optional[float] = self._wake_timers()
+                agent: Optional[Agent] = None
+                stolen: bool = False
+                if worker.run_queue:
+                    agent = worker.run_queue.popleft()
+                else:
+                    victim: Worker = max(
+                        self._workers, key=lambda other: len(other.run_queue)
+                    )
+                    if victim.run_queue:
+                        agent = victim.run_queue.pop()
+                        stolen = True
+                if agent is not None:
+                    self._agent_states[agent.agent_id] = RUNNING
+                    return agent, stolen
+                self._condition.wait(timeout)
+        return None
+
+    def run_agent(self, agent: Agent) -> None:
+        """Run one step of an agent then requeue or park it.
+
+        An agent raising an exception is logged and deleted, so the worker
+        goes on running the other agents.
+
+        Args:
+            agent (Agent): The agent picked by the current worker.
+        """
+        agent.rehydrate()
+        if self._hibernate(agent):
+            return
+        try:
+            if agent.agent_id not in self._setup_done:
+                self._setup_done.add(agent.agent_id)
+                agent.setup()
+            if not agent.is_deleted:
+                agent.step()
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Agent %s failed, it is deleted.", agent.agent_id)
+            agent.do_delete()
+        with self._condition:
+            if agent.agent_id in self._migrating:
+                self._agent_states[agent.agent_id] = MIGRATING
+                self._condition.notify_all()
+                return
+            if not agent.is_deleted:
+                self._requeue_or_park(agent)
+                return
+            del self._agent_states[agent.agent_id]
+            self._pending_wakes.discard(agent.agent_id)
+            self._setup_done.discard(agent.agent_id)
+            self._restart_timers.pop(agent.agent_id, None)
+            self._hibernation_timers.pop(agent.agent_id, None)
+        try:
+            agent.take_down()
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Agent %s failed to take down.", agent.agent_id)
+        agent.platform = None
+        agent.message_bus = None
+        with self._condition:
+            del self._agents[agent.agent_id]
+            self._condition.notify_all()
+
+    def _hibernate(self, agent: Agent) -> bool:
+        """Move the state of an agent to the storage if it is still blocked
+        after the hibernation delay.
+
+        Agents with a subscribed behaviour stay in memory, as the message bus
+        references their behaviours, and so do agents whose state can't be
+        serialized.
+
+        Args:
+            agent (Agent): The agent picked by the current worker.
+
+        Returns:
+            bool: True if the agent was not run because it stays blocked.
+        """
+        with self._condition:
+            if agent.agent_id not in self._hibernating:
+                return False
+            self._hibernating.discard(agent.agent_id)
+            if (
+                agent.agent_id in self._pending_wakes
+                or agent.agent_id in self._migrating
+                or agent.is_deleted
+                or not agent.is_idle()
+            ):
+                return False
+        if not self._message_bus.is_subscriber(agent):
+            try:
+                agent.hibernate(self._storage)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        with self._condition:
+            if agent.agent_id in self._migrating:
+                self._agent_states[agent.agent_id] = MIGRATING
+                self._condition.notify_all()
+            elif agent.agent_id in self._pending_wakes:
+                self._pending_wakes.discard(agent.agent_id)
+                self._enqueue(agent, self._get_current_worker())
+            else:
+                self._agent_states[agent.agent_id] = IDLE
+        return True
+
+    def _requeue_or_park(self, agent: Agent) -> None:
+        """Put an agent back in a run queue if it is ready, else park it
+        until its next restart date. Lock must be held.
+
+        Args:
+            agent (Agent): The agent which has just run.
+        """
+        if agent.agent_id in self._pending_wakes or not agent.is_idle():
+            self._pending_wakes.discard(agent.agent_id)
+            self._enqueue(agent, self._get_current_worker())
+            return
+        self._agent_states[agent.agent_id] = IDLE
+        wake_up_date: Optional[datetime] = agent.get_wake_up_date()
+        restart_timer: Optional[Tuple[datetime, int]] = (
+            self._restart_timers.get(agent.agent_id)
+        )
+        if wake_up_date is None:
+            self._restart_timers.pop(agent.agent_id, None)
+        elif restart_timer is None or restart_timer[0] != wake_up_date:
+            self._restart_timers[agent.agent_id] = (
+                wake_up_date,
+                self._push_timer(wake_up_date, agent, False),
+            )
+        if self._hibernate_after:
+            self._hibernation_timers[agent.agent_id] = self._push_timer(
+                datetime.now() + timedelta(milliseconds=self._hibernate_after),
+                agent,
+                True,
+            )
+
+    def emigrate(self, agent_id: str) -> bytes:
+        """Suspend an agent between two steps and serialize it.
+
+        The messages sent to the agent from now on are held by the message
+        bus until the agent is added again (see immigrate method) or routed
+        to its new location. Must not be called by the agent itself.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+
+        Raises:
+            PlatformException: If the agent is not on the platform or can't
+                be serialized. In the latter case, the agent goes on running
+                on the platform.
+
+        Returns:
+            bytes: The serialized agent.
+        """
+        with self._condition:
+            agent: Optional[Agent] = self._agents.get(agent_id)
+            if agent is None:
+                raise PlatformException(
+                    f"Agent {agent_id} is not on the platform."
+                )
+            if self._agent_states[agent_id] == RUNNING:
+                self._migrating.add(agent_id)
+                self._condition.wait_for(
+                    lambda: self._agent_states[agent_id] == MIGRATING
+                )
+                self._migrating.discard(agent_id)
+            is_ready: bool = self._agent_states[agent_id] != IDLE
+            for worker in self._workers:
+                if agent in worker.run_queue:
+                    worker.run_queue.remove(agent)
+            self._agent_states[agent_id] = MIGRATING
+        agent.rehydrate()
+        try:
+            message_count: int = agent.message_count
+            state: bytes = dumps((agent, agent_id in self._setup_done))
+            self._message_bus.hold(agent_id)
+            agent.close_mailbox()
+            if agent.message_count != message_count:
+                state = dumps((agent, agent_id in self._setup_done))
+        except Exception as error:
+            self._cancel_emigration(agent, is_ready)
+            raise PlatformException(
+                f"Agent {agent_id} can't be serialized: {error}"
+            ) from error
+        agent.platform = None
+        with self._condition:
+            del self._agents[agent_id]
+            del self._agent_states[agent_id]
+            self._pending_wakes.discard(agent_id)
+            self._setup_done.discard(agent_id)
+            self._hibernating.discard(agent_id)
+            self._restart_timers.pop(agent_id, None)
+            self._hibernation_timers.pop(agent_id, None)
+            self._condition.notify_all()
+        return state
+
+    def _cancel_emigration(self, agent: Agent, is_ready: bool) -> None:
+        """Resume an agent on the platform after a failed emigration, with
+        the messages held meanwhile.
+
+        Args:
+            agent (Agent): The agent which can't emigrate.
+            is_ready (bool): True if the agent was ready to run.
+        """
+        with self._condition:
+            self._agent_states[agent.agent_id] = IDLE
+            if is_ready or agent.agent_id in self._pending_wakes:
+                self._pending_wakes.discard(agent.agent_id)
+                self._enqueue(agent, self._get_current_worker())
+            self._condition.notify_all()
+        agent.open_mailbox()
+        self._message_bus.register(agent)
+
+    def immigrate(self, state: bytes) -> Agent:
+        """Resume a serialized agent on the platform, without calling its
+        setup method again if it was already called. Its held messages are
+        delivered to it.
+
+        Args:
+            state (bytes): The agent serialized by emigrate method.
+
+        Returns:
+            Agent: The resumed agent.
+        """
+        agent, is_setup = loads(state)
+        self._add_agent(agent, is_setup)
+        return agent
+
+    def migrate(self, agent_id: str, process: "WorkerProcess") -> float:
+        """Move an agent to a worker process.
+
+        Messages sent to the agent on this platform are forwarded to the
+        process.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            process (WorkerProcess): The destination process.
+
+        Raises:
+            PlatformException: If the agent can't be moved. It is then
+                resumed on this platform.
+
+        Returns:
+            float: The pause time of the agent, in milliseconds.
+        """
+        start: float = perf_counter()
+        state: bytes = self.emigrate(agent_id)
+        try:
+            process.immigrate(state)
+        except PlatformException:
+            self.immigrate(state)
+            raise
+        self._message_bus.set_route(agent_id, process.post_message)
+        return (perf_counter() - start) * 1000
+
+    def recall(self, agent_id: str, process: "WorkerProcess") -> float:
+        """Move an agent back from a worker process.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+            process (WorkerProcess): The process running the agent.
+
+        Raises:
+            PlatformException: If the agent can't be moved. It then keeps
+                running in the process, with the messages held meanwhile.
+
+        Returns:
+            float: The pause time of the agent, in milliseconds.
+        """
+        start: float = perf_counter()
+        self._message_bus.hold(agent_id)
+        try:
+            state: bytes = process.emigrate(agent_id)
+        except PlatformException:
+            self._message_bus.set_route(agent_id, process.post_message)
+            raise
+        self.immigrate(state)
+        return (perf_counter() - start) * 1000
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._condition:
+            self._is_running = True
+        for worker in self._workers:
+            worker.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every agent of the platform is deleted.
+
+        Args:
+            timeout (Optional[float], optional): Maximum number of seconds
+                to wait. Defaults to None.
+
+        Returns:
+            bool: True if every agent is deleted.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._agents, timeout)
+
+    def stop(self) -> None:
+        """Stop the worker threads once they finish their current step."""
+        with self._condition:
+            self._is_running = False
+            self._condition.notify_all()
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.join()
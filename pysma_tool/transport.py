@@ -0,0 +1,475 @@
+"""Socket transport module"""
+
+from os import unlink
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from socket import (
+    AF_INET,
+    AF_UNIX,
+    IPPROTO_TCP,
+    SHUT_RDWR,
+    SOCK_STREAM,
+    TCP_NODELAY,
+    socket,
+)
+from struct import Struct
+from threading import Condition, Lock, Thread
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple, Union
+
+from .exceptions.exceptions import MessageException, TransportException
+from .messages.message import Message
+from .messages.message_bus import MessageBus, Route
+
+Address = Union[str, Tuple[str, int]]
+
+HEADER: Struct = Struct("!I")
+RETRY_DELAY: float = 0.01
+MAX_RETRIES: int = 6
+
+
+def _create_socket(address: Address) -> socket:
+    """Create a TCP socket or a Unix domain socket for an address.
+
+    Args:
+        address (Address): A (host, port) tuple or a Unix socket path.
+
+    Returns:
+        socket: The new socket.
+    """
+    if isinstance(address, str):
+        return socket(AF_UNIX, SOCK_STREAM)
+    connection: socket = socket(AF_INET, SOCK_STREAM)
+    connection.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+    return connection
+
+
+class Peer:
+    """Define Peer class, a persistent connection to a remote transport.
+
+    Messages are encoded in frames (4 bytes length then the pickled
+    receiver identifier and message) and appended to a buffer. A writer
+    thread sends the buffer in one call when it reaches the batch size or
+    when the oldest frame has waited the flush interval. Senders block
+    while the buffer holds more than the pending limit.
+
+    When a send fails, the frames not fully sent go back to the front of
+    the buffer and are sent again on a new connection, after a delay
+    doubled on each consecutive failure. After MAX_RETRIES failures the
+    peer is declared dead: its buffered messages are dropped, senders get
+    a TransportException and the writer thread stops. The transport then
+    replaces the dead peer on next use (see SocketTransport.get_peer).
+
+    Attributes:
+        address (Address): The address of the remote transport.
+        messages_sent (int): Number of messages sent.
+        batches_sent (int): Number of batches sent.
+        messages_dropped (int): Number of messages dropped because the
+            peer is dead.
+        is_dead (bool): True if the remote transport is unreachable.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        batch_size: int = 65536,
+        flush_interval: float = 1.0,
+        max_pending: int = 4194304,
+    ) -> None:
+        """Instantiate Peer class.
+
+        Args:
+            address (Address): The address of the remote transport.
+            batch_size (int, optional): Number of bytes which triggers a
+                send. Defaults to 65536.
+            flush_interval (float, optional): Maximum number of milliseconds
+                a message waits in the buffer. Defaults to 1.0.
+            max_pending (int, optional): Number of buffered bytes above
+                which senders are blocked. Defaults to 4194304.
+        """
+        self._address: Address = address
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval / 1000
+        self._max_pending: int = max_pending
+        self._buffer: bytearray = bytearray()
+        self._first_frame_time: float = 0.0
+        self._condition: Condition = Condition()
+        self._socket: Optional[socket] = None
+        self._is_closed: bool = False
+        self._messages_sent: int = 0
+        self._batches_sent: int = 0
+        self._pending_messages: int = 0
+        self._messages_dropped: int = 0
+        self._is_dead: bool = False
+        self._writer: Thread = Thread(target=self._write, daemon=True)
+        self._writer.start()
+
+    @property
+    def address(self) -> Address:
+        """The address of the remote transport."""
+        return self._address
+
+    @property
+    def messages_sent(self) -> int:
+        """Number of messages sent."""
+        return self._messages_sent
+
+    @property
+    def batches_sent(self) -> int:
+        """Number of batches sent."""
+        return self._batches_sent
+
+    @property
+    def messages_dropped(self) -> int:
+        """Number of messages dropped because the peer is dead."""
+        return self._messages_dropped
+
+    @property
+    def is_dead(self) -> bool:
+        """True if the remote transport is unreachable."""
+        return self._is_dead
+
+    def send(self, agent_id: str, message: Message) -> None:
+        """Buffer a message for a remote agent, used as message bus route.
+
+        Args:
+            agent_id (str): The identifier of the receiver agent.
+            message (Message): The message.
+
+        Raises:
+            TransportException: If the peer is closed or dead.
+        """
+        payload: bytes = dumps((agent_id, message), HIGHEST_PROTOCOL)
+        with self._condition:
+            self._condition.wait_for(
+                lambda: len(self._buffer) < self._max_pending
+                or self._is_closed
+                or self._is_dead
+            )
+            if self._is_dead:
+                raise TransportException(
+                    f"Connection to {self._address} is lost."
+                )
+            if self._is_closed:
+                raise TransportException(
+                    f"Connection to {self._address} is closed."
+                )
+            if not self._buffer:
+                self._first_frame_time = monotonic()
+                self._condition.notify_all()
+            self._buffer += HEADER.pack(len(payload))
+            self._buffer += payload
+            self._pending_messages += 1
+            if len(self._buffer) >= self._batch_size:
+                self._condition.notify_all()
+
+    def _get_batch(self) -> Optional[Tuple[bytearray, int]]:
+        """Wait for a batch to send.
+
+        Returns:
+            Optional[Tuple[bytearray, int]]: The batch and its number of
+                messages, or None if the peer is closed and flushed.
+        """
+        with self._condition:
+            while True:
+                if not self._buffer:
+                    if self._is_closed or self._is_dead:
+                        return None
+                    self._condition.wait()
+                    continue
+                remaining: float = (
+                    self._first_frame_time + self._flush_interval - monotonic()
+                )
+                if (
+                    self._is_closed
+                    or remaining <= 0
+                    or len(self._buffer) >= self._batch_size
+                ):
+                    break
+                self._condition.wait(remaining)
+            batch: Tuple[bytearray, int] = (
+                self._buffer,
+                self._pending_messages,
+            )
+            self._buffer = bytearray()
+            self._pending_messages = 0
+            self._condition.notify_all()
+            return batch
+
+    def _send_batch(self, batch: bytearray) -> int:
+        """Send a batch, connecting first if needed.
+
+        Args:
+            batch (bytearray): The frames to send.
+
+        Returns:
+            int: Number of bytes sent, less than the batch size if the
+                connection failed.
+        """
+        sent: int = 0
+        try:
+            if self._socket is None:
+                self._socket = _create_socket(self._address)
+                self._socket.connect(self._address)
+            with memoryview(batch) as view:
+                while sent < len(batch):
+                    sent += self._socket.send(view[sent:])
+        except OSError:
+            if self._socket is not None:
+                self._socket.close()
+            self._socket = None
+        return sent
+
+    def _retry(self, batch: bytearray, messages: int, failures: int) -> None:
+        """Put the frames of a batch which are not fully sent back to the
+        front of the buffer, or drop every buffered message once the peer
+        failed too many times.
+
+        Args:
+            batch (bytearray): The frames not fully sent.
+            messages (int): Number of messages of the frames.
+            failures (int): Number of consecutive failed sends.
+        """
+        with self._condition:
+            if failures > MAX_RETRIES:
+                self._is_dead = True
+                self._messages_dropped += messages + self._pending_messages
+                self._buffer = bytearray()
+                self._pending_messages = 0
+            else:
+                if not self._buffer:
+                    self._first_frame_time = monotonic()
+                self._buffer[:0] = batch
+                self._pending_messages += messages
+            self._condition.notify_all()
+
+    def _write(self) -> None:
+        """Send the batches, connecting again after a failure."""
+        failures: int = 0
+        batch: Optional[Tuple[bytearray, int]] = self._get_batch()
+        while batch is not None:
+            frames, messages = batch
+            sent: int = self._send_batch(frames)
+            if sent == len(frames):
+                failures = 0
+                self._messages_sent += messages
+                self._batches_sent += 1
+            else:
+                failures += 1
+                offset: int = 0
+                while offset + HEADER.size <= sent:
+                    (length,) = HEADER.unpack_from(frames, offset)
+                    if offset + HEADER.size + length > sent:
+                        break
+                    offset += HEADER.size + length
+                    self._messages_sent += 1
+                    messages -= 1
+                self._retry(frames[offset:], messages, failures)
+                if failures <= MAX_RETRIES:
+                    sleep(RETRY_DELAY * 2 ** (failures - 1))
+            batch = self._get_batch()
+        if self._socket is not None:
+            self._socket.close()
+
+    def close(self) -> None:
+        """Send the buffered messages then close the connection."""
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+        self._writer.join()
+
+
+class SocketTransport:
+    """Define SocketTransport class, delivering messages between platforms.
+
+    The transport listens on a TCP address or a Unix domain socket path and
+    delivers the received messages to its message bus. Messages for remote
+    agents are routed to a pooled Peer, one persistent connection per remote
+    address. A dead peer is replaced by a new connection when the next
+    message is routed to its address. Messages are pickled: only connect
+    trusted platforms.
+
+    Attributes:
+        message_bus (MessageBus): The local message bus.
+        address (Address): The listening address, with the real port once
+            started.
+    """
+
+    def __init__(
+        self,
+        message_bus: MessageBus,
+        address: Address = ("127.0.0.1", 0),
+        batch_size: int = 65536,
+        flush_interval: float = 1.0,
+        max_pending: int = 4194304,
+    ) -> None:
+        """Instantiate SocketTransport class.
+
+        Args:
+            message_bus (MessageBus): The local message bus.
+            address (Address, optional): A (host, port) tuple or a Unix
+                socket path to listen on. Defaults to ("127.0.0.1", 0), a
+                free loopback port.
+            batch_size (int, optional): Number of bytes which triggers a
+                send to a peer. Defaults to 65536.
+            flush_interval (float, optional): Maximum number of milliseconds
+                a message waits before being sent. Defaults to 1.0.
+            max_pending (int, optional): Number of bytes buffered for a
+                peer above which senders are blocked. Defaults to 4194304.
+        """
+        self._message_bus: MessageBus = message_bus
+        self._address: Address = address
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._max_pending: int = max_pending
+        self._listener: Optional[socket] = None
+        self._connections: List[socket] = []
+        self._peers: Dict[Address, Peer] = {}
+        self._lock: Lock = Lock()
+
+    @property
+    def message_bus(self) -> MessageBus:
+        """The local message bus."""
+        return self._message_bus
+
+    @property
+    def address(self) -> Address:
+        """The listening address."""
+        return self._address
+
+    @property
+    def peers(self) -> Dict[Address, Peer]:
+        """The connections to remote transports, indexed by address."""
+        return self._peers
+
+    def start(self) -> None:
+        """Listen for remote transports."""
+        self._listener = _create_socket(self._address)
+        self._listener.bind(self._address)
+        self._listener.listen()
+        self._address = self._listener.getsockname()
+        Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        """Accept the connections of remote transports."""
+        while self._listener is not None:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            with self._lock:
+                self._connections.append(connection)
+            Thread(target=self._read, args=(connection,), daemon=True).start()
+
+    def _read(self, connection: socket) -> None:
+        """Decode the frames of a connection and deliver their messages.
+
+        Args:
+            connection (socket): The connection of a remote transport.
+        """
+        buffer: bytearray = bytearray()
+        with connection:
+            while True:
+                try:
+                    chunk: bytes = connection.recv(self._batch_size)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                buffer += chunk
+                offset: int = 0
+                while len(buffer) - offset >= HEADER.size:
+                    (length,) = HEADER.unpack_from(buffer, offset)
+                    start: int = offset + HEADER.size
+                    end: int = start + length
+                    if end > len(buffer):
+                        break
+                    agent_id, message = loads(memoryview(buffer)[start:end])
+                    try:
+                        self._message_bus.deliver(agent_id, message, False)
+                    except MessageException:
+                        pass
+                    offset = end
+                del buffer[:offset]
+
+    def get_peer(self, address: Address) -> Peer:
+        """Get the pooled connection to a remote transport.
+
+        Args:
+            address (Address): The address of the remote transport.
+
+        Returns:
+            Peer: The connection, created on first use or when the previous
+                one is dead.
+        """
+        with self._lock:
+            peer: Optional[Peer] = self._peers.get(address)
+            if peer is None or peer.is_dead:
+                peer = Peer(
+                    address,
+                    self._batch_size,
+                    self._flush_interval,
+                    self._max_pending,
+                )
+                self._peers[address] = peer
+            return peer
+
+    def _get_route(self, address: Address) -> Route:
+        """Get the route sending messages to a remote transport through its
+        current peer.
+
+        Args:
+            address (Address): The address of the remote transport.
+
+        Returns:
+            Route: The route, for the message bus.
+        """
+
+        def route(agent_id: str, message: Message) -> None:
+            self.get_peer(address).send(agent_id, message)
+
+        return route
+
+    def add_route(self, agent_id: str, address: Address) -> None:
+        """Route the messages of a remote agent to its transport.
+
+        Args:
+            agent_id (str): The identifier of the remote agent.
+            address (Address): The address of its transport.
+        """
+        self.get_peer(address)
+        self._message_bus.set_route(agent_id, self._get_route(address))
+
+    def set_default_route(self, address: Address) -> None:
+        """Route the messages of unknown agents to a remote transport.
+
+        Args:
+            address (Address): The address of the remote transport.
+        """
+        self.get_peer(address)
+        self._message_bus.default_route = self._get_route(address)
+
+    def stop(self) -> None:
+        """Flush and close the connections, then stop listening."""
+        with self._lock:
+            peers: List[Peer] = list(self._peers.values())
+            self._peers.clear()
+        for peer in peers:
+            peer.close()
+        if self._listener is not None:
+            listener: socket = self._listener
+            self._listener = None
+            try:
+                listener.shutdown(SHUT_RDWR)
+            except OSError:
+                pass
+            listener.close()
+            if isinstance(self._address, str):
+                unlink(self._address)
+        with self._lock:
+            connections: List[socket] = self._connections
+            self._connections = []
+        for connection in connections:
+            try:
+                connection.shutdown(SHUT_RDWR)
+            except OSError:
+                pass
@@ -0,0 +1,210 @@
+"""Worker process module"""
+
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnProcess
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, Optional, Tuple
+
+from .exceptions.exceptions import MessageException, PlatformException
+from .messages.message import Message
+from .messages.message_bus import MessageBus
+from .platform import Platform
+
+MESSAGE: str = "message"
+IMMIGRATE: str = "immigrate"
+EMIGRATE: str = "emigrate"
+STOP: str = "stop"
+REPLY: str = "reply"
+ERROR: str = "error"
+
+
+class _Channel:
+    """Thread safe sending end of a connection."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection: Connection = connection
+        self._lock: Lock = Lock()
+
+    def send(self, command: str, argument: Any = None) -> None:
+        """Send a command and its argument."""
+        with self._lock:
+            self._connection.send((command, argument))
+
+    def send_message(self, agent_id: str, message: Message) -> None:
+        """Send a message for an agent, used as message bus route."""
+        self.send(MESSAGE, (agent_id, message))
+
+
+def _serve(connection: Connection, workers: int) -> None:
+    """Run a platform in the worker process and execute the commands of the
+    parent process.
+
+    Args:
+        connection (Connection): The connection to the parent process.
+        workers (int): Number of worker threads of the platform.
+    """
+    channel: _Channel = _Channel(connection)
+    platform: Platform = Platform(workers)
+    platform.message_bus.default_route = channel.send_message
+    platform.start()
+    while True:
+        command, argument = connection.recv()
+        try:
+            if command == MESSAGE:
+                platform.message_bus.deliver(*argument, False)
+            elif command == IMMIGRATE:
+                platform.immigrate(argument)
+                channel.send(REPLY)
+            elif command == EMIGRATE:
+                state: bytes = platform.emigrate(argument)
+                platform.message_bus.set_route(argument, channel.send_message)
+                channel.send(REPLY, state)
+            elif command == STOP:
+                platform.stop()
+                channel.send(REPLY)
+                return
+        except Exception as error:  # pylint: disable=broad-except
+            if command != MESSAGE:
+                channel.send(ERROR, str(error))
+
+
+class WorkerProcess:
+    """Define WorkerProcess class, a local process running a Platform.
+
+    Agents are moved to and from the process with Platform.migrate and
+    Platform.recall methods. Messages between the process and the parent
+    platform go through the parent message bus.
+
+    Attributes:
+        message_bus (MessageBus): The message bus of the parent platform.
+    """
+
+    def __init__(self, message_bus: MessageBus, workers: int = 1) -> None:
+        """Instantiate WorkerProcess class.
+
+        Args:
+            message_bus (MessageBus): The message bus of the parent
+                platform.
+            workers (int, optional): Number of worker threads of the
+                process platform. Defaults to 1.
+        """
+        self._message_bus: MessageBus = message_bus
+        self._workers: int = workers
+        self._connection: Optional[Connection] = None
+        self._channel: Optional[_Channel] = None
+        self._process: Optional[SpawnProcess] = None
+        self._reader: Optional[Thread] = None
+        self._replies: "Queue[Tuple[str, Any]]" = Queue()
+        self._call_lock: Lock = Lock()
+
+    @property
+    def message_bus(self) -> MessageBus:
+        """The message bus of the parent platform."""
+        return self._message_bus
+
+    def start(self) -> None:
+        """Start the worker process."""
+        context = get_context("spawn")
+        self._connection, child_connection = context.Pipe()
+        self._channel = _Channel(self._connection)
+        self._process = context.Process(
+            target=_serve, args=(child_connection, self._workers), daemon=True
+        )
+        self._process.start()
+        child_connection.close()
+        self._reader = Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self) -> None:
+        """Deliver the messages of the process and collect the replies."""
+        while self._connection is not None:
+            try:
+                command, argument = self._connection.recv()
+            except (EOFError, OSError):
+                self._replies.put((ERROR, "The worker process stopped."))
+                return
+            if command != MESSAGE:
+                self._replies.put((command, argument))
+                continue
+            try:
+                self._message_bus.deliver(*argument)
+            except MessageException:
+                pass
+
+    def _call(self, command: str, argument: Any = None) -> Any:
+        """Send a command to the process and wait for its reply.
+
+        Args:
+            command (str): The command.
+            argument (Any, optional): The argument of the command. Defaults
+                to None.
+
+        Raises:
+            PlatformException: If the process is not started or the command
+                failed.
+
+        Returns:
+            Any: The result of the command.
+        """
+        if self._channel is None:
+            raise PlatformException("The worker process is not started.")
+        with self._call_lock:
+            try:
+                self._channel.send(command, argument)
+            except OSError as error:
+                raise PlatformException(
+                    "The worker process stopped."
+                ) from error
+            status, result = self._replies.get()
+        if status == ERROR:
+            raise PlatformException(result)
+        return result
+
+    def post_message(self, agent_id: str, message: Message) -> None:
+        """Send a message to an agent of the process.
+
+        Args:
+            agent_id (str): The identifier of the receiver agent.
+            message (Message): The message.
+        """
+        if self._channel is not None:
+            self._channel.send_message(agent_id, message)
+
+    def immigrate(self, state: bytes) -> None:
+        """Resume a serialized agent in the process.
+
+        Args:
+            state (bytes): The serialized agent.
+        """
+        self._call(IMMIGRATE, state)
+
+    def emigrate(self, agent_id: str) -> bytes:
+        """Suspend and serialize an agent of the process.
+
+        Args:
+            agent_id (str): The identifier of the agent.
+
+        Returns:
+            bytes: The serialized agent.
+        """
+        return self._call(EMIGRATE, agent_id)
+
+    def stop(self) -> None:
+        """Stop the platform of the process and wait for the process."""
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            self._call(STOP)
+        self._process.join()
+        if self._connection is not None:
+            connection: Connection = self._connection
+            self._connection = None
+            connection.close()
+        if self._reader is not None:
+            self._reader.join()
+        self._replies = Queue()
+        self._channel = None
+        self._process = None
+        self._reader = None
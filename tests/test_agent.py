@@ -0,0 +1,296 @@
+from datetime import datetime
+from threading import Thread
+from time import sleep, time
+import pytest
+
+from pysma_tool.agent import Agent, MAX_DISCARDED_CONVERSATIONS
+from pysma_tool.agent_storage import AgentStorage
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.behaviours.waker_behaviour import WakerBehaviour
+from pysma_tool.exceptions.exceptions import MessageException
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.message_bus import MessageBus
+from pysma_tool.messages.overflow_policy import OverflowPolicy
+from pysma_tool.messages.performative import Performative
+
+
+class MyAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class MyBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        message = self.receive()
+        if message is None:
+            self.wait_message()
+        else:
+            self.data_store.setdefault("received", []).append(message)
+
+
+class PosterBehaviour(CyclicBehaviour):
+    def __init__(self, receiver: Agent, count: int) -> None:
+        super().__init__()
+        self._receiver: Agent = receiver
+        self._count: int = count
+        self.data_store["sent"] = 0
+
+    def action(self) -> None:
+        while self.data_store["sent"] < self._count:
+            try:
+                self._receiver.post_message(Message("news", 2))
+            except MessageException:
+                return
+            self.data_store["sent"] += 1
+
+
+class MyWakerBehaviour(WakerBehaviour):
+    def on_wake(self) -> None:
+        self.data_store["woken_at"] = datetime.now()
+
+
+@pytest.fixture
+def my_agent() -> MyAgent:
+    return MyAgent("agent")
+
+
+class TestReceive:
+    def test_receive_with_template(self, my_agent: MyAgent) -> None:
+        my_agent.post_message(Message("news", 1))
+        my_agent.post_message(
+            Message("news", 2, performative=Performative.INFORM)
+        )
+        my_agent.post_message(Message("news", 3, conversation_id="c1"))
+        assert (
+            my_agent.receive(conversation_id="c1").content == 3
+            and my_agent.receive(performative=Performative.INFORM).content == 2
+            and my_agent.receive("news").content == 1
+            and my_agent.receive() is None
+        )
+
+    def test_discard_conversation(self, my_agent: MyAgent) -> None:
+        my_agent.post_message(Message("news", 1, conversation_id="c1"))
+        my_agent.post_message(Message("news", 2, conversation_id="c2"))
+        my_agent.discard_conversation("c1")
+        my_agent.post_message(Message("news", 3, conversation_id="c1"))
+        for index in range(MAX_DISCARDED_CONVERSATIONS):
+            my_agent.discard_conversation(f"other{index}")
+        my_agent.post_message(Message("news", 4, conversation_id="c1"))
+        assert [message.content for message in my_agent._mailbox] == [2, 4]
+
+
+class TestSend:
+    def test_send_without_message_bus(self, my_agent: MyAgent) -> None:
+        with pytest.raises(MessageException):
+            my_agent.send(Message("news", receivers=["toto"]))
+
+    def test_send(self, my_agent: MyAgent) -> None:
+        message_bus: MessageBus = MessageBus()
+        my_agent.message_bus = message_bus
+        other_agent: MyAgent = MyAgent("other")
+        other_agent.message_bus = message_bus
+        assert (
+            my_agent.send(Message("news", 42, "agent", ["other", "unknown"]))
+            == 1
+            and other_agent.receive().content == 42
+        )
+
+
+class TestWaitMessage:
+    def test_wait_message(self, my_agent: MyAgent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        my_agent.add_behaviour(behaviour)
+        my_agent.step()
+        blocked: bool = behaviour.status == BehaviourStatus.BLOCKED
+        my_agent.post_message(Message("news", 42))
+        assert blocked and behaviour.status == BehaviourStatus.STARTED
+
+    def test_wait_message_after_arrival(self, my_agent: MyAgent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        my_agent.add_behaviour(behaviour)
+        behaviour.receive()
+        my_agent.post_message(Message("news", 42))
+        behaviour.wait_message()
+        assert behaviour.status == BehaviourStatus.STARTED
+
+
+class TestRun:
+    def test_run_sleeps_until_deadline(self, my_agent: MyAgent) -> None:
+        behaviour: MyWakerBehaviour = MyWakerBehaviour(timeout=100)
+        my_agent.add_behaviour(behaviour)
+        start: datetime = datetime.now()
+        my_agent.run()
+        elapsed: float = (
+            behaviour.data_store["woken_at"] - start
+        ).total_seconds()
+        assert 0.1 <= elapsed < 0.2
+
+    def test_run_wakes_on_message(self, my_agent: MyAgent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        my_agent.add_behaviour(behaviour)
+        thread: Thread = Thread(target=my_agent.run)
+        thread.start()
+        my_agent.post_message(Message("news", 42))
+        my_agent.post_message(Message("news", 43))
+        deadline: float = time() + 1
+        while len(behaviour.data_store.get("received", [])) < 2:
+            if time() > deadline:
+                break
+            sleep(0.001)
+        my_agent.do_delete()
+        thread.join(1)
+        assert not thread.is_alive() and [
+            message.content for message in behaviour.data_store["received"]
+        ] == [42, 43]
+
+
+class TestHibernate:
+    def test_hibernate(self, my_agent: MyAgent) -> None:
+        storage: AgentStorage = AgentStorage()
+        my_agent.add_behaviour(MyBehaviour())
+        my_agent.step()
+        my_agent.hibernate(storage)
+        hibernated: bool = my_agent.is_hibernated and (
+            "_behaviours" not in vars(my_agent)
+        )
+        my_agent.rehydrate()
+        behaviour = my_agent._behaviours[0]
+        assert (
+            hibernated
+            and not my_agent.is_hibernated
+            and len(storage) == 0
+            and behaviour.agent is my_agent
+            and behaviour.status == BehaviourStatus.BLOCKED
+        )
+
+    def test_hibernate_with_message(self, my_agent: MyAgent) -> None:
+        my_agent.add_behaviour(MyBehaviour())
+        my_agent.step()
+        my_agent.hibernate(AgentStorage())
+        my_agent.post_message(Message("news", 42))
+        my_agent.rehydrate()
+        my_agent.step()
+        behaviour = my_agent._behaviours[0]
+        assert behaviour.data_store["received"][0].content == 42
+
+    def test_run_after_hibernation(self, my_agent: MyAgent) -> None:
+        my_agent.add_behaviour(MyBehaviour())
+        my_agent.step()
+        my_agent.hibernate(AgentStorage())
+        my_agent.rehydrate()
+        behaviour = my_agent._behaviours[0]
+        my_agent.start()
+        my_agent.post_message(Message("news", 42))
+        deadline: float = time() + 1
+        while "received" not in behaviour.data_store and time() < deadline:
+            sleep(0.001)
+        received: bool = "received" in behaviour.data_store
+        my_agent.do_delete()
+        my_agent.join(1)
+        assert received and not my_agent.is_alive()
+
+
+def create_bounded_agent(overflow_policy: OverflowPolicy) -> MyAgent:
+    agent: MyAgent = MyAgent("bounded")
+    agent.mailbox_capacity = 2
+    agent.overflow_policy = overflow_policy
+    for index in range(2):
+        agent.post_message(Message("news", index))
+    return agent
+
+
+class TestPostMessage:
+    def test_post_message_with_drop_oldest(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.DROP_OLDEST)
+        agent.post_message(Message("news", 2))
+        assert (
+            agent.receive().content == 1
+            and agent.mailbox_size == 1
+            and agent.dropped_count == 1
+        )
+
+    def test_post_message_with_drop_newest(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.DROP_NEWEST)
+        agent.post_message(Message("news", 2))
+        assert (
+            agent.receive().content == 0
+            and agent.mailbox_size == 1
+            and agent.dropped_count == 1
+            and agent.message_count == 2
+        )
+
+    def test_post_message_with_reject(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.REJECT)
+        with pytest.raises(MessageException):
+            agent.post_message(Message("news", 2))
+        assert agent.rejected_count == 1 and agent.mailbox_size == 2
+
+    def test_post_message_with_block(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.BLOCK)
+        sender: Thread = Thread(
+            target=agent.post_message, args=(Message("news", 2),)
+        )
+        sender.start()
+        sender.join(0.05)
+        blocked: bool = sender.is_alive()
+        agent.receive()
+        sender.join(1)
+        assert (
+            blocked
+            and not sender.is_alive()
+            and agent.mailbox_size == 2
+            and agent.max_mailbox_size == 2
+        )
+
+    def test_post_message_with_block_from_behaviour(
+        self, my_agent: MyAgent
+    ) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.BLOCK)
+        behaviour: PosterBehaviour = PosterBehaviour(agent, 100)
+        my_agent.add_behaviour(behaviour)
+        my_agent.step()
+        blocked: bool = (
+            behaviour.status == BehaviourStatus.BLOCKED
+            and behaviour.data_store["sent"] == 1
+            and agent.mailbox_size == 3
+            and agent.rejected_count == 1
+        )
+        with pytest.raises(MessageException):
+            my_agent.hibernate(AgentStorage())
+        agent.receive()
+        still_blocked: bool = behaviour.status == BehaviourStatus.BLOCKED
+        agent.receive()
+        restarted: bool = behaviour.status == BehaviourStatus.STARTED
+        my_agent.step()
+        assert (
+            blocked
+            and still_blocked
+            and restarted
+            and behaviour.data_store["sent"] == 3
+            and agent.max_mailbox_size == 3
+        )
+
+    def test_post_message_with_block_and_close(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.BLOCK)
+        results: list = []
+        sender: Thread = Thread(
+            target=lambda: results.append(
+                agent.post_message(Message("news", 2))
+            )
+        )
+        sender.start()
+        sender.join(0.05)
+        agent.close_mailbox()
+        sender.join(1)
+        assert results == [False]
+
+    def test_post_message_with_control(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.REJECT)
+        agent.post_message(Message("stop", is_control=True))
+        assert agent.mailbox_size == 3 and agent.receive().topic == "stop"
+
+    def test_post_message_forced(self) -> None:
+        agent: MyAgent = create_bounded_agent(OverflowPolicy.REJECT)
+        agent.post_message(Message("news", 2), True)
+        assert agent.mailbox_size == 3 and agent.max_mailbox_size == 3
@@ -0,0 +1,36 @@
+import pytest
+
+from pysma_tool.agent_storage import AgentStorage
+from pysma_tool.exceptions.exceptions import PlatformException
+
+
+class TestSave:
+    def test_save_in_memory(self) -> None:
+        storage: AgentStorage = AgentStorage(is_compressed=True)
+        storage.save("agent", bytes(1000))
+        assert "agent" in storage and len(storage) == 1
+
+    def test_save_in_directory(self, tmp_path) -> None:
+        storage: AgentStorage = AgentStorage(str(tmp_path / "agents"))
+        storage.save("a/b", b"toto")
+        assert "a/b" in storage and len(list(tmp_path.iterdir())) == 1
+
+
+class TestLoad:
+    def test_load_with_exception(self) -> None:
+        with pytest.raises(PlatformException):
+            AgentStorage().load("agent")
+
+    def test_load_in_memory(self) -> None:
+        storage: AgentStorage = AgentStorage(is_compressed=True)
+        storage.save("agent", bytes(1000))
+        assert storage.load("agent") == bytes(1000) and len(storage) == 0
+
+    def test_load_in_directory(self, tmp_path) -> None:
+        storage: AgentStorage = AgentStorage(str(tmp_path))
+        storage.save("a/b", b"toto")
+        assert (
+            storage.load("a/b") == b"toto"
+            and "a/b" not in storage
+            and not list(tmp_path.iterdir())
+        )
@@ -1,9 +1,12 @@
 from datetime import datetime
+from time import sleep
 from typing import Any, Dict, Optional
 import pytest
 
 from pysma_tool.behaviours.behaviour import Behaviour
+from pysma_tool.behaviours.behaviour_event import BehaviourEvent
 from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.exceptions.exceptions import BehaviourException
 
 
 
@@ -143,4 +146,34 @@ class TestBehaviourRun:
         self, my_behaviour: MyBehaviour
     ) -> None:
         my_behaviour.status = BehaviourStatus.STOPPED
-        assert my_behaviour.run() == 0
\ No newline at end of file
+        assert my_behaviour.run() == 0
+
+class TestBehaviourBlockUntil:
+    def test_block_until_with_millisecond(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        event: BehaviourEvent = BehaviourEvent()
+        my_behaviour.block_until(event, 1)
+        sleep(0.002)
+        assert (
+            my_behaviour.is_runnable()
+            and my_behaviour.blocking_event is None
+        )
+
+
+class TestBehaviourBlockOn:
+    def test_block_on_with_exception(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        my_behaviour.data_store = {}
+        with pytest.raises(BehaviourException):
+            my_behaviour.block_on("toto")
+
+    def test_block_on_parent_data_store(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        parent: MyBehaviour = MyBehaviour()
+        my_behaviour.data_store = parent.data_store
+        my_behaviour.block_on("toto")
+        parent.data_store["toto"] = 42
+        assert my_behaviour.status == BehaviourStatus.STARTED
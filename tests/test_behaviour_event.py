@@ -0,0 +1,74 @@
+from pickle import dumps, loads
+import pytest
+
+from pysma_tool.behaviours.behaviour_event import BehaviourEvent
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+
+
+class MyBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        pass
+
+
+@pytest.fixture
+def event() -> BehaviourEvent:
+    return BehaviourEvent()
+
+
+class TestSet:
+    def test_set(self, event: BehaviourEvent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        behaviour.block_until(event)
+        blocked: bool = behaviour.status == BehaviourStatus.BLOCKED
+        event.set()
+        assert (
+            blocked
+            and behaviour.status == BehaviourStatus.STARTED
+            and behaviour.blocking_event is None
+        )
+
+    def test_set_before_block(self, event: BehaviourEvent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        event.set()
+        behaviour.block_until(event)
+        assert behaviour.status == BehaviourStatus.STARTED
+
+    def test_set_after_other_block(self, event: BehaviourEvent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        behaviour.block_until(event)
+        behaviour.block(5000)
+        event.set()
+        assert behaviour.status == BehaviourStatus.BLOCKED
+
+
+class TestClear:
+    def test_clear(self, event: BehaviourEvent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        event.set()
+        event.clear()
+        behaviour.block_until(event)
+        assert not event.is_set and behaviour.status == BehaviourStatus.BLOCKED
+
+
+class TestNotify:
+    def test_notify(self, event: BehaviourEvent) -> None:
+        first: MyBehaviour = MyBehaviour()
+        first.block_until(event)
+        event.notify()
+        second: MyBehaviour = MyBehaviour()
+        second.block_until(event)
+        assert (
+            first.status == BehaviourStatus.STARTED
+            and second.status == BehaviourStatus.BLOCKED
+            and not event.is_set
+        )
+
+
+class TestPickle:
+    def test_pickle(self, event: BehaviourEvent) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        behaviour.block_until(event)
+        copy: MyBehaviour = loads(dumps(behaviour))
+        copy.blocking_event.set()
+        assert copy.status == BehaviourStatus.STARTED
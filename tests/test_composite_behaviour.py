@@ -1,5 +1,6 @@
 import pytest
 
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
 from pysma_tool.behaviours.composite_behaviour import CompositeBehaviour
 from pysma_tool.exceptions.exceptions import BehaviourException
 from pysma_tool.behaviours.one_shot_behaviour import OneShotBehaviour
@@ -60,3 +61,50 @@ class TestAddSubBehaviourBehaviour:
         ).node_content.data_store["toto"] == 55 and my_behaviour.data_store[
             "counter"
         ] == 42
+
+
+class MyBlockingBehaviour(OneShotBehaviour):
+    def __init__(self) -> None:
+        super().__init__()
+        self._is_blocked: bool = False
+
+    def action(self) -> None:
+        if not self._is_blocked:
+            self._is_blocked = True
+            self.block(5000)
+
+    def done(self) -> bool:
+        return self.status != BehaviourStatus.BLOCKED
+
+
+class TestAction:
+    def test_action_step_by_step(
+        self, my_behaviour: MyBehaviour, my_test_behaviour: MyTestBehaviour
+    ) -> None:
+        other_behaviour: MyTestBehaviour = MyTestBehaviour()
+        my_behaviour.add_sub_behaviour(my_test_behaviour, "first")
+        my_behaviour.add_sub_behaviour(other_behaviour, "second")
+        first_result = my_behaviour.run()
+        first_done: bool = "toto" in my_test_behaviour.data_store and (
+            "toto" not in other_behaviour.data_store
+        )
+        assert (
+            first_result is None
+            and first_done
+            and my_behaviour.run() == 0
+            and other_behaviour.data_store["toto"] == 55
+        )
+
+    def test_action_with_blocked_child(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        child: MyBlockingBehaviour = MyBlockingBehaviour()
+        my_behaviour.add_sub_behaviour(child, "child")
+        my_behaviour.run()
+        blocked: bool = (
+            my_behaviour.status == BehaviourStatus.BLOCKED
+            and my_behaviour.date_to_restart == child.date_to_restart
+        )
+        child.restart()
+        assert blocked and my_behaviour.status == BehaviourStatus.STARTED
+        assert my_behaviour.run() == 0
@@ -0,0 +1,175 @@
+from datetime import datetime
+from threading import Thread
+from time import sleep
+from typing import Any, List, Optional
+import pytest
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.contract_net_initiator_behaviour import (
+    CONTRACT_NET_TOPIC,
+    ContractNetInitiatorBehaviour,
+)
+from pysma_tool.behaviours.contract_net_responder_behaviour import (
+    ContractNetResponderBehaviour,
+)
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.message_bus import MessageBus
+from pysma_tool.messages.performative import Performative
+
+
+class MyAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class MyInitiator(ContractNetInitiatorBehaviour):
+    def select_proposals(self, proposals: List[Message]) -> List[Message]:
+        return sorted(proposals, key=lambda proposal: proposal.content)[:1]
+
+
+class MyResponder(ContractNetResponderBehaviour):
+    def __init__(self, price: Optional[int]) -> None:
+        super().__init__()
+        self._price: Optional[int] = price
+
+    def handle_cfp(self, cfp: Message) -> Optional[Any]:
+        return self._price
+
+    def handle_accept_proposal(self, accept: Message) -> None:
+        self.data_store["result"] = "accepted"
+
+    def handle_reject_proposal(self, reject: Message) -> None:
+        self.data_store["result"] = "rejected"
+
+
+@pytest.fixture
+def message_bus() -> MessageBus:
+    return MessageBus()
+
+
+def create_agent(message_bus: MessageBus, agent_id: str) -> MyAgent:
+    agent: MyAgent = MyAgent(agent_id)
+    agent.message_bus = message_bus
+    return agent
+
+
+class TestContractNet:
+    def test_contract_net(self, message_bus: MessageBus) -> None:
+        responders: List[MyResponder] = []
+        agents: List[MyAgent] = []
+        for index in range(1000):
+            agent: MyAgent = create_agent(message_bus, f"responder{index}")
+            responder: MyResponder = MyResponder(
+                None if index % 10 == 0 else 1000 - index
+            )
+            agent.add_behaviour(responder)
+            responders.append(responder)
+            agents.append(agent)
+        initiator_agent: MyAgent = create_agent(message_bus, "initiator")
+        initiator: MyInitiator = MyInitiator(
+            [agent.agent_id for agent in agents], "task", timeout=0
+        )
+        initiator_agent.add_behaviour(initiator)
+        while initiator in initiator_agent._behaviours:
+            initiator_agent.step()
+            for agent in agents:
+                agent.step()
+        assert (
+            len(initiator.proposals) == 900
+            and len(initiator.refusals) == 100
+            and [proposal.sender for proposal in initiator.accepted]
+            == ["responder999"]
+            and responders[999].data_store["result"] == "accepted"
+            and responders[1].data_store["result"] == "rejected"
+            and "result" not in responders[0].data_store
+        )
+
+    def test_contract_net_waits_without_polling(
+        self, message_bus: MessageBus
+    ) -> None:
+        initiator_agent: MyAgent = create_agent(message_bus, "initiator")
+        initiator: MyInitiator = MyInitiator(["responder"], timeout=0)
+        initiator_agent.add_behaviour(initiator)
+        for _ in range(5):
+            initiator_agent.step()
+        assert initiator_agent.is_idle() and (
+            initiator_agent.get_wake_up_date() is None
+        )
+
+    def test_contract_net_deadline(self, message_bus: MessageBus) -> None:
+        responder_agent: MyAgent = create_agent(message_bus, "responder")
+        responder_agent.add_behaviour(MyResponder(10))
+        create_agent(message_bus, "silent")
+        initiator_agent: MyAgent = create_agent(message_bus, "initiator")
+        initiator: MyInitiator = MyInitiator(
+            ["responder", "silent"], timeout=200
+        )
+        initiator_agent.add_behaviour(initiator)
+        responder_thread: Thread = Thread(target=responder_agent.run)
+        responder_thread.start()
+        start: datetime = datetime.now()
+        initiator_agent.run()
+        elapsed: float = (datetime.now() - start).total_seconds()
+        responder_agent.do_delete()
+        responder_thread.join()
+        assert 0.2 <= elapsed < 0.4 and [
+            proposal.sender for proposal in initiator.accepted
+        ] == ["responder"]
+
+    def test_contract_net_failure(self, message_bus: MessageBus) -> None:
+        initiator_agent: MyAgent = create_agent(message_bus, "initiator")
+        initiator: MyInitiator = MyInitiator(["responder"], timeout=0)
+        initiator_agent.add_behaviour(initiator)
+        initiator_agent.step()
+        initiator_agent.post_message(
+            Message(
+                CONTRACT_NET_TOPIC,
+                "error",
+                "responder",
+                ["initiator"],
+                Performative.FAILURE,
+                initiator.conversation_id,
+            )
+        )
+        for _ in range(3):
+            initiator_agent.step()
+        assert (
+            initiator not in initiator_agent._behaviours
+            and len(initiator.failures) == 1
+        )
+
+    def test_contract_net_discards_late_replies(
+        self, message_bus: MessageBus
+    ) -> None:
+        initiator_agent: MyAgent = create_agent(message_bus, "initiator")
+        initiator: MyInitiator = MyInitiator(["responder"], timeout=10)
+        initiator_agent.add_behaviour(initiator)
+        initiator_agent.step()
+        sleep(0.02)
+        initiator_agent.step()
+        initiator_agent.post_message(
+            Message(
+                CONTRACT_NET_TOPIC,
+                10,
+                "responder",
+                ["initiator"],
+                Performative.PROPOSE,
+                initiator.conversation_id,
+            )
+        )
+        initiator_agent.step()
+        initiator_agent.post_message(
+            Message(
+                CONTRACT_NET_TOPIC,
+                None,
+                "late",
+                ["initiator"],
+                Performative.REFUSE,
+                initiator.conversation_id,
+            )
+        )
+        assert (
+            initiator not in initiator_agent._behaviours
+            and not initiator.proposals
+            and initiator_agent.mailbox_size == 0
+        )
@@ -0,0 +1,67 @@
+from pickle import dumps, loads
+import pytest
+
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.behaviours.data_store import DataStore
+
+
+class MyBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        pass
+
+
+@pytest.fixture
+def behaviour() -> MyBehaviour:
+    behaviour: MyBehaviour = MyBehaviour()
+    behaviour.block_on("toto")
+    return behaviour
+
+
+class TestWrite:
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda data_store: data_store.__setitem__("toto", 1),
+            lambda data_store: data_store.update(toto=1),
+            lambda data_store: data_store.setdefault("toto", 1),
+            lambda data_store: data_store.notify("toto"),
+            lambda data_store: data_store.__ior__({"toto": 1}),
+            lambda data_store: data_store.pop("toto", None),
+            lambda data_store: (
+                dict.__setitem__(data_store, "toto", 1),
+                data_store.popitem(),
+            ),
+            lambda data_store: (
+                dict.__setitem__(data_store, "toto", 1),
+                data_store.clear(),
+            ),
+        ],
+    )
+    def test_write_restarts_behaviour(
+        self, behaviour: MyBehaviour, write
+    ) -> None:
+        write(behaviour.data_store)
+        assert behaviour.status == BehaviourStatus.STARTED
+
+    def test_write_other_key(self, behaviour: MyBehaviour) -> None:
+        behaviour.data_store["other"] = 1
+        assert behaviour.status == BehaviourStatus.BLOCKED
+
+    def test_delete(self, behaviour: MyBehaviour) -> None:
+        behaviour.data_store["toto"] = 1
+        behaviour.block_on("toto")
+        del behaviour.data_store["toto"]
+        assert behaviour.status == BehaviourStatus.STARTED
+
+
+class TestPickle:
+    def test_pickle(self, behaviour: MyBehaviour) -> None:
+        behaviour.data_store["other"] = behaviour
+        copy: MyBehaviour = loads(dumps(behaviour))
+        copy.data_store["toto"] = 1
+        assert (
+            isinstance(copy.data_store, DataStore)
+            and copy.data_store["other"] is copy
+            and copy.status == BehaviourStatus.STARTED
+        )
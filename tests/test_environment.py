@@ -0,0 +1,178 @@
+from random import Random
+from threading import Thread
+from time import perf_counter
+from typing import Dict, List, Tuple
+import pytest
+
+from pysma_tool.environment import Environment
+from pysma_tool.exceptions.exceptions import EnvironmentException
+
+
+@pytest.fixture
+def environment() -> Environment:
+    environment: Environment = Environment(cell_size=2.0)
+    environment.add_agent("a", 0.0, 0.0)
+    environment.add_agent("b", 1.0, 1.0)
+    environment.add_agent("c", 5.0, 0.0)
+    environment.add_agent("d", -10.0, -10.0)
+    return environment
+
+
+class TestInstance:
+    def test_instance_with_bad_cell_size(self) -> None:
+        with pytest.raises(EnvironmentException):
+            Environment(cell_size=0)
+
+
+class TestAddAgent:
+    def test_add_agent(self, environment: Environment) -> None:
+        assert len(environment) == 4 and environment.get_position("c") == (
+            5.0,
+            0.0,
+        )
+
+    def test_add_agent_with_exception(self, environment: Environment) -> None:
+        with pytest.raises(EnvironmentException):
+            environment.add_agent("a", 3.0, 3.0)
+
+
+class TestRemoveAgent:
+    def test_remove_agent(self, environment: Environment) -> None:
+        environment.remove_agent("a")
+        assert "a" not in environment and environment.get_neighbours(
+            0.0, 0.0, 2.0
+        ) == ["b"]
+
+    def test_remove_agent_with_exception(
+        self, environment: Environment
+    ) -> None:
+        with pytest.raises(EnvironmentException):
+            environment.remove_agent("toto")
+
+
+class TestMoveAgent:
+    def test_move_agent(self, environment: Environment) -> None:
+        environment.move_agent("d", 4.0, 1.0)
+        assert sorted(environment.get_neighbours(5.0, 0.0, 1.5)) == [
+            "c",
+            "d",
+        ]
+
+    def test_move_agent_with_exception(self, environment: Environment) -> None:
+        with pytest.raises(EnvironmentException):
+            environment.move_agent("toto", 0.0, 0.0)
+
+    def test_update_positions(self, environment: Environment) -> None:
+        environment.update_positions({"a": (5.0, 1.0), "e": (6.0, 0.0)})
+        assert sorted(environment.get_neighbours(5.0, 0.0, 1.5)) == [
+            "a",
+            "c",
+            "e",
+        ]
+
+
+class TestGetNeighbours:
+    def test_get_neighbours(self, environment: Environment) -> None:
+        assert sorted(environment.get_neighbours(0.0, 0.0, 2.0)) == [
+            "a",
+            "b",
+        ]
+
+    def test_get_neighbours_with_exclude(
+        self, environment: Environment
+    ) -> None:
+        assert environment.get_neighbours(0.0, 0.0, 2.0, exclude="a") == ["b"]
+
+    def test_get_neighbours_with_large_radius(
+        self, environment: Environment
+    ) -> None:
+        assert len(environment.get_neighbours(0.0, 0.0, 1000.0)) == 4
+
+    def test_get_neighbours_same_as_scan(self) -> None:
+        random: Random = Random(42)
+        environment: Environment = Environment(cell_size=5.0)
+        for index in range(500):
+            environment.add_agent(
+                str(index), random.uniform(0, 100), random.uniform(0, 100)
+            )
+        expected: List[str] = [
+            agent_id
+            for agent_id, (x, y) in environment.positions.items()
+            if (x - 50) ** 2 + (y - 50) ** 2 <= 12.0**2
+        ]
+        assert sorted(environment.get_neighbours(50, 50, 12.0)) == sorted(
+            expected
+        )
+
+
+class TestGetNearest:
+    def test_get_nearest(self, environment: Environment) -> None:
+        assert environment.get_nearest(0.2, 0.2, 3) == ["a", "b", "c"]
+
+    def test_get_nearest_with_exclude(self, environment: Environment) -> None:
+        assert environment.get_nearest(0.0, 0.0, 2, exclude="a") == [
+            "b",
+            "c",
+        ]
+
+    def test_get_nearest_more_than_agents(
+        self, environment: Environment
+    ) -> None:
+        assert len(environment.get_nearest(0.0, 0.0, 10)) == 4
+
+    def test_get_nearest_same_as_scan(self) -> None:
+        random: Random = Random(7)
+        environment: Environment = Environment(cell_size=3.0)
+        for index in range(500):
+            environment.add_agent(
+                str(index), random.uniform(0, 100), random.uniform(0, 100)
+            )
+        positions: Dict[str, Tuple[float, float]] = environment.positions
+        expected: List[str] = sorted(
+            positions,
+            key=lambda agent_id: (positions[agent_id][0] - 20) ** 2
+            + (positions[agent_id][1] - 70) ** 2,
+        )[:10]
+        assert environment.get_nearest(20, 70, 10) == expected
+
+    def test_get_nearest_far_away(self) -> None:
+        environment: Environment = Environment()
+        for index in range(10000):
+            environment.add_agent(str(index), index % 100, index // 100)
+        start: float = perf_counter()
+        nearest: List[str] = environment.get_nearest(5000, 5000, 1)
+        assert nearest == ["9999"] and perf_counter() - start < 1
+
+
+class TestConcurrency:
+    def test_move_while_querying(self) -> None:
+        random: Random = Random(3)
+        environment: Environment = Environment(cell_size=2.0)
+        for index in range(200):
+            environment.add_agent(
+                str(index), random.uniform(0, 20), random.uniform(0, 20)
+            )
+        errors: List[Exception] = []
+
+        def move() -> None:
+            mover: Random = Random(5)
+            try:
+                for _ in range(20000):
+                    environment.move_agent(
+                        str(mover.randrange(200)),
+                        mover.uniform(0, 20),
+                        mover.uniform(0, 20),
+                    )
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        mover: Thread = Thread(target=move)
+        mover.start()
+        try:
+            while mover.is_alive():
+                environment.get_neighbours(10, 10, 4.0)
+                environment.get_nearest(10, 10, 5)
+        except RuntimeError as error:
+            errors.append(error)
+        mover.join()
+        assert not errors and len(environment) == 200
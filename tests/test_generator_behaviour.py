@@ -0,0 +1,181 @@
+from pickle import dumps, loads
+from time import perf_counter, sleep
+import pytest
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.behaviour_event import BehaviourEvent
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.behaviours.generator_behaviour import (
+    GeneratorBehaviour,
+    WaitEvent,
+    WaitMessage,
+)
+from pysma_tool.exceptions.exceptions import BehaviourException
+from pysma_tool.messages.message import Message
+
+
+class MyAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class MyBehaviour(GeneratorBehaviour):
+    def action(self):
+        for index in range(3):
+            self.data_store["count"] = index + 1
+            yield
+
+
+class MySlowBehaviour(GeneratorBehaviour):
+    def action(self):
+        while True:
+            start: float = perf_counter()
+            while perf_counter() - start < 0.001:
+                pass
+            self.data_store["count"] = self.data_store.get("count", 0) + 1
+            yield
+
+
+class MyWaitingBehaviour(GeneratorBehaviour):
+    def action(self):
+        yield 5000
+        message = self.receive()
+        while message is None:
+            yield WaitMessage()
+            message = self.receive()
+        self.data_store["message"] = message
+
+
+class MyShortDelayBehaviour(GeneratorBehaviour):
+    def action(self):
+        yield 0
+        yield -1
+        self.data_store["count"] = 1
+        yield 0.2
+        self.data_store["count"] = 2
+
+
+class MyEventBehaviour(GeneratorBehaviour):
+    def __init__(self, event: BehaviourEvent) -> None:
+        super().__init__()
+        self._event: BehaviourEvent = event
+
+    def action(self):
+        yield self._event
+        self.data_store["count"] = 1
+        yield WaitEvent(self._event, 5000)
+        self.data_store["count"] = 2
+
+
+class MyWrongBehaviour(GeneratorBehaviour):
+    def action(self):
+        yield "toto"
+
+
+class TestRun:
+    def test_run_without_budget(self) -> None:
+        behaviour: MyBehaviour = MyBehaviour(time_budget=0)
+        results = [behaviour.run() for _ in range(4)]
+        assert results == [None, None, None, 0] and behaviour.done()
+
+    def test_run_with_budget(self) -> None:
+        behaviour: MyBehaviour = MyBehaviour(time_budget=1000)
+        assert behaviour.run() == 0 and behaviour.data_store["count"] == 3
+
+    def test_run_stops_when_budget_is_used(self) -> None:
+        behaviour: MySlowBehaviour = MySlowBehaviour(time_budget=5)
+        start: float = perf_counter()
+        behaviour.run()
+        elapsed: float = perf_counter() - start
+        assert 1 <= behaviour.data_store["count"] <= 5 and elapsed < 0.05
+
+    def test_run_with_delay(self) -> None:
+        behaviour: MyWaitingBehaviour = MyWaitingBehaviour()
+        behaviour.run()
+        assert (
+            behaviour.status == BehaviourStatus.BLOCKED
+            and behaviour.date_to_restart is not None
+        )
+
+    def test_run_with_short_delays(self) -> None:
+        behaviour: MyShortDelayBehaviour = MyShortDelayBehaviour(
+            time_budget=1000
+        )
+        behaviour.run()
+        blocked: bool = (
+            behaviour.status == BehaviourStatus.BLOCKED
+            and behaviour.data_store["count"] == 1
+        )
+        sleep(0.002)
+        assert (
+            blocked
+            and behaviour.is_runnable()
+            and behaviour.run() == 0
+            and behaviour.data_store["count"] == 2
+        )
+
+    def test_run_with_wait_message(self) -> None:
+        agent: MyAgent = MyAgent("agent")
+        behaviour: MyWaitingBehaviour = MyWaitingBehaviour()
+        agent.add_behaviour(behaviour)
+        agent.step()
+        behaviour.restart()
+        agent.step()
+        blocked: bool = behaviour.status == BehaviourStatus.BLOCKED
+        agent.post_message(Message("news", 42))
+        agent.step()
+        assert (
+            blocked
+            and behaviour.data_store["message"].content == 42
+            and behaviour.done()
+        )
+
+    def test_run_with_event(self) -> None:
+        event: BehaviourEvent = BehaviourEvent()
+        behaviour: MyEventBehaviour = MyEventBehaviour(event)
+        behaviour.run()
+        blocked: bool = (
+            behaviour.status == BehaviourStatus.BLOCKED
+            and behaviour.blocking_event is event
+            and behaviour.date_to_restart is None
+        )
+        event.notify()
+        behaviour.run()
+        blocked_with_limit: bool = (
+            behaviour.data_store["count"] == 1
+            and behaviour.status == BehaviourStatus.BLOCKED
+            and behaviour.date_to_restart is not None
+        )
+        event.notify()
+        assert (
+            blocked
+            and blocked_with_limit
+            and behaviour.run() == 0
+            and behaviour.data_store["count"] == 2
+        )
+
+    def test_run_with_wrong_value(self) -> None:
+        with pytest.raises(BehaviourException):
+            MyWrongBehaviour().run()
+
+
+class TestSerialize:
+    def test_serialize(self) -> None:
+        behaviour: MyBehaviour = MyBehaviour(time_budget=0)
+        copy: MyBehaviour = loads(dumps(behaviour))
+        behaviour.run()
+        with pytest.raises(BehaviourException):
+            dumps(behaviour)
+        assert copy.run() is None and copy.data_store["count"] == 1
+
+
+class TestStep:
+    def test_step_interleaves_behaviours(self) -> None:
+        agent: MyAgent = MyAgent("agent")
+        slow: MySlowBehaviour = MySlowBehaviour(time_budget=2)
+        fast: MyBehaviour = MyBehaviour(time_budget=0)
+        agent.add_behaviour(slow)
+        agent.add_behaviour(fast)
+        for _ in range(3):
+            agent.step()
+        assert fast.data_store["count"] == 3 and slow.data_store["count"] < 12
@@ -0,0 +1,85 @@
+import pytest
+
+from pysma_tool.behaviours.memoized_one_shot_behaviour import (
+    MemoizedOneShotBehaviour,
+)
+from pysma_tool.behaviours.result_cache import ResultCache
+
+
+class MyBehaviour(MemoizedOneShotBehaviour):
+    input_keys = ("start", "end")
+    output_keys = ("route",)
+    result_cache = ResultCache()
+    calls: int = 0
+
+    def action(self) -> None:
+        MyBehaviour.calls += 1
+        self.data_store["route"] = list(
+            range(self.data_store["start"], self.data_store["end"])
+        )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    MyBehaviour.result_cache.clear()
+    MyBehaviour.calls = 0
+
+
+def create_behaviour(start, end) -> MyBehaviour:
+    behaviour: MyBehaviour = MyBehaviour()
+    behaviour.data_store.update({"start": start, "end": end})
+    return behaviour
+
+
+class TestRun:
+    def test_run_with_same_inputs(self) -> None:
+        first: MyBehaviour = create_behaviour(1, 4)
+        second: MyBehaviour = create_behaviour(1, 4)
+        first.run()
+        second.run()
+        assert (
+            MyBehaviour.calls == 1
+            and second.data_store["route"] == [1, 2, 3]
+            and MyBehaviour.result_cache.hits == 1
+        )
+
+    def test_run_with_other_inputs(self) -> None:
+        create_behaviour(1, 4).run()
+        behaviour: MyBehaviour = create_behaviour(1, 5)
+        behaviour.run()
+        assert MyBehaviour.calls == 2 and behaviour.data_store["route"] == [
+            1,
+            2,
+            3,
+            4,
+        ]
+
+    def test_run_without_shared_outputs(self) -> None:
+        first: MyBehaviour = create_behaviour(1, 4)
+        second: MyBehaviour = create_behaviour(1, 4)
+        third: MyBehaviour = create_behaviour(1, 4)
+        first.run()
+        first.data_store["route"].append(0)
+        second.run()
+        second.data_store["route"].append(0)
+        third.run()
+        assert MyBehaviour.calls == 1 and third.data_store["route"] == [
+            1,
+            2,
+            3,
+        ]
+
+    def test_run_with_inputs_of_other_types(self) -> None:
+        create_behaviour(1, 2).run()
+        behaviour: MyBehaviour = create_behaviour(True, 2)
+        behaviour.run()
+        assert MyBehaviour.calls == 2
+
+    def test_run_with_unhashable_input(self) -> None:
+        behaviour: MyBehaviour = create_behaviour(1, 4)
+        behaviour.data_store["start"] = [1]
+        assert behaviour._get_cache_key() is None
+
+    def test_run_without_input(self) -> None:
+        behaviour: MyBehaviour = MyBehaviour()
+        assert behaviour._get_cache_key() is None
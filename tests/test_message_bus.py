@@ -0,0 +1,225 @@
+import pytest
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.behaviours.one_shot_behaviour import OneShotBehaviour
+from pysma_tool.behaviours.sequential_behaviour import SequentialBehaviour
+from pysma_tool.exceptions.exceptions import (
+    MessageException,
+    TransportException,
+)
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.message_bus import MessageBus, RESOLVED_CACHE_SIZE
+from pysma_tool.messages.overflow_policy import OverflowPolicy
+
+
+class MyAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class MyBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        message = self.receive()
+        if message is None:
+            self.wait_message()
+        else:
+            self.data_store["received"] = message.content
+
+
+class MyOneShotBehaviour(OneShotBehaviour):
+    def action(self) -> None:
+        pass
+
+
+@pytest.fixture
+def message_bus() -> MessageBus:
+    return MessageBus()
+
+
+@pytest.fixture
+def my_behaviour() -> MyBehaviour:
+    agent: MyAgent = MyAgent("agent")
+    behaviour: MyBehaviour = MyBehaviour()
+    agent.add_behaviour(behaviour)
+    return behaviour
+
+
+class TestSubscribe:
+    def test_subscribe_with_exception(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        with pytest.raises(MessageException):
+            message_bus.subscribe(my_behaviour, "")
+
+    def test_subscribe(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "news")
+        message_bus.subscribe(my_behaviour, "news")
+        assert message_bus.get_subscribers("news") == (my_behaviour,)
+
+    def test_subscribe_with_pattern(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "sensor.*")
+        message_bus.subscribe(my_behaviour, "sensor.temperature")
+        assert (
+            message_bus.get_subscribers("sensor.temperature")
+            == (my_behaviour,)
+            and message_bus.get_subscribers("news") == ()
+        )
+
+    def test_unsubscribe(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "sensor.*")
+        message_bus.get_subscribers("sensor.temperature")
+        message_bus.unsubscribe(my_behaviour, "sensor.*")
+        assert message_bus.get_subscribers("sensor.temperature") == ()
+
+    def test_unsubscribe_finished_behaviour(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        agent: MyAgent = my_behaviour.agent
+        agent.message_bus = message_bus
+        finished_behaviour: MyOneShotBehaviour = MyOneShotBehaviour()
+        agent.add_behaviour(finished_behaviour)
+        message_bus.subscribe(my_behaviour, "news")
+        message_bus.subscribe(finished_behaviour, "news")
+        agent.step()
+        assert message_bus.get_subscribers("news") == (my_behaviour,)
+
+    def test_unsubscribe_all_with_sub_behaviours(
+        self, message_bus: MessageBus
+    ) -> None:
+        sequential_behaviour: SequentialBehaviour = SequentialBehaviour()
+        sub_behaviour: MyBehaviour = MyBehaviour()
+        sequential_behaviour.add_sub_behaviour(sub_behaviour, "sub")
+        message_bus.subscribe(sub_behaviour, "sensor.*")
+        message_bus.unsubscribe_all(sequential_behaviour)
+        assert message_bus.get_subscribers("sensor.temperature") == ()
+
+    def test_deregister_drops_subscriptions(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        my_behaviour.agent.message_bus = message_bus
+        message_bus.subscribe(my_behaviour, "news")
+        my_behaviour.agent.message_bus = None
+        assert message_bus.get_subscribers("news") == ()
+
+    def test_unsubscribe_deleted_agent(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        agent: MyAgent = my_behaviour.agent
+        agent.message_bus = message_bus
+        message_bus.subscribe(my_behaviour, "news")
+        agent.do_delete()
+        agent.start()
+        agent.join(1)
+        assert message_bus.get_subscribers("news") == ()
+
+    def test_resolved_topics_are_bounded(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "news")
+        for index in range(100):
+            message_bus.get_subscribers(f"order.{index}")
+        exact_count: int = len(message_bus._resolved)
+        message_bus.subscribe(my_behaviour, "order.*")
+        for index in range(RESOLVED_CACHE_SIZE + 100):
+            message_bus.get_subscribers(f"order.{index}")
+        assert (
+            exact_count == 0
+            and len(message_bus._resolved) == RESOLVED_CACHE_SIZE
+            and message_bus.get_subscribers("order.0") == (my_behaviour,)
+        )
+
+
+class TestPublish:
+    def test_publish_shared_message(self, message_bus: MessageBus) -> None:
+        agents = [MyAgent(f"agent{index}") for index in range(3)]
+        for agent in agents:
+            behaviour: MyBehaviour = MyBehaviour()
+            agent.add_behaviour(behaviour)
+            message_bus.subscribe(behaviour, "news")
+        assert message_bus.publish("news", {"value": 42}, "toto") == 3
+        messages = [agent.receive() for agent in agents]
+        assert all(message is messages[0] for message in messages) and (
+            messages[0].sender == "toto"
+        )
+
+    def test_publish_once_per_agent(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        other_behaviour: MyBehaviour = MyBehaviour()
+        my_behaviour.agent.add_behaviour(other_behaviour)
+        message_bus.subscribe(my_behaviour, "news")
+        message_bus.subscribe(other_behaviour, "news")
+        assert message_bus.publish("news", 42) == 1
+
+    def test_publish_wakes_subscriber(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "news")
+        my_behaviour.run()
+        blocked: bool = my_behaviour.status == BehaviourStatus.BLOCKED
+        message_bus.publish("news", 42)
+        my_behaviour.run()
+        assert blocked and my_behaviour.data_store["received"] == 42
+
+    def test_publish_keeps_other_blocks(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "news")
+        my_behaviour.block()
+        message_bus.publish("news", 42)
+        assert my_behaviour.status == BehaviourStatus.BLOCKED
+
+    def test_publish_skips_deleted_agent(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "news")
+        my_behaviour.agent.do_delete()
+        assert (
+            message_bus.publish("news", 42) == 0
+            and my_behaviour.agent.mailbox_size == 0
+        )
+
+    def test_publish_with_full_mailbox(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        other_agent: MyAgent = MyAgent("other")
+        other_behaviour: MyBehaviour = MyBehaviour()
+        other_agent.add_behaviour(other_behaviour)
+        my_behaviour.agent.mailbox_capacity = 1
+        my_behaviour.agent.overflow_policy = OverflowPolicy.REJECT
+        message_bus.subscribe(my_behaviour, "news")
+        message_bus.subscribe(other_behaviour, "news")
+        message_bus.publish("news", 1)
+        assert (
+            message_bus.publish("news", 2) == 1
+            and my_behaviour.agent.rejected_count == 1
+            and other_agent.mailbox_size == 2
+        )
+
+    def test_receive_with_topic(
+        self, message_bus: MessageBus, my_behaviour: MyBehaviour
+    ) -> None:
+        message_bus.subscribe(my_behaviour, "*")
+        message_bus.publish("news", 1)
+        message_bus.publish("weather", 2)
+        assert my_behaviour.receive("weather").content == 2 and (
+            my_behaviour.receive("weather") is None
+        )
+
+
+def fail_route(agent_id: str, message: Message) -> None:
+    raise TransportException(f"Connection for {agent_id} is lost.")
+
+
+class TestSend:
+    def test_send_with_failing_route(self, message_bus: MessageBus) -> None:
+        message_bus.set_route("remote", fail_route)
+        assert message_bus.send(Message("news", receivers=["remote"])) == 0
@@ -0,0 +1,395 @@
+from datetime import datetime
+from threading import Lock
+from time import sleep
+from typing import List, Optional
+import pytest
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.behaviour_event import BehaviourEvent
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.behaviours.generator_behaviour import GeneratorBehaviour
+from pysma_tool.behaviours.one_shot_behaviour import OneShotBehaviour
+from pysma_tool.behaviours.waker_behaviour import WakerBehaviour
+from pysma_tool.exceptions.exceptions import (
+    MessageException,
+    PlatformException,
+)
+from pysma_tool.messages.message import Message
+from pysma_tool.platform import Platform
+
+
+class MyAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+
+class SpawnerAgent(Agent):
+    def __init__(self, agent_id: str, agents: List[Agent]) -> None:
+        super().__init__(agent_id)
+        self._agents: List[Agent] = agents
+
+    def setup(self) -> None:
+        for agent in self._agents:
+            self.platform.add_agent(agent)
+        self.do_delete()
+
+
+class CounterBehaviour(CyclicBehaviour):
+    def __init__(self, steps: int, duration: float = 0.0) -> None:
+        super().__init__()
+        self._steps: int = steps
+        self._duration: float = duration
+        self._lock: Lock = Lock()
+        self.data_store["counter"] = 0
+        self.data_store["overlaps"] = 0
+
+    def action(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            self.data_store["overlaps"] += 1
+            return
+        sleep(self._duration)
+        self.data_store["counter"] += 1
+        self._lock.release()
+
+    def done(self) -> bool:
+        return self.data_store["counter"] >= self._steps
+
+
+class ReceiverBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        message = self.receive()
+        if message is None:
+            self.wait_message()
+        else:
+            self.data_store["received"] = message.content
+            self.agent.do_delete()
+
+
+class CountingReceiverBehaviour(CyclicBehaviour):
+    def __init__(self) -> None:
+        super().__init__()
+        self.data_store["received"] = 0
+
+    def action(self) -> None:
+        message = self.receive()
+        if message is None:
+            self.wait_message(10000)
+        else:
+            self.data_store["received"] += 1
+
+
+class SenderBehaviour(CyclicBehaviour):
+    def __init__(self, count: int) -> None:
+        super().__init__()
+        self._count: int = count
+        self.data_store["sent"] = 0
+
+    def action(self) -> None:
+        while self.data_store["sent"] < self._count:
+            try:
+                self.agent.send(
+                    Message(
+                        "news", self.data_store["sent"], receivers=["receiver"]
+                    )
+                )
+            except MessageException:
+                return
+            self.data_store["sent"] += 1
+
+    def done(self) -> bool:
+        return self.data_store["sent"] >= self._count
+
+
+class FailingBehaviour(OneShotBehaviour):
+    def action(self) -> None:
+        raise ValueError("failure")
+
+
+class EventWaiterBehaviour(CyclicBehaviour):
+    def __init__(self, event: Optional[BehaviourEvent] = None) -> None:
+        super().__init__()
+        self._event: Optional[BehaviourEvent] = event
+
+    def action(self) -> None:
+        if self.data_store.get("waited"):
+            self.agent.do_delete()
+            return
+        self.data_store["waited"] = True
+        if self._event is None:
+            self.block_on("key")
+        else:
+            self.block_until(self._event)
+
+
+class SleepingGeneratorBehaviour(GeneratorBehaviour):
+    def action(self):
+        yield 300
+        self.data_store["count"] = 1
+        self.agent.do_delete()
+
+
+class MyWakerBehaviour(WakerBehaviour):
+    def on_wake(self) -> None:
+        self.data_store["woken_at"] = datetime.now()
+
+
+@pytest.fixture
+def platform():
+    platform: Platform = Platform(workers=2)
+    platform.start()
+    yield platform
+    platform.stop()
+
+
+def create_agent(agent_id: str, behaviour) -> MyAgent:
+    agent: MyAgent = MyAgent(agent_id)
+    agent.add_behaviour(behaviour)
+    return agent
+
+
+class TestInstance:
+    def test_instance_without_worker(self) -> None:
+        with pytest.raises(PlatformException):
+            Platform(workers=0)
+
+
+class TestAddAgent:
+    def test_add_agent_with_exception(self, platform: Platform) -> None:
+        platform.add_agent(create_agent("agent", ReceiverBehaviour()))
+        with pytest.raises(PlatformException):
+            platform.add_agent(create_agent("agent", ReceiverBehaviour()))
+
+    def test_add_agent(self, platform: Platform) -> None:
+        behaviours: List[CounterBehaviour] = [
+            CounterBehaviour(50) for _ in range(20)
+        ]
+        for index, behaviour in enumerate(behaviours):
+            platform.add_agent(create_agent(f"agent{index}", behaviour))
+        assert platform.wait(5) and all(
+            behaviour.data_store["counter"] == 50
+            and behaviour.data_store["overlaps"] == 0
+            for behaviour in behaviours
+        )
+
+
+class TestFailure:
+    def test_failing_agent(self, caplog: pytest.LogCaptureFixture) -> None:
+        platform: Platform = Platform(workers=1)
+        platform.add_agent(create_agent("failing", FailingBehaviour()))
+        behaviour: CounterBehaviour = CounterBehaviour(3)
+        platform.add_agent(create_agent("healthy", behaviour))
+        platform.start()
+        finished: bool = platform.wait(1)
+        worker_alive: bool = platform.workers[0].is_alive()
+        platform.stop()
+        assert (
+            finished
+            and worker_alive
+            and behaviour.data_store["counter"] == 3
+            and not platform.agents
+            and "Agent failing failed" in caplog.text
+        )
+
+
+class TestWorkStealing:
+    def test_work_stealing(self, platform: Platform) -> None:
+        behaviours: List[CounterBehaviour] = [
+            CounterBehaviour(5, 0.005) for _ in range(8)
+        ]
+        platform.add_agent(
+            SpawnerAgent(
+                "spawner",
+                [
+                    create_agent(f"agent{index}", behaviour)
+                    for index, behaviour in enumerate(behaviours)
+                ],
+            )
+        )
+        assert (
+            platform.wait(5)
+            and sum(worker.steals for worker in platform.workers) > 0
+            and all(worker.steps > 0 for worker in platform.workers)
+            and all(
+                behaviour.data_store["overlaps"] == 0
+                for behaviour in behaviours
+            )
+            and all(
+                0.0 < utilization <= 1.0
+                for utilization in platform.get_utilization()
+            )
+        )
+
+
+class TestWake:
+    def test_wake_on_date(self, platform: Platform) -> None:
+        behaviour: MyWakerBehaviour = MyWakerBehaviour(timeout=100)
+        start: datetime = datetime.now()
+        platform.add_agent(create_agent("agent", behaviour))
+        assert platform.wait(1)
+        elapsed: float = (
+            behaviour.data_store["woken_at"] - start
+        ).total_seconds()
+        assert 0.1 <= elapsed < 0.2
+
+    def test_wake_on_message(self, platform: Platform) -> None:
+        behaviour: ReceiverBehaviour = ReceiverBehaviour()
+        agent: MyAgent = create_agent("agent", behaviour)
+        platform.add_agent(agent)
+        sleep(0.05)
+        steps: int = sum(worker.steps for worker in platform.workers)
+        sleep(0.05)
+        parked: bool = steps == sum(
+            worker.steps for worker in platform.workers
+        )
+        platform.message_bus.send(Message("news", 42, receivers=["agent"]))
+        assert (
+            parked
+            and platform.wait(1)
+            and behaviour.data_store["received"] == 42
+        )
+
+    def test_timers_stay_bounded(self, platform: Platform) -> None:
+        behaviour: CountingReceiverBehaviour = CountingReceiverBehaviour()
+        agent: MyAgent = create_agent("agent", behaviour)
+        platform.add_agent(agent)
+        for index in range(500):
+            agent.post_message(Message("news", index))
+            while behaviour.data_store["received"] <= index:
+                sleep(0.0001)
+        agent.do_delete()
+        agent.post_message(Message("news", None))
+        assert platform.wait(1) and len(platform._timers) < 100
+
+
+class TestBackpressure:
+    def test_send_to_full_mailbox(self) -> None:
+        platform: Platform = Platform(workers=1)
+        platform.start()
+        sender: SenderBehaviour = SenderBehaviour(1000)
+        receiver_behaviour: CountingReceiverBehaviour = (
+            CountingReceiverBehaviour()
+        )
+        receiver: MyAgent = MyAgent("receiver", mailbox_capacity=10)
+        receiver.add_behaviour(receiver_behaviour)
+        platform.add_agent(receiver)
+        platform.add_agent(create_agent("sender", sender))
+        for _ in range(2000):
+            if receiver_behaviour.data_store["received"] >= 1000:
+                break
+            sleep(0.001)
+        receiver.do_delete()
+        receiver.post_message(Message("news", None))
+        finished: bool = platform.wait(1)
+        platform.stop()
+        assert (
+            finished
+            and receiver_behaviour.data_store["received"] == 1000
+            and receiver.max_mailbox_size <= 11
+        )
+
+
+RESULTS: dict = {}
+
+
+class HibernatingWakerBehaviour(WakerBehaviour):
+    def on_wake(self) -> None:
+        RESULTS[self.agent.agent_id] = datetime.now()
+
+
+class TestHibernate:
+    @pytest.fixture
+    def hibernating_platform(self):
+        platform: Platform = Platform(workers=2, hibernate_after=20)
+        platform.start()
+        yield platform
+        platform.stop()
+
+    def test_hibernate_until_message(
+        self, hibernating_platform: Platform
+    ) -> None:
+        behaviour: ReceiverBehaviour = ReceiverBehaviour()
+        agent: MyAgent = create_agent("agent", behaviour)
+        hibernating_platform.add_agent(agent)
+        sleep(0.1)
+        hibernated: bool = (
+            agent.is_hibernated and len(hibernating_platform.storage) == 1
+        )
+        hibernating_platform.message_bus.send(
+            Message("news", 42, receivers=["agent"])
+        )
+        assert (
+            hibernated
+            and hibernating_platform.wait(1)
+            and not agent.is_hibernated
+            and len(hibernating_platform.storage) == 0
+        )
+
+    def test_hibernate_until_date(
+        self, hibernating_platform: Platform
+    ) -> None:
+        agent: MyAgent = create_agent(
+            "sleeper", HibernatingWakerBehaviour(timeout=150)
+        )
+        start: datetime = datetime.now()
+        hibernating_platform.add_agent(agent)
+        sleep(0.1)
+        hibernated: bool = agent.is_hibernated
+        elapsed: float = 0.0
+        if hibernating_platform.wait(1):
+            elapsed = (RESULTS.pop("sleeper") - start).total_seconds()
+        assert hibernated and 0.15 <= elapsed < 0.25
+
+    def test_hibernate_with_subscriber(
+        self, hibernating_platform: Platform
+    ) -> None:
+        behaviour: ReceiverBehaviour = ReceiverBehaviour()
+        agent: MyAgent = create_agent("agent", behaviour)
+        hibernating_platform.message_bus.subscribe(behaviour, "news")
+        hibernating_platform.add_agent(agent)
+        sleep(0.1)
+        hibernated: bool = agent.is_hibernated
+        hibernating_platform.message_bus.publish("news", 42)
+        assert (
+            not hibernated
+            and hibernating_platform.wait(1)
+            and behaviour.data_store["received"] == 42
+        )
+
+    def test_hibernate_with_external_event(
+        self, hibernating_platform: Platform
+    ) -> None:
+        event: BehaviourEvent = BehaviourEvent()
+        agent: MyAgent = create_agent("agent", EventWaiterBehaviour(event))
+        hibernating_platform.add_agent(agent)
+        sleep(0.1)
+        hibernated: bool = agent.is_hibernated
+        event.notify()
+        assert not hibernated and hibernating_platform.wait(1)
+
+    def test_hibernate_with_data_store_event(
+        self, hibernating_platform: Platform
+    ) -> None:
+        agent: MyAgent = create_agent("agent", EventWaiterBehaviour())
+        hibernating_platform.add_agent(agent)
+        sleep(0.1)
+        hibernated: bool = agent.is_hibernated
+        agent.rehydrate()
+        agent._behaviours[0].data_store["key"] = 1
+        assert hibernated and hibernating_platform.wait(1)
+
+    def test_hibernate_unpicklable_agent(self) -> None:
+        platform: Platform = Platform(workers=1, hibernate_after=50)
+        platform.start()
+        behaviour: SleepingGeneratorBehaviour = SleepingGeneratorBehaviour()
+        agent: MyAgent = create_agent("agent", behaviour)
+        platform.add_agent(agent)
+        sleep(0.1)
+        hibernated: bool = agent.is_hibernated
+        finished: bool = platform.wait(2)
+        platform.stop()
+        assert (
+            not hibernated
+            and finished
+            and behaviour.data_store["count"] == 1
+            and len(platform.storage) == 0
+        )
@@ -0,0 +1,52 @@
+from time import sleep
+import pytest
+
+from pysma_tool.behaviours.result_cache import ResultCache
+
+
+@pytest.fixture
+def result_cache() -> ResultCache:
+    return ResultCache(max_size=2)
+
+
+class TestGet:
+    def test_get_with_miss(self, result_cache: ResultCache) -> None:
+        assert result_cache.get("toto") is None and result_cache.misses == 1
+
+    def test_get_with_hit(self, result_cache: ResultCache) -> None:
+        result_cache.set("toto", {"value": 42})
+        assert result_cache.get("toto") == {"value": 42} and (
+            result_cache.hits == 1
+        )
+
+    def test_get_with_ttl(self) -> None:
+        result_cache: ResultCache = ResultCache(ttl=10)
+        result_cache.set("toto", {"value": 42})
+        sleep(0.02)
+        assert result_cache.get("toto") is None and (
+            result_cache.evictions == 1
+        )
+
+
+class TestSet:
+    def test_set_evicts_least_recently_used(
+        self, result_cache: ResultCache
+    ) -> None:
+        result_cache.set("first", {})
+        result_cache.set("second", {})
+        result_cache.get("first")
+        result_cache.set("third", {})
+        assert (
+            len(result_cache) == 2
+            and result_cache.get("second") is None
+            and result_cache.get("first") == {}
+            and result_cache.evictions == 1
+        )
+
+
+class TestClear:
+    def test_clear(self, result_cache: ResultCache) -> None:
+        result_cache.set("toto", {})
+        result_cache.get("toto")
+        result_cache.clear()
+        assert len(result_cache) == 0 and result_cache.hits == 0
@@ -0,0 +1,108 @@
+import pytest
+
+from pysma_tool.behaviours.behaviour_status import BehaviourStatus
+from pysma_tool.behaviours.one_shot_behaviour import OneShotBehaviour
+from pysma_tool.behaviours.sequential_behaviour import SequentialBehaviour
+from pysma_tool.exceptions.exceptions import BehaviourException
+
+
+class MyBehaviour(SequentialBehaviour):
+    pass
+
+
+class MyTestBehaviour(OneShotBehaviour):
+    def action(self) -> None:
+        if self._parent:
+            self._parent.data_store.setdefault("order", []).append(self)
+
+
+@pytest.fixture
+def my_behaviour() -> MyBehaviour:
+    return MyBehaviour()
+
+
+class TestAddSubBehaviour:
+    def test_add_sub_behaviour_with_exception(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        with pytest.raises(BehaviourException):
+            my_behaviour.add_sub_behaviour("toto", "toto")
+
+    def test_add_sub_behaviour_with_same_identifier(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        my_behaviour.add_sub_behaviour(MyTestBehaviour(), "toto")
+        with pytest.raises(BehaviourException):
+            my_behaviour.add_sub_behaviour(MyTestBehaviour(), "toto")
+
+    def test_add_sub_behaviour(self, my_behaviour: MyBehaviour) -> None:
+        child: MyTestBehaviour = MyTestBehaviour()
+        my_behaviour.add_sub_behaviour(child, "toto")
+        assert (
+            my_behaviour.sub_behaviours == [child]
+            and child.parent == my_behaviour
+            and my_behaviour._children_graph is None
+        )
+
+
+class TestRemoveSubBehaviour:
+    def test_remove_sub_behaviour_with_exception(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        with pytest.raises(BehaviourException):
+            my_behaviour.remove_sub_behaviour("toto")
+
+    def test_remove_sub_behaviour_before_current(
+        self, my_behaviour: MyBehaviour
+    ) -> None:
+        children = [MyTestBehaviour() for _ in range(3)]
+        for index, child in enumerate(children):
+            my_behaviour.add_sub_behaviour(child, f"child{index}")
+        my_behaviour.run()
+        my_behaviour.remove_sub_behaviour("child0")
+        assert (
+            my_behaviour.current_index == 0
+            and my_behaviour.id_current_state == "child1"
+        )
+
+
+class TestRun:
+    def test_run_in_order(self, my_behaviour: MyBehaviour) -> None:
+        children = [MyTestBehaviour() for _ in range(3)]
+        for index, child in enumerate(children):
+            my_behaviour.add_sub_behaviour(child, f"child{index}")
+        results = [my_behaviour.run() for _ in range(3)]
+        assert (
+            my_behaviour.data_store["order"] == children
+            and results[:2] == [None, None]
+            and results[2] == 0
+            and my_behaviour.done()
+        )
+
+    def test_run_with_blocked_child(self, my_behaviour: MyBehaviour) -> None:
+        class MyBlockingBehaviour(OneShotBehaviour):
+            def action(self) -> None:
+                self.block(5000)
+
+            def done(self) -> bool:
+                return self.status != BehaviourStatus.BLOCKED
+
+        child: MyBlockingBehaviour = MyBlockingBehaviour()
+        my_behaviour.add_sub_behaviour(child, "toto")
+        my_behaviour.run()
+        assert (
+            my_behaviour.status == BehaviourStatus.BLOCKED
+            and my_behaviour.date_to_restart == child.date_to_restart
+        )
+
+    def test_run_after_children_graph(self, my_behaviour: MyBehaviour) -> None:
+        children = [MyTestBehaviour() for _ in range(2)]
+        for index, child in enumerate(children):
+            my_behaviour.add_sub_behaviour(child, f"child{index}")
+        my_behaviour.run()
+        assert my_behaviour.children_graph.get_node("child1").node_content
+        my_behaviour.run()
+        assert (
+            my_behaviour.data_store["order"] == children
+            and my_behaviour.done()
+        )
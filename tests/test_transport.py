@@ -0,0 +1,208 @@
+from os import path
+from socket import AF_INET, SOCK_STREAM, socket
+from tempfile import TemporaryDirectory
+from time import sleep, time
+import pytest
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.exceptions.exceptions import TransportException
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.performative import Performative
+from pysma_tool.platform import Platform
+from pysma_tool.transport import Peer, SocketTransport
+
+
+class MyAgent(Agent):
+    def setup(self) -> None:
+        pass
+
+    def get_received(self) -> int:
+        return self._behaviours[0].data_store.get("received", 0)
+
+
+class EchoBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        message = self.receive()
+        while message is not None:
+            self.data_store["received"] = (
+                self.data_store.get("received", 0) + 1
+            )
+            if message.performative == Performative.REQUEST:
+                self.agent.send(
+                    message.create_reply(
+                        Performative.INFORM,
+                        message.content,
+                        self.agent.agent_id,
+                    )
+                )
+            message = self.receive()
+        self.wait_message()
+
+
+def create_agent(agent_id: str) -> MyAgent:
+    agent: MyAgent = MyAgent(agent_id)
+    agent.add_behaviour(EchoBehaviour())
+    return agent
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline: float = time() + timeout
+    while not predicate():
+        if time() > deadline:
+            return False
+        sleep(0.001)
+    return True
+
+
+@pytest.fixture
+def platforms():
+    first: Platform = Platform(workers=1)
+    second: Platform = Platform(workers=1)
+    first.start()
+    second.start()
+    yield first, second
+    first.stop()
+    second.stop()
+
+
+def connect(first: Platform, second: Platform, first_address, second_address):
+    first_transport: SocketTransport = SocketTransport(
+        first.message_bus, first_address
+    )
+    second_transport: SocketTransport = SocketTransport(
+        second.message_bus, second_address
+    )
+    first_transport.start()
+    second_transport.start()
+    first_transport.set_default_route(second_transport.address)
+    second_transport.set_default_route(first_transport.address)
+    return first_transport, second_transport
+
+
+class TestSocketTransport:
+    def test_tcp_request_reply(self, platforms) -> None:
+        first, second = platforms
+        transports = connect(first, second, ("127.0.0.1", 0), ("127.0.0.1", 0))
+        client: MyAgent = create_agent("client")
+        first.add_agent(client)
+        second.add_agent(create_agent("server"))
+        for index in range(1000):
+            client.send(
+                Message(
+                    "ping",
+                    index,
+                    "client",
+                    ["server"],
+                    Performative.REQUEST,
+                )
+            )
+        received: bool = wait_until(lambda: client.get_received() == 1000)
+        peer: Peer = transports[0].peers[transports[1].address]
+        for transport in transports:
+            transport.stop()
+        assert (
+            received
+            and peer.messages_sent == 1000
+            and (peer.batches_sent < 1000)
+        )
+
+    def test_unix_socket(self, platforms) -> None:
+        first, second = platforms
+        with TemporaryDirectory() as directory:
+            transports = connect(
+                first,
+                second,
+                path.join(directory, "first.sock"),
+                path.join(directory, "second.sock"),
+            )
+            server: MyAgent = create_agent("server")
+            second.add_agent(server)
+            first.message_bus.send(Message("news", 42, receivers=["server"]))
+            received: bool = wait_until(lambda: server.get_received() == 1)
+            for transport in transports:
+                transport.stop()
+        assert received
+
+    def test_add_route(self, platforms) -> None:
+        first, second = platforms
+        transport: SocketTransport = SocketTransport(second.message_bus)
+        transport.start()
+        other: SocketTransport = SocketTransport(first.message_bus)
+        other.add_route("server", transport.address)
+        server: MyAgent = create_agent("server")
+        second.add_agent(server)
+        delivered: int = first.message_bus.send(
+            Message("news", receivers=["server", "unknown"])
+        )
+        received: bool = wait_until(lambda: server.get_received() == 1)
+        other.stop()
+        transport.stop()
+        assert delivered == 1 and received
+
+    def test_reconnect_after_outage(self, platforms) -> None:
+        first, second = platforms
+        probe: socket = socket(AF_INET, SOCK_STREAM)
+        probe.bind(("127.0.0.1", 0))
+        address = probe.getsockname()
+        probe.close()
+        other: SocketTransport = SocketTransport(first.message_bus)
+        other.add_route("server", address)
+        first.message_bus.send(Message("news", receivers=["server"]))
+        dead_peer: Peer = other.peers[address]
+        dead: bool = wait_until(lambda: dead_peer.is_dead)
+        first.message_bus.send(Message("news", receivers=["server"]))
+        server: MyAgent = create_agent("server")
+        second.add_agent(server)
+        transport: SocketTransport = SocketTransport(
+            second.message_bus, address
+        )
+        transport.start()
+        received: bool = wait_until(lambda: server.get_received() == 1)
+        new_peer: Peer = other.peers[address]
+        other.stop()
+        transport.stop()
+        assert dead and received and new_peer is not dead_peer
+
+
+class TestPeer:
+    def test_send_after_close(self) -> None:
+        peer: Peer = Peer(("127.0.0.1", 1))
+        peer.close()
+        with pytest.raises(TransportException):
+            peer.send("agent", Message("news"))
+
+    def test_dead_peer(self) -> None:
+        peer: Peer = Peer(("127.0.0.1", 1))
+        peer.send("agent", Message("news"))
+        dead: bool = wait_until(lambda: peer.is_dead)
+        with pytest.raises(TransportException):
+            peer.send("agent", Message("news"))
+        peer.close()
+        assert dead and peer.messages_dropped == 1 and peer.messages_sent == 0
+
+    def test_retry_until_connected(self, platforms) -> None:
+        _, second = platforms
+        probe: socket = socket(AF_INET, SOCK_STREAM)
+        probe.bind(("127.0.0.1", 0))
+        port: int = probe.getsockname()[1]
+        probe.close()
+        peer: Peer = Peer(("127.0.0.1", port))
+        for index in range(10):
+            peer.send("server", Message("news", index))
+        sleep(0.05)
+        server: MyAgent = create_agent("server")
+        second.add_agent(server)
+        transport: SocketTransport = SocketTransport(
+            second.message_bus, ("127.0.0.1", port)
+        )
+        transport.start()
+        received: bool = wait_until(lambda: server.get_received() == 10)
+        peer.close()
+        transport.stop()
+        assert (
+            received
+            and peer.messages_sent == 10
+            and peer.messages_dropped == 0
+            and server.get_received() == 10
+        )
@@ -0,0 +1,207 @@
+from multiprocessing import current_process
+from threading import Thread
+from time import sleep, time
+import pytest
+
+from pysma_tool.agent import Agent
+from pysma_tool.behaviours.cyclic_behaviour import CyclicBehaviour
+from pysma_tool.exceptions.exceptions import PlatformException
+from pysma_tool.messages.message import Message
+from pysma_tool.messages.performative import Performative
+from pysma_tool.platform import Platform
+from pysma_tool.worker_process import WorkerProcess
+
+
+class MyAgent(Agent):
+    def __init__(self, agent_id: str) -> None:
+        super().__init__(agent_id)
+        self.setup_count: int = 0
+
+    def setup(self) -> None:
+        self.setup_count += 1
+
+    def get_received(self) -> int:
+        return self._behaviours[0].data_store.get("received", 0)
+
+
+class FragileAgent(MyAgent):
+    def __setstate__(self, state) -> None:
+        if current_process().name != "MainProcess":
+            raise ValueError("The agent can't leave the main process.")
+        super().__setstate__(state)
+
+
+class CounterBehaviour(CyclicBehaviour):
+    def action(self) -> None:
+        message = self.receive()
+        while message is not None:
+            self.data_store["received"] = (
+                self.data_store.get("received", 0) + 1
+            )
+            if message.content == "lock":
+                self.data_store["callback"] = lambda: None
+            if message.performative == Performative.REQUEST:
+                self.agent.send(
+                    message.create_reply(
+                        Performative.INFORM, "pong", self.agent.agent_id
+                    )
+                )
+            message = self.receive()
+        self.wait_message()
+
+
+def create_agent(agent_id: str) -> MyAgent:
+    agent: MyAgent = MyAgent(agent_id)
+    agent.add_behaviour(CounterBehaviour())
+    return agent
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline: float = time() + timeout
+    while not predicate():
+        if time() > deadline:
+            return False
+        sleep(0.001)
+    return True
+
+
+@pytest.fixture
+def platform():
+    platform: Platform = Platform(workers=2)
+    platform.start()
+    yield platform
+    platform.stop()
+
+
+@pytest.fixture
+def worker_process(platform: Platform):
+    worker_process: WorkerProcess = WorkerProcess(platform.message_bus)
+    worker_process.start()
+    yield worker_process
+    worker_process.stop()
+
+
+class TestMigrate:
+    def test_migrate_with_exception(
+        self, platform: Platform, worker_process: WorkerProcess
+    ) -> None:
+        with pytest.raises(PlatformException):
+            platform.migrate("toto", worker_process)
+        with pytest.raises(PlatformException):
+            worker_process.emigrate("toto")
+
+    def test_migrate_without_message_loss(
+        self, platform: Platform, worker_process: WorkerProcess
+    ) -> None:
+        platform.add_agent(create_agent("agent"))
+        sender: Thread = Thread(
+            target=lambda: [
+                platform.message_bus.send(
+                    Message("news", index, receivers=["agent"])
+                )
+                for index in range(1000)
+            ]
+        )
+        sender.start()
+        pause: float = platform.migrate("agent", worker_process)
+        moved: bool = "agent" not in platform.agents
+        sender.join()
+        platform.recall("agent", worker_process)
+        agent = platform.agents["agent"]
+        assert (
+            moved
+            and pause < 1000
+            and wait_until(lambda: agent.get_received() == 1000)
+            and agent.setup_count == 1
+        )
+
+    def test_migrate_with_reply(
+        self, platform: Platform, worker_process: WorkerProcess
+    ) -> None:
+        platform.add_agent(create_agent("agent"))
+        client: MyAgent = create_agent("client")
+        platform.add_agent(client)
+        platform.migrate("agent", worker_process)
+        platform.message_bus.send(
+            Message(
+                "ping",
+                sender="client",
+                receivers=["agent"],
+                performative=Performative.REQUEST,
+            )
+        )
+        assert wait_until(lambda: client.get_received() == 1)
+
+    def test_migrate_unpicklable_agent(
+        self, platform: Platform, worker_process: WorkerProcess
+    ) -> None:
+        agent: MyAgent = create_agent("agent")
+        agent.callback = lambda: None
+        platform.add_agent(agent)
+        with pytest.raises(PlatformException):
+            platform.migrate("agent", worker_process)
+        platform.message_bus.send(Message("news", 42, receivers=["agent"]))
+        assert platform.agents["agent"] is agent and wait_until(
+            lambda: agent.get_received() == 1
+        )
+
+    def test_migrate_with_immigration_failure(
+        self, platform: Platform, worker_process: WorkerProcess
+    ) -> None:
+        agent: FragileAgent = FragileAgent("agent")
+        agent.add_behaviour(CounterBehaviour())
+        platform.add_agent(agent)
+        with pytest.raises(PlatformException):
+            platform.migrate("agent", worker_process)
+        platform.message_bus.send(Message("news", 42, receivers=["agent"]))
+        resumed = platform.agents["agent"]
+        assert wait_until(lambda: resumed.get_received() == 1)
+        platform.add_agent(create_agent("other"))
+        platform.migrate("other", worker_process)
+
+    def test_recall_unpicklable_agent(
+        self, platform: Platform, worker_process: WorkerProcess
+    ) -> None:
+        platform.add_agent(create_agent("agent"))
+        client: MyAgent = create_agent("client")
+        platform.add_agent(client)
+        platform.migrate("agent", worker_process)
+        for content in ("lock", "ping"):
+            platform.message_bus.send(
+                Message(
+                    "ping",
+                    content,
+                    "client",
+                    ["agent"],
+                    Performative.REQUEST,
+                )
+            )
+            if content == "lock":
+                assert wait_until(lambda: client.get_received() == 1)
+                with pytest.raises(PlatformException):
+                    platform.recall("agent", worker_process)
+        assert (
+            wait_until(lambda: client.get_received() == 2)
+            and "agent" not in platform.agents
+        )
+
+    def test_emigrate_before_first_step(self) -> None:
+        platform: Platform = Platform(workers=1)
+        platform.add_agent(create_agent("agent"))
+        state: bytes = platform.emigrate("agent")
+        other_platform: Platform = Platform(workers=1)
+        agent = other_platform.immigrate(state)
+        other_platform.start()
+        started: bool = wait_until(lambda: agent.setup_count == 1)
+        sleep(0.05)
+        other_platform.stop()
+        assert started and agent.setup_count == 1
+
+    def test_call_after_process_death(self, platform: Platform) -> None:
+        worker_process: WorkerProcess = WorkerProcess(platform.message_bus)
+        worker_process.start()
+        worker_process._process.kill()
+        worker_process._process.join()
+        with pytest.raises(PlatformException):
+            worker_process.emigrate("agent")
+        worker_process.stop()